@@ -6,10 +6,11 @@
 """
 import uvicorn
 import os
-from src.main import create_application, app
+from src.main import get_app
 
-# 애플리케이션 생성
-application = create_application()
+# 애플리케이션 생성 (uvicorn main:app 용, 한 번만 생성)
+app = get_app()
+application = app
 
 # 애플리케이션 직접 실행 시 동작
 if __name__ == "__main__":
@@ -480,6 +480,39 @@ class BaseAPIClient:
             logger.info(f"{self.api_type}의 사용량 데이터가 초기화되었습니다.")
 
 
+# API 유형별 클라이언트 생성 함수 (하위 클래스 모듈이 이 모듈을 임포트하므로 생성 시점에 지연 임포트)
+def _new_openai_client(**kwargs) -> BaseAPIClient:
+    from src.api.openai_client import OpenAIClient
+    return OpenAIClient(**kwargs)
+
+def _new_claude_client(**kwargs) -> BaseAPIClient:
+    from src.api.anthropic_client import ClaudeClient
+    return ClaudeClient(**kwargs)
+
+def _new_ollama_client(**kwargs) -> BaseAPIClient:
+    from src.api.ollama_client import OllamaClient
+    return OllamaClient(**kwargs)
+
+def _new_stable_diffusion_client(**kwargs) -> BaseAPIClient:
+    from src.api.stable_diffusion_client import StableDiffusionClient
+    return StableDiffusionClient(**kwargs)
+
+# API 유형별 클라이언트 생성 함수 레지스트리
+_API_CLIENT_REGISTRY: Dict[str, Callable[..., BaseAPIClient]] = {
+    "openai": _new_openai_client,
+    "anthropic": _new_claude_client,
+    "ollama": _new_ollama_client,
+    "stable_diffusion": _new_stable_diffusion_client,
+}
+
+# API 유형별 생성자 인자: (설정 섹션, 설정 키, 생성자 인자 이름)
+_API_CLIENT_ARGS: Dict[str, Tuple[str, str, str]] = {
+    "openai": ("api_keys", "dalle", "api_key"),
+    "anthropic": ("api_keys", "claude", "api_key"),
+    "ollama": ("api", "local_ollama_url", "api_url"),
+    "stable_diffusion": ("api", "local_sd_url", "api_url"),
+}
+
 # API 클라이언트 팩토리
 def create_api_client(api_type: str, config: Dict[str, Any]) -> BaseAPIClient:
     """
@@ -496,30 +529,14 @@ def create_api_client(api_type: str, config: Dict[str, Any]) -> BaseAPIClient:
         # 캐싱 설정 추출
         use_cache = config.get("api", {}).get("use_cache", True)
         
-        # api_type에 따라 적절한 클라이언트 가져오기
-        if api_type == "openai":
-            from src.api.openai_client import OpenAIClient
-            api_key = config.get("api_keys", {}).get("dalle")
-            return OpenAIClient(api_key=api_key, use_cache=use_cache)
-            
-        elif api_type == "anthropic":
-            from src.api.anthropic_client import ClaudeClient
-            api_key = config.get("api_keys", {}).get("claude")
-            return ClaudeClient(api_key=api_key, use_cache=use_cache)
-            
-        elif api_type == "ollama":
-            from src.api.ollama_client import OllamaClient
-            api_url = config.get("api", {}).get("local_ollama_url")
-            return OllamaClient(api_url=api_url, use_cache=use_cache)
-            
-        elif api_type == "stable_diffusion":
-            from src.api.stable_diffusion_client import StableDiffusionClient
-            api_url = config.get("api", {}).get("local_sd_url")
-            return StableDiffusionClient(api_url=api_url, use_cache=use_cache)
-            
-        else:
+        # api_type에 따라 레지스트리에서 클라이언트 생성 함수 가져오기
+        factory = _API_CLIENT_REGISTRY.get(api_type)
+        if factory is None:
             logger.error(f"알 수 없는 API 유형: {api_type}")
             return BaseAPIClient(use_cache=use_cache)
+        
+        section, key, arg_name = _API_CLIENT_ARGS[api_type]
+        return factory(**{arg_name: config.get(section, {}).get(key)}, use_cache=use_cache)
             
     except ImportError as e:
         logger.error(f"API 클라이언트 모듈 로드 실패: {str(e)}")
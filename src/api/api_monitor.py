@@ -6,6 +6,7 @@ API 사용량 모니터링
 """
 import json
 import logging
+import math
 import time
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple, Union
@@ -120,129 +121,235 @@ class ApiMonitor:
         """
         async with self._lock:
             now = datetime.now()
-            hour_key = now.strftime("%Y-%m-%d-%H")
-            day_key = now.strftime("%Y-%m-%d")
-            month_key = now.strftime("%Y-%m")
+            last_call = {"endpoint": endpoint, "success": success, "duration": duration, "metadata": metadata} if metadata else None
+            self._apply_usage(
+                api_name,
+                endpoint,
+                now,
+                calls=1,
+                success_calls=1 if success else 0,
+                tokens=self._normalize_tokens(tokens),
+                cost=cost,
+                last_call=last_call
+            )
             
-            # API별 사용량 데이터가 없으면 초기화
-            if api_name not in self.usage_data:
-                self.usage_data[api_name] = ApiUsageData()
-                self.usage_data[api_name].api_type = api_name
-            
-            api_data = self.usage_data[api_name]
-            
-            # 시간별 사용량 업데이트
-            if hour_key not in api_data.hourly_usage:
-                api_data.hourly_usage[hour_key] = {
-                    "calls": 0, 
-                    "success": 0, 
-                    "errors": 0,
-                    "endpoints": {}
-                }
-            
-            api_data.hourly_usage[hour_key]["calls"] += 1
-            if success:
-                api_data.hourly_usage[hour_key]["success"] += 1
-            else:
-                api_data.hourly_usage[hour_key]["errors"] += 1
-            
-            # 엔드포인트별 사용량
-            if endpoint not in api_data.hourly_usage[hour_key]["endpoints"]:
-                api_data.hourly_usage[hour_key]["endpoints"][endpoint] = {
-                    "calls": 0, 
-                    "success": 0, 
-                    "errors": 0
-                }
-            
-            api_data.hourly_usage[hour_key]["endpoints"][endpoint]["calls"] += 1
-            if success:
-                api_data.hourly_usage[hour_key]["endpoints"][endpoint]["success"] += 1
-            else:
-                api_data.hourly_usage[hour_key]["endpoints"][endpoint]["errors"] += 1
-            
-            # 일별 사용량 업데이트
-            if day_key not in api_data.daily_usage:
-                api_data.daily_usage[day_key] = {
-                    "calls": 0, 
-                    "success": 0, 
-                    "errors": 0, 
-                    "cost": 0.0
-                }
-            
-            api_data.daily_usage[day_key]["calls"] += 1
-            if success:
-                api_data.daily_usage[day_key]["success"] += 1
-            else:
-                api_data.daily_usage[day_key]["errors"] += 1
-            
-            # 월별 사용량 업데이트
-            if month_key not in api_data.monthly_usage:
-                api_data.monthly_usage[month_key] = {
-                    "calls": 0, 
-                    "success": 0, 
-                    "errors": 0, 
-                    "cost": 0.0, 
-                    "tokens": {"prompt": 0, "completion": 0, "total": 0}
-                }
-            
-            api_data.monthly_usage[month_key]["calls"] += 1
+            # 자동 저장 처리
+            if self.auto_save and (time.time() - self._last_save_time) > self.save_interval:
+                await self.save_data()
+    
+    async def record_api_calls(self, events: List[Dict[str, Any]]) -> None:
+        """
+        여러 API 호출을 한 번에 기록
+        
+        호출을 (API 이름, 엔드포인트)별로 먼저 집계한 뒤 락을 한 번만 잡고 묶음 단위로 반영합니다.
+        모든 호출은 같은 시각(현재 시각)의 시간/일/월 구간에 기록됩니다.
+        
+        Args:
+            events (List[Dict[str, Any]]): record_api_call의 인자와 같은 키를 가진 호출 정보 목록
+                (api_name, endpoint, success 필수 / tokens, cost, duration, metadata 선택)
+        """
+        if not events:
+            return
+        
+        # (API 이름, 엔드포인트)별 집계
+        aggregated = {}
+        # API별 마지막 메타데이터 호출 (단건 기록과 같이 마지막 호출만 유지)
+        last_calls = {}
+        for event in events:
+            api_name = event["api_name"]
+            endpoint = event["endpoint"]
+            success = event["success"]
+            
+            group = aggregated.get((api_name, endpoint))
+            if group is None:
+                group = aggregated[(api_name, endpoint)] = {"calls": 0, "success_calls": 0, "costs": [], "tokens": {}}
+            
+            group["calls"] += 1
             if success:
-                api_data.monthly_usage[month_key]["success"] += 1
-            else:
-                api_data.monthly_usage[month_key]["errors"] += 1
-            
-            # 토큰 정보 업데이트
-            if tokens:
-                if "prompt" in tokens:
-                    api_data.total_tokens["prompt"] += tokens["prompt"]
-                    api_data.monthly_usage[month_key]["tokens"]["prompt"] += tokens["prompt"]
-                
-                if "completion" in tokens:
-                    api_data.total_tokens["completion"] += tokens["completion"]
-                    api_data.monthly_usage[month_key]["tokens"]["completion"] += tokens["completion"]
-                
-                if "total" in tokens:
-                    api_data.total_tokens["total"] += tokens["total"]
-                    api_data.monthly_usage[month_key]["tokens"]["total"] += tokens["total"]
-                elif "prompt" in tokens and "completion" in tokens:
-                    total = tokens["prompt"] + tokens["completion"]
-                    api_data.total_tokens["total"] += total
-                    api_data.monthly_usage[month_key]["tokens"]["total"] += total
+                group["success_calls"] += 1
             
-            # 비용 업데이트
+            cost = event.get("cost")
             if cost:
-                api_data.costs["total_cost"] += cost
-                api_data.daily_usage[day_key]["cost"] += cost
-                api_data.monthly_usage[month_key]["cost"] += cost
+                group["costs"].append(cost)
             
-            # 총 호출 카운트 업데이트
-            api_data.total_calls += 1
-            if success:
-                api_data.success_count += 1
-            else:
-                api_data.error_count += 1
-            
-            # 마지막 업데이트 시간
-            api_data.last_updated = now.isoformat()
+            tokens = self._normalize_tokens(event.get("tokens"))
+            for token_type, count in tokens.items():
+                group["tokens"][token_type] = group["tokens"].get(token_type, 0) + count
             
-            # 메타데이터 저장 (선택 사항)
+            metadata = event.get("metadata")
             if metadata:
-                # 메타데이터를 저장할 구조가 없다면 생성
-                if not hasattr(api_data, "metadata"):
-                    api_data.metadata = {}
-                
-                # 최근 호출 메타데이터 업데이트
-                api_data.metadata["last_call"] = {
-                    "time": now.isoformat(),
+                last_calls[api_name] = {
                     "endpoint": endpoint,
                     "success": success,
-                    "duration": duration,
-                    **metadata
+                    "duration": event.get("duration"),
+                    "metadata": metadata
                 }
+        
+        async with self._lock:
+            now = datetime.now()
+            for (api_name, endpoint), group in aggregated.items():
+                self._apply_usage(
+                    api_name,
+                    endpoint,
+                    now,
+                    calls=group["calls"],
+                    success_calls=group["success_calls"],
+                    tokens=group["tokens"],
+                    # 부동소수점 누적 오차를 줄이기 위해 fsum으로 합산
+                    cost=math.fsum(group["costs"]),
+                    last_call=last_calls.pop(api_name, None)
+                )
+        
+        # 자동 저장 처리 (save_data가 락을 잡으므로 락 밖에서 호출)
+        if self.auto_save and (time.time() - self._last_save_time) > self.save_interval:
+            await self.save_data()
+    
+    @staticmethod
+    def _normalize_tokens(tokens: Optional[Dict[str, int]]) -> Dict[str, int]:
+        """
+        토큰 정보를 기록할 항목으로 정리
+        
+        total이 없고 prompt와 completion이 모두 있으면 합계를 total로 사용합니다.
+        
+        Args:
+            tokens (Optional[Dict[str, int]]): 사용된 토큰 정보
             
-            # 자동 저장 처리
-            if self.auto_save and (time.time() - self._last_save_time) > self.save_interval:
-                await self.save_data()
+        Returns:
+            Dict[str, int]: 기록할 토큰 유형별 수
+        """
+        if not tokens:
+            return {}
+        
+        normalized = {token_type: tokens[token_type] for token_type in ("prompt", "completion", "total") if token_type in tokens}
+        if "total" not in tokens and "prompt" in tokens and "completion" in tokens:
+            normalized["total"] = tokens["prompt"] + tokens["completion"]
+        return normalized
+    
+    def _apply_usage(
+        self,
+        api_name: str,
+        endpoint: str,
+        now: datetime,
+        calls: int,
+        success_calls: int,
+        tokens: Dict[str, int],
+        cost: Optional[float],
+        last_call: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        집계된 호출 수/토큰/비용을 사용량 데이터에 반영 (락을 잡은 상태에서 호출)
+        
+        Args:
+            api_name (str): API 이름
+            endpoint (str): 호출된 엔드포인트
+            now (datetime): 기록 시각
+            calls (int): 호출 수
+            success_calls (int): 성공한 호출 수
+            tokens (Dict[str, int]): 토큰 유형별 사용량
+            cost (Optional[float]): 호출 비용 합계
+            last_call (Optional[Dict[str, Any]]): 메타데이터가 있는 마지막 호출 정보
+        """
+        error_calls = calls - success_calls
+        hour_key = now.strftime("%Y-%m-%d-%H")
+        day_key = now.strftime("%Y-%m-%d")
+        month_key = now.strftime("%Y-%m")
+        
+        # API별 사용량 데이터가 없으면 초기화
+        if api_name not in self.usage_data:
+            self.usage_data[api_name] = ApiUsageData()
+            self.usage_data[api_name].api_type = api_name
+        
+        api_data = self.usage_data[api_name]
+        
+        # 시간별 사용량 업데이트
+        hourly = api_data.hourly_usage.get(hour_key)
+        if hourly is None:
+            hourly = api_data.hourly_usage[hour_key] = {
+                "calls": 0, 
+                "success": 0, 
+                "errors": 0,
+                "endpoints": {}
+            }
+        
+        hourly["calls"] += calls
+        hourly["success"] += success_calls
+        hourly["errors"] += error_calls
+        
+        # 엔드포인트별 사용량
+        endpoint_usage = hourly["endpoints"].get(endpoint)
+        if endpoint_usage is None:
+            endpoint_usage = hourly["endpoints"][endpoint] = {
+                "calls": 0, 
+                "success": 0, 
+                "errors": 0
+            }
+        
+        endpoint_usage["calls"] += calls
+        endpoint_usage["success"] += success_calls
+        endpoint_usage["errors"] += error_calls
+        
+        # 일별 사용량 업데이트
+        daily = api_data.daily_usage.get(day_key)
+        if daily is None:
+            daily = api_data.daily_usage[day_key] = {
+                "calls": 0, 
+                "success": 0, 
+                "errors": 0, 
+                "cost": 0.0
+            }
+        
+        daily["calls"] += calls
+        daily["success"] += success_calls
+        daily["errors"] += error_calls
+        
+        # 월별 사용량 업데이트
+        monthly = api_data.monthly_usage.get(month_key)
+        if monthly is None:
+            monthly = api_data.monthly_usage[month_key] = {
+                "calls": 0, 
+                "success": 0, 
+                "errors": 0, 
+                "cost": 0.0, 
+                "tokens": {"prompt": 0, "completion": 0, "total": 0}
+            }
+        
+        monthly["calls"] += calls
+        monthly["success"] += success_calls
+        monthly["errors"] += error_calls
+        
+        # 토큰 정보 업데이트
+        for token_type, count in tokens.items():
+            api_data.total_tokens[token_type] += count
+            monthly["tokens"][token_type] += count
+        
+        # 비용 업데이트
+        if cost:
+            api_data.costs["total_cost"] += cost
+            daily["cost"] += cost
+            monthly["cost"] += cost
+        
+        # 총 호출 카운트 업데이트
+        api_data.total_calls += calls
+        api_data.success_count += success_calls
+        api_data.error_count += error_calls
+        
+        # 마지막 업데이트 시간
+        api_data.last_updated = now.isoformat()
+        
+        # 메타데이터 저장 (선택 사항)
+        if last_call:
+            # 메타데이터를 저장할 구조가 없다면 생성
+            if not hasattr(api_data, "metadata"):
+                api_data.metadata = {}
+            
+            # 최근 호출 메타데이터 업데이트
+            api_data.metadata["last_call"] = {
+                "time": now.isoformat(),
+                "endpoint": last_call["endpoint"],
+                "success": last_call["success"],
+                "duration": last_call["duration"],
+                **last_call["metadata"]
+            }
     
     async def check_limits(self, api_name: str) -> Tuple[bool, Optional[str]]:
         """
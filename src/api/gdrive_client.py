@@ -14,6 +14,7 @@ import logging
 from typing import Optional, Dict, Any, List, Union, Tuple
 from pathlib import Path
 import json
+import time
 from datetime import datetime, timedelta
 
 from google.oauth2.credentials import Credentials
@@ -26,6 +27,15 @@ from googleapiclient.errors import HttpError
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 이 크기를 넘는 파일은 청크 단위 재개 가능 업로드 사용 (5MB)
+RESUMABLE_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+
+# 재개 가능 업로드의 기본 청크 크기 (8MB, 256KB의 배수여야 함)
+DEFAULT_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# 청크 업로드 실패 시 최대 재시도 횟수
+MAX_CHUNK_RETRIES = 5
+
 class GoogleDriveClient:
     """구글 드라이브 API 클라이언트 클래스"""
     
@@ -125,7 +135,9 @@ class GoogleDriveClient:
                    file_path: Union[str, Path], 
                    mime_type: Optional[str] = None,
                    folder_id: Optional[str] = None,
-                   name: Optional[str] = None) -> Optional[str]:
+                   name: Optional[str] = None,
+                   chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+                   resumable: bool = True) -> Optional[str]:
         """
         파일을 구글 드라이브에 업로드
         
@@ -134,6 +146,8 @@ class GoogleDriveClient:
             mime_type (Optional[str]): 파일의 MIME 타입 (None이면 자동 감지)
             folder_id (Optional[str]): 파일을 업로드할 폴더 ID (None이면 루트)
             name (Optional[str]): 업로드 후 파일 이름 (None이면 원본 파일 이름 사용)
+            chunk_size (int): 재개 가능 업로드의 청크 크기 (바이트)
+            resumable (bool): 큰 파일에 청크 단위 재개 가능 업로드 사용 여부
             
         Returns:
             Optional[str]: 업로드된 파일의 ID 또는 실패 시 None
@@ -163,15 +177,26 @@ class GoogleDriveClient:
             if folder_id:
                 file_metadata['parents'] = [folder_id]
             
+            # 큰 파일만 청크 단위 재개 가능 업로드 사용 (작은 파일은 한 번에 전송)
+            use_chunks = resumable and file_path.stat().st_size > RESUMABLE_UPLOAD_THRESHOLD
+            
             # 미디어 업로드 객체 생성
-            media = MediaFileUpload(str(file_path), mimetype=mime_type, resumable=True)
+            if use_chunks:
+                media = MediaFileUpload(str(file_path), mimetype=mime_type, chunksize=chunk_size, resumable=True)
+            else:
+                media = MediaFileUpload(str(file_path), mimetype=mime_type, resumable=False)
             
             # 파일 업로드
-            file = self.service.files().create(
+            upload_request = self.service.files().create(
                 body=file_metadata,
                 media_body=media,
                 fields='id'
-            ).execute()
+            )
+            
+            if use_chunks:
+                file = self._upload_in_chunks(upload_request)
+            else:
+                file = upload_request.execute()
             
             file_id = file.get('id')
             logger.info(f"파일이 성공적으로 업로드되었습니다. ID: {file_id}")
@@ -184,6 +209,39 @@ class GoogleDriveClient:
             logger.error(f"파일 업로드 중 오류 발생: {str(e)}")
             return None
     
+    def _upload_in_chunks(self, upload_request) -> Dict[str, Any]:
+        """
+        재개 가능 업로드 요청을 청크 단위로 전송 (5xx 오류 시 지수 백오프로 재시도)
+        
+        Args:
+            upload_request: files().create()로 생성한 업로드 요청
+            
+        Returns:
+            Dict[str, Any]: 업로드 완료 응답
+            
+        Raises:
+            HttpError: 재시도할 수 없는 오류 또는 재시도 횟수 초과 시
+        """
+        response = None
+        retries = 0
+        
+        while response is None:
+            try:
+                status, response = upload_request.next_chunk()
+                retries = 0
+                if status:
+                    logger.info(f"업로드 진행률: {int(status.progress() * 100)}%")
+            except HttpError as e:
+                # 서버 오류만 재시도 (업로드는 마지막으로 전송된 위치부터 재개됨)
+                if e.resp.status < 500 or retries >= MAX_CHUNK_RETRIES:
+                    raise
+                retries += 1
+                wait_time = 2 ** retries
+                logger.warning(f"청크 업로드 실패 ({e.resp.status}), {wait_time}초 후 재시도 ({retries}/{MAX_CHUNK_RETRIES})")
+                time.sleep(wait_time)
+        
+        return response
+    
     def create_folder(self, 
                      folder_name: str, 
                      parent_folder_id: Optional[str] = None) -> Optional[str]:
@@ -381,7 +439,9 @@ class GoogleDriveClient:
     def export_to_google_drive(self, 
                              file_path: Union[str, Path],
                              folder_name: Optional[str] = None,
-                             make_public: bool = True) -> Tuple[bool, Optional[str], Optional[str]]:
+                             make_public: bool = True,
+                             chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+                             resumable: bool = True) -> Tuple[bool, Optional[str], Optional[str]]:
         """
         파일을 구글 드라이브로 내보내기
         
@@ -389,6 +449,8 @@ class GoogleDriveClient:
             file_path (Union[str, Path]): 내보낼 파일 경로
             folder_name (Optional[str]): 파일을 저장할 폴더 이름 (None이면 현재 날짜 사용)
             make_public (bool): 파일을 공개 액세스로 설정할지 여부
+            chunk_size (int): 재개 가능 업로드의 청크 크기 (바이트)
+            resumable (bool): 큰 파일에 청크 단위 재개 가능 업로드 사용 여부
             
         Returns:
             Tuple[bool, Optional[str], Optional[str]]: (성공 여부, 파일 ID, 파일 URL)
@@ -409,7 +471,7 @@ class GoogleDriveClient:
                 return False, None, None
             
             # 파일 업로드
-            file_id = self.upload_file(file_path, folder_id=folder_id)
+            file_id = self.upload_file(file_path, folder_id=folder_id, chunk_size=chunk_size, resumable=resumable)
             if not file_id:
                 logger.error("파일 업로드 실패")
                 return False, None, None
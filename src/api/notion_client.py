@@ -6,7 +6,9 @@
 import os
 import logging
 import json
-from typing import Dict, Any, List, Optional, Union
+import time
+import threading
+from typing import Dict, Any, List, Optional, Union, Callable
 from datetime import datetime
 
 # 필요한 경우 실제 노션 API 클라이언트 임포트
@@ -15,6 +17,48 @@ from datetime import datetime
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 노션 API 한 번의 요청으로 추가할 수 있는 최대 블록 수
+NOTION_MAX_BLOCKS_PER_REQUEST = 100
+
+# 노션 API 요청 재시도 설정 (429 / 5xx 게이트웨이 오류)
+NOTION_RETRY_STATUSES = (429, 502, 503, 504)
+NOTION_MAX_RETRIES = 5
+
+
+class NotionRateLimiter:
+    """노션 API 요청 속도 제한기 (토큰 버킷 방식)"""
+    
+    def __init__(self, rate: float = 2.0, per: float = 1.0):
+        """
+        요청 속도 제한기 초기화
+        
+        Args:
+            rate (float): 기간당 허용 요청 수
+            per (float): 기간 (초)
+        """
+        self.rate = rate
+        self.per = per
+        self._tokens = rate
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """요청 토큰을 하나 얻을 때까지 대기"""
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                elapsed = now - self._last_refill
+                self._last_refill = now
+                self._tokens = min(self.rate, self._tokens + elapsed * (self.rate / self.per))
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                # 토큰 하나가 채워질 때까지 대기
+                time.sleep((1 - self._tokens) * (self.per / self.rate))
+
+
 class NotionClient:
     """노션 API 클라이언트 클래스"""
     
@@ -32,6 +76,55 @@ class NotionClient:
         # 실제 구현에서는 노션 클라이언트 초기화
         # self.client = Client(auth=self.api_key)
         self.client = None  # 테스트용 더미 클라이언트
+        
+        # 노션 공개 API 제한(약 3회/초)보다 낮게 요청 속도 제한
+        self.rate_limiter = NotionRateLimiter(rate=2.0, per=1.0)
+    
+    def _call_api(self, func: Callable[..., Any], **kwargs) -> Any:
+        """
+        속도 제한과 재시도를 적용하여 노션 API 호출
+        
+        Args:
+            func (Callable[..., Any]): 호출할 노션 클라이언트 메서드
+            **kwargs: API 호출 인자
+            
+        Returns:
+            Any: API 응답
+        """
+        for attempt in range(NOTION_MAX_RETRIES + 1):
+            self.rate_limiter.acquire()
+            try:
+                return func(**kwargs)
+            except Exception as e:
+                status = getattr(e, "status", None)
+                if status not in NOTION_RETRY_STATUSES or attempt >= NOTION_MAX_RETRIES:
+                    raise
+                
+                # Retry-After 헤더가 있으면 우선 사용, 없으면 지수 백오프
+                headers = getattr(e, "headers", None) or {}
+                retry_after = headers.get("Retry-After") if hasattr(headers, "get") else None
+                try:
+                    wait_time = float(retry_after) if retry_after else 2 ** attempt
+                except ValueError:
+                    wait_time = 2 ** attempt
+                
+                logger.warning(f"노션 API 오류 ({status}), {wait_time}초 후 재시도 ({attempt + 1}/{NOTION_MAX_RETRIES})")
+                time.sleep(wait_time)
+    
+    def _append_blocks(self, block_id: str, blocks: List[Dict[str, Any]]) -> None:
+        """
+        블록을 최대 요청 크기 단위로 묶어서 추가
+        
+        Args:
+            block_id (str): 블록을 추가할 페이지/블록 ID
+            blocks (List[Dict[str, Any]]): 추가할 블록 목록
+        """
+        for start in range(0, len(blocks), NOTION_MAX_BLOCKS_PER_REQUEST):
+            self._call_api(
+                self.client.blocks.children.append,
+                block_id=block_id,
+                children=blocks[start:start + NOTION_MAX_BLOCKS_PER_REQUEST]
+            )
     
     def export_website_analysis(self, content: Dict[str, Any], parent_id: str, page_title: Optional[str] = None) -> str:
         """
@@ -62,12 +155,9 @@ class NotionClient:
                 logger.info(f"테스트 모드: 노션 페이지 ID 생성: {mock_page_id}")
                 return mock_page_id
             
-            # 실제 구현: 노션 페이지 생성
-            # page = self._create_notion_page(content, parent_id, page_title, website_url)
-            # return page["id"]
-            
-            # 테스트용 더미 구현
-            return f"mock-page-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            # 노션 페이지 생성
+            page = self._create_notion_page(content, parent_id, page_title, website_url)
+            return page["id"]
             
         except Exception as e:
             logger.error(f"노션으로 내보내기 실패: {str(e)}")
@@ -114,14 +204,19 @@ class NotionClient:
             "page_id": parent_id
         }
         
-        # 페이지 생성 요청 (더미 구현)
-        # 실제 구현:
-        # page = self.client.pages.create(
-        #     parent=parent,
-        #     properties=page_properties,
-        #     children=self._generate_page_blocks(content)
-        # )
-        # return page
+        # 클라이언트가 있으면 실제 API 호출
+        if self.client:
+            blocks = self._generate_page_blocks(content)
+            
+            # 페이지 생성 시 첫 묶음을 함께 전송하고, 나머지는 100개 단위로 추가
+            page = self._call_api(
+                self.client.pages.create,
+                parent=parent,
+                properties=page_properties,
+                children=blocks[:NOTION_MAX_BLOCKS_PER_REQUEST]
+            )
+            self._append_blocks(page["id"], blocks[NOTION_MAX_BLOCKS_PER_REQUEST:])
+            return page
         
         # 테스트용 더미 반환
         return {
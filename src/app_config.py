@@ -143,6 +143,8 @@ def init_app():
     
     # 템플릿 엔진 설정 - 전역 변수 templates에 할당하고 app.state에도 저장
     templates = Jinja2Templates(directory=templates_dir)
+    # 운영 환경에서는 컴파일된 템플릿을 캐시에서 바로 사용 (요청마다 파일 변경 여부 확인 생략)
+    templates.env.auto_reload = os.getenv("DEBUG", "False").lower() == "true"
     app.state.templates = templates  # app.state에도 저장하여 어디서든 접근 가능하게 함
     app.templates = templates
     
@@ -200,8 +202,11 @@ def init_app_config():
 def add_global_exception_handler(app):
     @app.exception_handler(Exception)
     async def global_exception_handler(request: Request, exc: Exception):
+        # 라우트별 try/except 없이 처리되지 않은 오류를 한 곳에서 기록하고 응답
+        logger.exception(f"요청 처리 중 오류 발생: {request.url.path}")
         log_bug(exc, {"url": str(request.url)})
+        message = "서버 내부 오류가 발생했습니다. 관리자에게 문의하세요."
         return JSONResponse(
             status_code=500,
-            content={"detail": "서버 내부 오류가 발생했습니다. 관리자에게 문의하세요."}
+            content={"status": "error", "message": message, "detail": message}
         ) 
\ No newline at end of file
@@ -4,30 +4,247 @@
 이 모듈은 클론 기획서를 다양한 형식(Markdown, PPT, ZIP 등)으로 내보내는 기능을 제공합니다.
 """
 import os
-import shutil
 import logging
 import zipfile
+import tarfile
 import json
+import orjson
 import markdown
 import pptx
 from pptx import Presentation
 from pptx.util import Inches, Pt
+from pptx.oxml.ns import qn
+from lxml import etree
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union, Tuple
+from typing import Dict, Any, List, Optional, Union, Tuple, Iterator
 import tempfile
+import io
 import re
+import copy
+import time
+import threading
+import functools
+from collections import OrderedDict
+from datetime import datetime, timezone
+from html import escape
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse, urljoin
-from weasyprint import HTML  # PDF 변환을 위한 라이브러리 추가
+from weasyprint import HTML, CSS  # PDF 변환을 위한 라이브러리 추가
+from weasyprint.text.fonts import FontConfiguration
+
+# 선택 의존성: tar.zst 아카이브 스트리밍
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+TAR_ZST_AVAILABLE = zstandard is not None
 
 # 내부 모듈 임포트
 from src.api.notion_client import NotionClient
-from src.api.gdrive_client import GoogleDriveClient  # 구글 드라이브 클라이언트 임포트
+from src.api.gdrive_client import GoogleDriveClient, DEFAULT_UPLOAD_CHUNK_SIZE  # 구글 드라이브 클라이언트 임포트
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 웹사이트 구조 분석 시 읽어들일 최대 응답 크기 (2MB)
+MAX_STRUCTURE_BYTES = 2 * 1024 * 1024
+
+# 여러 URL 구조 분석 시 동시 요청 수
+MAX_STRUCTURE_WORKERS = 8
+
+# 웹사이트 구조 분석 결과 캐시 최대 항목 수 (ExportManager 인스턴스별, LRU)
+MAX_STRUCTURE_CACHE_SIZE = 64
+
+# 압축 없이 바로 반환할 수 있는 로컬 파일 형식 (단일 형식 ZIP 요청 시)
+LOCAL_FILE_FORMATS = {'md', 'html', 'pdf', 'pptx', 'json'}
+
+# 웹사이트 구조 분석 결과 캐시 유효 시간 (초)
+STRUCTURE_CACHE_TTL = 300
+
+# PDF 이미지 캐시 최대 항목 수 (초과하면 다음 렌더링 전에 새 캐시로 교체)
+MAX_PDF_IMAGE_CACHE_SIZE = 256
+
+# 파싱된 사용자 PDF 스타일시트 캐시 최대 항목 수 (스레드별)
+MAX_PDF_CSS_CACHE_SIZE = 32
+
+# PPTX 텍스트에 그대로 쓸 수 없는 제어 문자 (python-pptx와 같이 _xHHHH_ 형태로 변환)
+_PPTX_CTRL_CHARS = re.compile(r"[\x00-\x08\x0B-\x1F]")
+
+# 노션 페이지 URL 생성 시 페이지 ID에서 하이픈 제거용 변환 테이블
+_STRIP_HYPHEN = str.maketrans('', '', '-')
+
+# 웹사이트 구조 분석 요청에 사용할 User-Agent
+STRUCTURE_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# HTML 내보내기 기본 스타일
+_DEFAULT_CSS = """
+                    body {
+                        font-family: 'Noto Sans KR', Arial, sans-serif;
+                        line-height: 1.6;
+                        max-width: 900px;
+                        margin: 0 auto;
+                        padding: 20px;
+                        color: #333;
+                    }
+                    h1, h2, h3, h4, h5, h6 {
+                        margin-top: 1.5em;
+                        margin-bottom: 0.5em;
+                        color: #1a1a1a;
+                    }
+                    h1 { font-size: 2.2em; border-bottom: 1px solid #eee; padding-bottom: 0.3em; }
+                    h2 { font-size: 1.8em; border-bottom: 1px solid #eee; padding-bottom: 0.3em; }
+                    h3 { font-size: 1.5em; }
+                    h4 { font-size: 1.3em; }
+                    table { border-collapse: collapse; width: 100%; margin: 1em 0; }
+                    th, td { border: 1px solid #ddd; padding: 8px 12px; text-align: left; }
+                    th { background-color: #f2f2f2; }
+                    img { max-width: 100%; height: auto; }
+                    code { background-color: #f5f5f5; padding: 2px 4px; border-radius: 3px; }
+                    pre { background-color: #f5f5f5; padding: 1em; overflow-x: auto; border-radius: 3px; }
+                    blockquote { background-color: #f9f9f9; border-left: 4px solid #ccc; margin: 1em 0; padding: 0.5em 1em; }
+"""
+
+# HTML 내보내기 문서 골격 (title, style, body 채워 사용)
+_HTML_DOCUMENT_TEMPLATE = """<!DOCTYPE html>
+                <html>
+                <head>
+                    <meta charset="UTF-8">
+                    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+                    <title>{title}</title>
+                    <style>
+                    {style}
+                    </style>
+                </head>
+                <body>
+                    {body}
+                </body>
+                </html>
+                """
+
+# tar.zst 아카이브 압축 수준
+ZSTD_LEVEL = 3
+
+# ZIP 아카이브에서 다시 압축하지 않을 (이미 압축된) 파일 확장자
+_PRECOMPRESSED_SUFFIXES = frozenset({'.pdf', '.pptx', '.png', '.jpg', '.jpeg', '.gif', '.webp', '.zip'})
+
+# 마크다운 템플릿 변수 패턴 ({{key}} 또는 {{key.nested_key}})
+_PLACEHOLDER_RE = re.compile(r'\{\{([^{}]+)\}\}')
+
+# 내비게이션 요소로 판단할 클래스 이름 패턴
+_NAV_CLASS_RE = re.compile(r'(?:nav|menu)', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_css_cached(css_path: str, mtime: float) -> str:
+    """수정 시각을 키에 포함하여 CSS 파일 내용을 캐시 (파일이 바뀌면 다시 읽음)"""
+    with open(css_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _read_css(css_path: str) -> str:
+    """
+    CSS 스타일시트 파일 읽기 (같은 파일을 반복 사용할 때 디스크 읽기 생략)
+    
+    Args:
+        css_path (str): CSS 파일 경로
+        
+    Returns:
+        str: CSS 내용
+    """
+    return _read_css_cached(str(css_path), os.path.getmtime(css_path))
+
+
+@functools.lru_cache(maxsize=1)
+def _blank_pptx_bytes() -> bytes:
+    """
+    빈 기본 프레젠테이션을 한 번만 생성하여 바이트로 보관
+    
+    Returns:
+        bytes: 빈 PPTX 파일 바이트
+    """
+    buffer = io.BytesIO()
+    Presentation().save(buffer)
+    return buffer.getvalue()
+
+
+@functools.lru_cache(maxsize=1)
+def _default_pdf_stylesheet() -> CSS:
+    """기본 스타일을 한 번만 파싱하여 보관"""
+    return CSS(string=_DEFAULT_CSS)
+
+
+def _get_pdf_stylesheets(css: Optional[str], font_config: FontConfiguration,
+                         css_cache: Optional[Dict[Tuple[str, float], CSS]] = None) -> List[CSS]:
+    """
+    PDF 변환에 사용할 파싱된 스타일시트 목록 반환
+    
+    사용자 CSS의 @font-face가 등록되도록 write_pdf에 전달할 폰트 설정으로 파싱합니다.
+    
+    Args:
+        css (Optional[str]): CSS 스타일시트 경로 (없으면 기본 스타일)
+        font_config (FontConfiguration): write_pdf에 함께 전달할 폰트 설정
+        css_cache (Optional[Dict[Tuple[str, float], CSS]]): (경로, 수정 시각)별 파싱 결과 캐시
+            (font_config와 같은 범위에서만 재사용)
+        
+    Returns:
+        List[CSS]: write_pdf의 stylesheets 인자로 전달할 스타일시트 목록
+    """
+    if not (css and os.path.exists(css)):
+        return [_default_pdf_stylesheet()]
+    
+    css_path = os.path.abspath(css)
+    if css_cache is None:
+        return [CSS(filename=css_path, font_config=font_config)]
+    
+    cache_key = (css_path, os.path.getmtime(css_path))
+    stylesheet = css_cache.get(cache_key)
+    if stylesheet is None:
+        if len(css_cache) >= MAX_PDF_CSS_CACHE_SIZE:
+            css_cache.clear()
+        stylesheet = css_cache[cache_key] = CSS(filename=css_path, font_config=font_config)
+    return [stylesheet]
+
+
+class _ZipStreamSink(io.RawIOBase):
+    """ZipFile이 기록한 바이트를 모아 두었다가 꺼내 주는 쓰기 전용 스트림 (탐색 불가)"""
+    
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+    
+    def drain(self) -> bytes:
+        """지금까지 기록된 바이트를 꺼내고 버퍼 비우기"""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _dump_json_bytes(data: Any, indent: Optional[int] = 2) -> bytes:
+    """
+    데이터를 UTF-8 JSON 바이트로 직렬화 (orjson은 2칸 들여쓰기만 지원하므로 그 외에는 표준 json 사용)
+    
+    Args:
+        data (Any): 직렬화할 데이터
+        indent (Optional[int]): JSON 들여쓰기 수준
+        
+    Returns:
+        bytes: 직렬화된 JSON
+    """
+    if indent == 2:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=indent).encode("utf-8")
+
 class ExportManager:
     """다양한 형식으로 내보내기를 관리하는 클래스"""
     
@@ -52,12 +269,121 @@ class ExportManager:
         
         # 지원하는 내보내기 형식
         self.supported_formats = ['md', 'html', 'pptx', 'zip', 'json', 'ai_meta', 'pdf', 'notion', 'gdrive']  # gdrive 추가
+        
+        # 웹사이트 구조 분석용 HTTP 세션 (연결 재사용 및 재시도)
+        self._http = self._create_http_session()
+        
+        # PDF 렌더링용 폰트 설정과 이미지 캐시 (형식별 내보내기가 병렬 실행되므로 스레드별로 보관)
+        self._pdf_local = threading.local()
+        
+        # 웹사이트 구조 분석 결과 캐시 ((url, max_depth) -> (저장 시각, 결과))
+        self._structure_cache: "OrderedDict[Tuple[str, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._structure_cache_lock = threading.Lock()
+        
+        # 외부 서비스 클라이언트 캐시 (호출마다 인증 정보/토큰을 다시 읽지 않도록)
+        self._notion_clients: Dict[str, NotionClient] = {}
+        self._gdrive_clients: Dict[Tuple[Optional[str], Optional[str]], GoogleDriveClient] = {}
+    
+    def close(self) -> None:
+        """HTTP 세션 및 외부 서비스 클라이언트 캐시 정리 (애플리케이션 종료 시 호출)"""
+        if hasattr(self, '_http'):
+            self._http.close()
+        if hasattr(self, '_notion_clients'):
+            self._notion_clients.clear()
+        if hasattr(self, '_gdrive_clients'):
+            self._gdrive_clients.clear()
+        if hasattr(self, '_structure_cache'):
+            with self._structure_cache_lock:
+                self._structure_cache.clear()
     
     def __del__(self):
-        """임시 디렉토리 정리"""
+        """임시 디렉토리 및 HTTP 세션 정리"""
+        self.close()
         if hasattr(self, 'temp_dir'):
             self.temp_dir.cleanup()
     
+    def _get_pdf_render_options(self, css: Optional[str] = None) -> Dict[str, Any]:
+        """
+        현재 스레드에서 재사용할 WeasyPrint write_pdf 렌더링 옵션 반환
+        
+        이미지 캐시는 렌더링 도중 항목을 다시 읽으므로 항목을 하나씩 제거하지 않고,
+        최대 크기를 넘으면 다음 렌더링 전에 새 캐시로 교체합니다.
+        사용자 스타일시트는 같은 스레드의 폰트 설정으로 파싱한 결과를 재사용합니다.
+        
+        Args:
+            css (Optional[str]): CSS 스타일시트 경로 (없으면 기본 스타일)
+        
+        Returns:
+            Dict[str, Any]: font_config, cache, stylesheets 옵션
+        """
+        local = self._pdf_local
+        if getattr(local, "font_config", None) is None:
+            local.font_config = FontConfiguration()
+            local.css_cache = {}
+        
+        image_cache = getattr(local, "image_cache", None)
+        if image_cache is None or len(image_cache) > MAX_PDF_IMAGE_CACHE_SIZE:
+            local.image_cache = image_cache = {}
+        
+        return {
+            "font_config": local.font_config,
+            "cache": image_cache,
+            "stylesheets": _get_pdf_stylesheets(css, local.font_config, local.css_cache)
+        }
+    
+    def _get_notion_client(self, api_key: Optional[str] = None) -> NotionClient:
+        """
+        API 키별로 캐시된 노션 클라이언트 반환
+        
+        Args:
+            api_key (Optional[str]): 노션 API 키 (None이면 환경 변수 사용)
+            
+        Returns:
+            NotionClient: 노션 클라이언트
+        """
+        cache_key = api_key or 'env'
+        client = self._notion_clients.get(cache_key)
+        if client is None:
+            client = self._notion_clients[cache_key] = NotionClient(api_key)
+        return client
+    
+    def _get_gdrive_client(self, credentials_file: Optional[str] = None,
+                           token_file: Optional[str] = None) -> GoogleDriveClient:
+        """
+        인증 파일 조합별로 캐시된 구글 드라이브 클라이언트 반환 (인증 상태 재사용)
+        
+        Args:
+            credentials_file (Optional[str]): 구글 OAuth 인증 정보 파일 경로
+            token_file (Optional[str]): 인증 토큰 저장 파일 경로
+            
+        Returns:
+            GoogleDriveClient: 구글 드라이브 클라이언트
+        """
+        cache_key = (credentials_file, token_file)
+        client = self._gdrive_clients.get(cache_key)
+        if client is None:
+            client = self._gdrive_clients[cache_key] = GoogleDriveClient(credentials_file, token_file)
+        return client
+    
+    @staticmethod
+    def _create_http_session() -> requests.Session:
+        """
+        연결 풀과 재시도 정책이 설정된 HTTP 세션 생성
+        
+        Returns:
+            requests.Session: 웹사이트 요청용 세션
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({"User-Agent": STRUCTURE_USER_AGENT})
+        return session
+    
     def export_to_format(self, content: Dict[str, Any], format_type: str, 
                          filename: str = "export", **kwargs) -> str:
         """
@@ -98,7 +424,8 @@ class ExportManager:
             return self.export_to_google_drive(content, filename, **kwargs)
     
     def export_to_markdown(self, content: Dict[str, Any], filename: str = "export", 
-                           template: Optional[str] = None, **kwargs) -> str:
+                           template: Optional[str] = None, rendered: Optional[bytes] = None,
+                           **kwargs) -> str:
         """
         마크다운 형식으로 내보내기
         
@@ -106,6 +433,7 @@ class ExportManager:
             content (Dict[str, Any]): 내보낼 콘텐츠
             filename (str): 출력 파일 이름 (확장자 제외)
             template (Optional[str]): 마크다운 템플릿 경로 (None이면 기본 템플릿 사용)
+            rendered (Optional[bytes]): 이미 생성한 마크다운 바이트 (있으면 다시 생성하지 않음)
             
         Returns:
             str: 생성된 마크다운 파일 경로
@@ -115,11 +443,11 @@ class ExportManager:
         
         try:
             # 기본 템플릿 또는 사용자 지정 템플릿 로드
-            md_content = self._generate_markdown_content(content, template)
+            if rendered is None:
+                rendered = self._render_markdown(content, template)
             
             # 파일 작성
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
+            output_path.write_bytes(rendered)
             
             logger.info(f"마크다운 파일 생성: {output_path}")
             return str(output_path)
@@ -145,75 +473,11 @@ class ExportManager:
         output_path = self.output_dir / f"{filename}.html"
         
         try:
-            # 먼저 마크다운 생성
-            md_content = self._generate_markdown_content(content)
-            
-            # 마크다운을 HTML로 변환
-            html_content = markdown.markdown(md_content, extensions=['tables', 'fenced_code'])
-            
-            # CSS 추가
-            if css and os.path.exists(css):
-                with open(css, "r", encoding="utf-8") as f:
-                    css_content = f.read()
-                html_template = f"""<!DOCTYPE html>
-                <html>
-                <head>
-                    <meta charset="UTF-8">
-                    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                    <title>{content.get('title', '클론 기획서')}</title>
-                    <style>
-                    {css_content}
-                    </style>
-                </head>
-                <body>
-                    {html_content}
-                </body>
-                </html>
-                """
-            else:
-                # 기본 스타일
-                html_template = f"""<!DOCTYPE html>
-                <html>
-                <head>
-                    <meta charset="UTF-8">
-                    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                    <title>{content.get('title', '클론 기획서')}</title>
-                    <style>
-                    body {{
-                        font-family: 'Noto Sans KR', Arial, sans-serif;
-                        line-height: 1.6;
-                        max-width: 900px;
-                        margin: 0 auto;
-                        padding: 20px;
-                        color: #333;
-                    }}
-                    h1, h2, h3, h4, h5, h6 {{
-                        margin-top: 1.5em;
-                        margin-bottom: 0.5em;
-                        color: #1a1a1a;
-                    }}
-                    h1 {{ font-size: 2.2em; border-bottom: 1px solid #eee; padding-bottom: 0.3em; }}
-                    h2 {{ font-size: 1.8em; border-bottom: 1px solid #eee; padding-bottom: 0.3em; }}
-                    h3 {{ font-size: 1.5em; }}
-                    h4 {{ font-size: 1.3em; }}
-                    table {{ border-collapse: collapse; width: 100%; margin: 1em 0; }}
-                    th, td {{ border: 1px solid #ddd; padding: 8px 12px; text-align: left; }}
-                    th {{ background-color: #f2f2f2; }}
-                    img {{ max-width: 100%; height: auto; }}
-                    code {{ background-color: #f5f5f5; padding: 2px 4px; border-radius: 3px; }}
-                    pre {{ background-color: #f5f5f5; padding: 1em; overflow-x: auto; border-radius: 3px; }}
-                    blockquote {{ background-color: #f9f9f9; border-left: 4px solid #ccc; margin: 1em 0; padding: 0.5em 1em; }}
-                    </style>
-                </head>
-                <body>
-                    {html_content}
-                </body>
-                </html>
-                """
+            # HTML 문서 생성
+            html_template = self._render_html(content, css)
             
             # 파일 작성
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(html_template)
+            output_path.write_bytes(html_template.encode("utf-8"))
             
             logger.info(f"HTML 파일 생성: {output_path}")
             return str(output_path)
@@ -222,8 +486,40 @@ class ExportManager:
             logger.error(f"HTML 내보내기 실패: {str(e)}")
             raise
     
+    def _render_html(self, content: Dict[str, Any], css: Optional[str] = None,
+                     embed_css: bool = True) -> str:
+        """
+        콘텐츠를 HTML 문서 문자열로 변환 (마크다운을 HTML로 변환)
+        
+        Args:
+            content (Dict[str, Any]): 변환할 콘텐츠
+            css (Optional[str]): CSS 스타일시트 경로
+            embed_css (bool): False이면 스타일을 문서에 넣지 않음 (PDF 변환 시 별도 스타일시트 사용)
+            
+        Returns:
+            str: 완성된 HTML 문서
+        """
+        # 먼저 마크다운 생성
+        md_content = self._generate_markdown_content(content)
+        
+        # 마크다운을 HTML로 변환
+        html_content = markdown.markdown(md_content, extensions=['tables', 'fenced_code'])
+        
+        # CSS 추가 (없으면 기본 스타일)
+        if not embed_css:
+            css_content = ""
+        else:
+            css_content = _read_css(css) if css and os.path.exists(css) else _DEFAULT_CSS
+        
+        return _HTML_DOCUMENT_TEMPLATE.format(
+            title=escape(str(content.get('title', '클론 기획서'))),
+            style=css_content,
+            body=html_content
+        )
+    
     def export_to_pptx(self, content: Dict[str, Any], filename: str = "export", 
-                       template_pptx: Optional[str] = None, **kwargs) -> str:
+                       template_pptx: Optional[str] = None, to_bytes: bool = False,
+                       **kwargs) -> Union[str, bytes]:
         """
         PowerPoint 형식으로 내보내기
         
@@ -231,9 +527,10 @@ class ExportManager:
             content (Dict[str, Any]): 내보낼 콘텐츠
             filename (str): 출력 파일 이름 (확장자 제외)
             template_pptx (Optional[str]): 템플릿 PPTX 파일 경로
+            to_bytes (bool): True이면 파일을 쓰지 않고 PPTX 바이트를 반환
             
         Returns:
-            str: 생성된 PPTX 파일 경로
+            Union[str, bytes]: 생성된 PPTX 파일 경로 (to_bytes=True이면 PPTX 바이트)
         """
         # 파일 경로 설정
         output_path = self.output_dir / f"{filename}.pptx"
@@ -243,11 +540,18 @@ class ExportManager:
             if template_pptx and os.path.exists(template_pptx):
                 prs = Presentation(template_pptx)
             else:
-                prs = Presentation()
+                # 매번 기본 템플릿을 디스크에서 읽지 않고 캐시된 빈 프레젠테이션에서 복제
+                prs = Presentation(io.BytesIO(_blank_pptx_bytes()))
             
             # 프레젠테이션 생성
             self._generate_presentation(prs, content)
             
+            # 메모리 버퍼로 저장하여 바이트 반환
+            if to_bytes:
+                buffer = io.BytesIO()
+                prs.save(buffer)
+                return buffer.getvalue()
+            
             # 파일 저장
             prs.save(output_path)
             
@@ -259,7 +563,7 @@ class ExportManager:
             raise
     
     def export_to_json(self, content: Dict[str, Any], filename: str = "export", 
-                       indent: int = 2, **kwargs) -> str:
+                       indent: int = 2, rendered: Optional[bytes] = None, **kwargs) -> str:
         """
         JSON 형식으로 내보내기
         
@@ -267,6 +571,7 @@ class ExportManager:
             content (Dict[str, Any]): 내보낼 콘텐츠
             filename (str): 출력 파일 이름 (확장자 제외)
             indent (int): JSON 들여쓰기 수준
+            rendered (Optional[bytes]): 이미 직렬화한 JSON 바이트 (있으면 다시 직렬화하지 않음)
             
         Returns:
             str: 생성된 JSON 파일 경로
@@ -275,9 +580,12 @@ class ExportManager:
         output_path = self.output_dir / f"{filename}.json"
         
         try:
+            if rendered is None:
+                rendered = self._render_json(content, indent)
+            
             # JSON 형식으로 저장
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(content, f, ensure_ascii=False, indent=indent)
+            with open(output_path, "wb") as f:
+                f.write(rendered)
             
             logger.info(f"JSON 파일 생성: {output_path}")
             return str(output_path)
@@ -286,8 +594,35 @@ class ExportManager:
             logger.error(f"JSON 내보내기 실패: {str(e)}")
             raise
     
+    def _render_markdown(self, content: Dict[str, Any], template: Optional[str] = None) -> bytes:
+        """
+        마크다운 문서를 UTF-8 바이트로 생성
+        
+        Args:
+            content (Dict[str, Any]): 내보낼 콘텐츠
+            template (Optional[str]): 마크다운 템플릿 경로
+            
+        Returns:
+            bytes: 마크다운 바이트
+        """
+        return self._generate_markdown_content(content, template).encode("utf-8")
+    
+    def _render_json(self, content: Dict[str, Any], indent: Optional[int] = 2) -> bytes:
+        """
+        콘텐츠를 JSON 바이트로 직렬화
+        
+        Args:
+            content (Dict[str, Any]): 내보낼 콘텐츠
+            indent (Optional[int]): JSON 들여쓰기 수준
+            
+        Returns:
+            bytes: JSON 바이트
+        """
+        return _dump_json_bytes(content, indent)
+    
     def export_to_zip(self, content: Dict[str, Any], filename: str = "export", 
-                      include_formats: List[str] = None, **kwargs) -> str:
+                      include_formats: List[str] = None, *, md: Optional[bytes] = None,
+                      json_bytes: Optional[bytes] = None, **kwargs) -> str:
         """
         여러 형식을 ZIP 아카이브로 내보내기
         
@@ -295,60 +630,182 @@ class ExportManager:
             content (Dict[str, Any]): 내보낼 콘텐츠
             filename (str): 출력 파일 이름 (확장자 제외)
             include_formats (List[str]): ZIP에 포함할 형식 목록 (기본: md, html, pptx, json, pdf)
+            md (Optional[bytes]): 이미 생성한 마크다운 바이트 (있으면 다시 생성하지 않음)
+            json_bytes (Optional[bytes]): 이미 직렬화한 JSON 바이트 (있으면 다시 직렬화하지 않음)
             
         Returns:
-            str: 생성된 ZIP 파일 경로
+            str: 생성된 ZIP 파일 경로 (로컬 파일 형식 하나만 요청된 경우 해당 파일 경로)
         """
         # 기본 포함 형식
         if include_formats is None:
             include_formats = ['md', 'html', 'pptx', 'json', 'pdf']  # notion은 URL만 반환하므로 ZIP에 포함하지 않음
         
+        # 로컬 파일 형식 하나만 요청했고 함께 묶을 자원도 없으면 압축 없이 해당 파일을 바로 반환
+        if (len(include_formats) == 1 and include_formats[0] in LOCAL_FILE_FORMATS
+                and not content.get('resources')):
+            return self.export_to_format(content, include_formats[0], filename, **kwargs)
+        
         # 파일 경로 설정
         output_path = self.output_dir / f"{filename}.zip"
         
-        # 내보내기를 위한 임시 디렉토리 생성
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            try:
-                # 각 형식으로 내보내기 수행
-                exported_files = []
-                for fmt in include_formats:
-                    if fmt in self.supported_formats and fmt != 'zip':
-                        export_path = self.export_to_format(
-                            content=content,
-                            format_type=fmt,
-                            filename=filename,
-                            output_dir=temp_path,
-                            **kwargs
-                        )
-                        exported_files.append(Path(export_path))
-                
-                # 이미지 및 기타 자원 복사 (있는 경우)
-                if 'resources' in content and isinstance(content['resources'], dict):
-                    resources_dir = temp_path / "resources"
-                    resources_dir.mkdir(exist_ok=True)
-                    
-                    for res_name, res_path in content['resources'].items():
-                        if os.path.exists(res_path):
-                            dest_path = resources_dir / os.path.basename(res_path)
-                            shutil.copy2(res_path, dest_path)
-                            exported_files.append(dest_path)
-                
-                # ZIP 파일 생성
-                with zipfile.ZipFile(output_path, 'w') as zip_file:
-                    for file_path in exported_files:
-                        zip_file.write(
-                            file_path, 
-                            arcname=file_path.name
-                        )
-                
-                logger.info(f"ZIP 아카이브 생성: {output_path}")
-                return str(output_path)
+        try:
+            # ZIP 파일 생성 (항목을 만드는 대로 바로 압축)
+            with zipfile.ZipFile(output_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
+                entries = self._iter_zip_entries(content, filename, include_formats,
+                                                 md=md, json_bytes=json_bytes, **kwargs)
+                for arcname, source in entries:
+                    self._write_zip_entry(zip_file, arcname, source)
+            
+            logger.info(f"ZIP 아카이브 생성: {output_path}")
+            return str(output_path)
                 
-            except Exception as e:
-                logger.error(f"ZIP 내보내기 실패: {str(e)}")
-                raise
+        except Exception as e:
+            logger.error(f"ZIP 내보내기 실패: {str(e)}")
+            raise
+    
+    def stream_zip(self, content: Dict[str, Any], filename: str = "export",
+                   include_formats: Optional[List[str]] = None, **kwargs) -> Iterator[bytes]:
+        """
+        여러 형식을 ZIP 아카이브로 만들면서 바이트 조각 단위로 반환 (디스크에 ZIP 파일을 만들지 않음)
+        
+        Args:
+            content (Dict[str, Any]): 내보낼 콘텐츠
+            filename (str): 아카이브 안의 파일 이름 (확장자 제외)
+            include_formats (Optional[List[str]]): ZIP에 포함할 형식 목록 (기본: md, html, pptx, json, pdf)
+            
+        Returns:
+            Iterator[bytes]: 항목 하나를 압축할 때마다 생성되는 ZIP 바이트 조각
+        """
+        if include_formats is None:
+            include_formats = ['md', 'html', 'pptx', 'json', 'pdf']
+        
+        sink = _ZipStreamSink()
+        try:
+            with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
+                for arcname, source in self._iter_zip_entries(content, filename, include_formats, **kwargs):
+                    self._write_zip_entry(zip_file, arcname, source)
+                    yield sink.drain()
+            
+            # 중앙 디렉터리 기록분 반환
+            yield sink.drain()
+            logger.info(f"ZIP 아카이브 스트리밍 완료: {filename}.zip")
+            
+        except Exception as e:
+            logger.error(f"ZIP 스트리밍 실패: {str(e)}")
+            raise
+    
+    def stream_tar_zst(self, content: Dict[str, Any], filename: str = "export",
+                       include_formats: Optional[List[str]] = None, **kwargs) -> Iterator[bytes]:
+        """
+        ZIP 대신 zstd로 압축한 tar 아카이브를 만들면서 바이트 조각 단위로 반환
+        
+        Args:
+            content (Dict[str, Any]): 내보낼 콘텐츠
+            filename (str): 아카이브 안의 파일 이름 (확장자 제외)
+            include_formats (Optional[List[str]]): 포함할 형식 목록 (기본: md, html, pptx, json, pdf)
+            
+        Returns:
+            Iterator[bytes]: 항목 하나를 압축할 때마다 생성되는 tar.zst 바이트 조각
+        """
+        if zstandard is None:
+            raise RuntimeError("zstandard 패키지가 설치되어 있지 않아 tar.zst 아카이브를 만들 수 없습니다.")
+        
+        if include_formats is None:
+            include_formats = ['md', 'html', 'pptx', 'json', 'pdf']
+        
+        sink = _ZipStreamSink()
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+        try:
+            with compressor.stream_writer(sink, closefd=False) as writer:
+                with tarfile.open(fileobj=writer, mode="w|") as tar:
+                    for arcname, source in self._iter_zip_entries(content, filename, include_formats, **kwargs):
+                        if isinstance(source, bytes):
+                            info = tarfile.TarInfo(arcname)
+                            info.size = len(source)
+                            tar.addfile(info, io.BytesIO(source))
+                        else:
+                            tar.add(str(source), arcname=arcname)
+                        yield sink.drain()
+            
+            # 남은 압축 블록과 tar 종료 블록 반환
+            yield sink.drain()
+            logger.info(f"tar.zst 아카이브 스트리밍 완료: {filename}.tar.zst")
+            
+        except Exception as e:
+            logger.error(f"tar.zst 스트리밍 실패: {str(e)}")
+            raise
+    
+    def _iter_zip_entries(self, content: Dict[str, Any], filename: str,
+                          include_formats: List[str], md: Optional[bytes] = None,
+                          json_bytes: Optional[bytes] = None,
+                          **kwargs) -> Iterator[Tuple[str, Union[bytes, Path]]]:
+        """
+        ZIP에 넣을 항목을 하나씩 생성 (텍스트/PPTX/PDF는 메모리에서, 그 외는 파일 경로로)
+        
+        Args:
+            content (Dict[str, Any]): 내보낼 콘텐츠
+            filename (str): 아카이브 안의 파일 이름 (확장자 제외)
+            include_formats (List[str]): ZIP에 포함할 형식 목록
+            md (Optional[bytes]): 이미 생성한 마크다운 바이트
+            json_bytes (Optional[bytes]): 이미 직렬화한 JSON 바이트
+            
+        Returns:
+            Iterator[Tuple[str, Union[bytes, Path]]]: (아카이브 경로, 바이트 또는 원본 파일 경로)
+        """
+        for fmt in include_formats:
+            if fmt not in self.supported_formats or fmt == 'zip':
+                continue
+            
+            if fmt == 'md':
+                if md is None:
+                    md = self._render_markdown(content, kwargs.get('template'))
+                yield f"{filename}.md", md
+            elif fmt == 'html':
+                html_document = self._render_html(content, kwargs.get('css'))
+                yield f"{filename}.html", html_document.encode("utf-8")
+            elif fmt == 'json':
+                if json_bytes is None:
+                    json_bytes = self._render_json(content, kwargs.get('indent', 2))
+                yield f"{filename}.json", json_bytes
+            elif fmt == 'pptx':
+                yield f"{filename}.pptx", self.export_to_pptx(content, filename, kwargs.get('template_pptx'), to_bytes=True)
+            elif fmt == 'pdf':
+                yield f"{filename}.pdf", self.export_to_pdf(content, filename, kwargs.get('css'), to_bytes=True)
+            else:
+                export_path = Path(self.export_to_format(
+                    content=content,
+                    format_type=fmt,
+                    filename=filename,
+                    **kwargs
+                ))
+                yield export_path.name, export_path
+        
+        # 이미지 및 기타 자원은 복사 없이 원본에서 바로 압축
+        resources = content.get('resources')
+        if isinstance(resources, dict):
+            for res_path in resources.values():
+                if os.path.exists(res_path):
+                    yield f"resources/{os.path.basename(res_path)}", Path(res_path)
+    
+    @staticmethod
+    def _write_zip_entry(zip_file: zipfile.ZipFile, arcname: str, source: Union[bytes, Path]) -> None:
+        """
+        ZIP 항목 하나 기록 (이미 압축된 형식은 다시 압축하지 않고 저장)
+        
+        Args:
+            zip_file (zipfile.ZipFile): 기록할 ZIP 파일
+            arcname (str): 아카이브 안의 경로
+            source (Union[bytes, Path]): 항목 바이트 또는 원본 파일 경로
+        """
+        if Path(arcname).suffix.lower() in _PRECOMPRESSED_SUFFIXES:
+            compress_type = zipfile.ZIP_STORED
+        else:
+            compress_type = zipfile.ZIP_DEFLATED
+        
+        if isinstance(source, bytes):
+            zip_file.writestr(arcname, source, compress_type=compress_type)
+        else:
+            zip_file.write(source, arcname=arcname, compress_type=compress_type)
     
     def export_for_ai_analysis(self, content: Dict[str, Any], url: str = None, 
                               filename: str = "ai_analysis", **kwargs) -> str:
@@ -363,6 +820,22 @@ class ExportManager:
         Returns:
             str: 생성된 AI 메타데이터 파일 경로
         """
+        output_path, _ = self._export_ai_metadata(content, url, filename)
+        return output_path
+    
+    def _export_ai_metadata(self, content: Dict[str, Any], url: Optional[str],
+                            filename: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        AI 분석용 메타데이터를 생성하여 파일로 저장하고 메타데이터도 함께 반환
+        
+        Args:
+            content (Dict[str, Any]): 내보낼 콘텐츠
+            url (Optional[str]): 분석할 웹사이트 URL (None이면 content에서 추출)
+            filename (str): 출력 파일 이름 (확장자 제외)
+            
+        Returns:
+            Tuple[str, Dict[str, Any]]: (생성된 파일 경로, AI 메타데이터)
+        """
         # 파일 경로 설정
         output_path = self.output_dir / f"{filename}_ai_meta.json"
         
@@ -378,11 +851,11 @@ class ExportManager:
             ai_metadata = self._generate_ai_metadata(content, url)
             
             # JSON 형식으로 저장
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(ai_metadata, f, ensure_ascii=False, indent=2)
+            with open(output_path, "wb") as f:
+                f.write(_dump_json_bytes(ai_metadata))
             
             logger.info(f"AI 분석용 메타데이터 파일 생성: {output_path}")
-            return str(output_path)
+            return str(output_path), ai_metadata
             
         except Exception as e:
             logger.error(f"AI 분석용 메타데이터 내보내기 실패: {str(e)}")
@@ -417,25 +890,32 @@ class ExportManager:
             }
         }
         
-        # 웹사이트 분석 시도 (가능한 경우)
-        try:
-            site_structure = self._analyze_website_structure(url)
-            ai_metadata["site_structure"] = site_structure
-        except Exception as e:
-            logger.warning(f"웹사이트 구조 분석 실패: {str(e)}")
-            ai_metadata["site_structure"] = {"error": str(e)}
+        # 이미 구조 정보가 있으면 재사용, 없으면 웹사이트 분석 시도 (가능한 경우)
+        known_structure = content.get('site_structure')
+        if isinstance(known_structure, dict):
+            ai_metadata["site_structure"] = known_structure
+        else:
+            try:
+                site_structure = self._analyze_website_structure(url)
+                ai_metadata["site_structure"] = site_structure
+            except Exception as e:
+                logger.warning(f"웹사이트 구조 분석 실패: {str(e)}")
+                ai_metadata["site_structure"] = {"error": str(e)}
         
         # 페이지 구조 정보 추가
-        if 'page_structure' in content and isinstance(content['page_structure'], list):
-            ai_metadata["page_structure"] = content['page_structure']
+        page_structure = content.get('page_structure')
+        if isinstance(page_structure, list):
+            ai_metadata["page_structure"] = page_structure
         
         # 디자인 분석 정보 추가
-        if 'design_analysis' in content and isinstance(content['design_analysis'], dict):
-            ai_metadata["design_analysis"] = content['design_analysis']
+        design = content.get('design_analysis')
+        if isinstance(design, dict):
+            ai_metadata["design_analysis"] = design
         
         # 기능 분석 정보 추가
-        if 'functional_analysis' in content and isinstance(content['functional_analysis'], dict):
-            ai_metadata["functional_analysis"] = content['functional_analysis']
+        func = content.get('functional_analysis')
+        if isinstance(func, dict):
+            ai_metadata["functional_analysis"] = func
         
         return ai_metadata
     
@@ -450,20 +930,29 @@ class ExportManager:
         Returns:
             Dict[str, Any]: 웹사이트 구조 정보
         """
+        # 같은 URL을 최근에 분석했다면 캐시된 결과의 복사본 반환 (만료된 항목은 제거)
+        cache_key = (url, max_depth)
+        with self._structure_cache_lock:
+            cached = self._structure_cache.get(cache_key)
+            if cached is not None:
+                cached_at, cached_structure = cached
+                if time.monotonic() - cached_at < STRUCTURE_CACHE_TTL:
+                    self._structure_cache.move_to_end(cache_key)
+                    return copy.deepcopy(cached_structure)
+                del self._structure_cache[cache_key]
+        
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
+            # 본문 전체를 메모리에 올리지 않도록 스트리밍으로 앞부분만 읽기
+            with self._http.get(url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                raw_html = response.raw.read(MAX_STRUCTURE_BYTES, decode_content=True)
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(raw_html, 'lxml')
             
             # 기본 메타데이터 추출
             title = soup.title.text.strip() if soup.title else "제목 없음"
-            meta_description = ""
-            if soup.find("meta", attrs={"name": "description"}):
-                meta_description = soup.find("meta", attrs={"name": "description"}).get("content", "")
+            meta_desc_element = soup.find("meta", attrs={"name": "description"})
+            meta_description = meta_desc_element.get("content", "") if meta_desc_element else ""
             
             # 주요 구조 요소 식별
             structure = {
@@ -478,12 +967,44 @@ class ExportManager:
                 "links": self._extract_links(soup, url, max_depth)
             }
             
+            # 성공한 결과만 복사본으로 캐시에 저장 (오래된 항목부터 제거)
+            with self._structure_cache_lock:
+                self._structure_cache[cache_key] = (time.monotonic(), copy.deepcopy(structure))
+                self._structure_cache.move_to_end(cache_key)
+                while len(self._structure_cache) > MAX_STRUCTURE_CACHE_SIZE:
+                    self._structure_cache.popitem(last=False)
+            
             return structure
             
         except Exception as e:
             logger.error(f"웹사이트 구조 분석 중 오류 발생: {str(e)}")
             return {"error": str(e)}
     
+    def _analyze_website_structures(self, urls: List[str], max_depth: int = 2) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 웹사이트의 구조를 동시에 분석
+        
+        Args:
+            urls (List[str]): 분석할 웹사이트 URL 목록
+            max_depth (int): 분석할 최대 깊이
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: URL별 웹사이트 구조 정보
+        """
+        # 중복 URL은 한 번만 요청
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return {}
+        
+        # 네트워크 대기 시간이 겹치도록 스레드 풀에서 병렬 요청
+        max_workers = min(len(unique_urls), MAX_STRUCTURE_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            structures = executor.map(
+                lambda target_url: self._analyze_website_structure(target_url, max_depth),
+                unique_urls
+            )
+            return dict(zip(unique_urls, structures))
+    
     def _extract_headers(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
         """
         페이지에서 헤더 요소 추출
@@ -495,12 +1016,11 @@ class ExportManager:
             List[Dict[str, str]]: 헤더 정보 목록
         """
         headers = []
-        for i in range(1, 7):
-            for header in soup.find_all(f'h{i}'):
-                headers.append({
-                    "level": i,
-                    "text": header.get_text(strip=True)
-                })
+        for header in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
+            headers.append({
+                "level": int(header.name[1]),
+                "text": header.get_text(strip=True)
+            })
         return headers
     
     def _extract_navigation(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
@@ -516,7 +1036,7 @@ class ExportManager:
         nav_items = []
         
         # 일반적인 네비게이션 요소 찾기
-        nav_elements = soup.find_all(['nav', 'div'], class_=lambda x: x and ('nav' in x.lower() or 'menu' in x.lower()))
+        nav_elements = soup.find_all(['nav', 'div'], class_=_NAV_CLASS_RE)
         
         for nav in nav_elements:
             links = nav.find_all('a')
@@ -637,6 +1157,10 @@ class ExportManager:
         
         base_domain = urlparse(base_url).netloc
         
+        # 내부 링크 판별용 접두사 (링크마다 urlparse 하지 않도록 미리 계산)
+        base_roots = tuple(f"{scheme}{base_domain}" for scheme in ('http://', 'https://', '//'))
+        base_prefixes = tuple(f"{root}{sep}" for root in base_roots for sep in ('/', '?', '#'))
+        
         for link in links:
             href = link.get('href', '')
             if not href or href.startswith('#'):
@@ -644,7 +1168,7 @@ class ExportManager:
                 
             # 상대 URL을 절대 URL로 변환
             absolute_url = urljoin(base_url, href)
-            link_domain = urlparse(absolute_url).netloc
+            is_internal = absolute_url.startswith(base_prefixes) or absolute_url in base_roots
             
             link_info = {
                 "url": absolute_url,
@@ -652,7 +1176,7 @@ class ExportManager:
                 "title": link.get('title', '')
             }
             
-            if link_domain == base_domain:
+            if is_internal:
                 internal_links.append(link_info)
             else:
                 external_links.append(link_info)
@@ -665,9 +1189,8 @@ class ExportManager:
         }
     
     def _get_current_timestamp(self) -> str:
-        """현재 타임스탬프를 ISO 형식으로 반환"""
-        from datetime import datetime
-        return datetime.now().isoformat()
+        """현재 타임스탬프를 ISO 형식(UTC, 초 단위)으로 반환"""
+        return datetime.now(timezone.utc).isoformat(timespec='seconds')
     
     def _generate_markdown_content(self, content: Dict[str, Any], 
                                   template: Optional[str] = None) -> str:
@@ -686,19 +1209,21 @@ class ExportManager:
             with open(template, "r", encoding="utf-8") as f:
                 template_content = f.read()
                 
-            # 템플릿에 변수 채우기
+            # 치환할 변수 목록 구성 (중첩된 콘텐츠는 key.nested_key 형식)
+            variables = {}
             for key, value in content.items():
-                placeholder = f"{{{{{key}}}}}"
                 if isinstance(value, str):
-                    template_content = template_content.replace(placeholder, value)
+                    variables[key] = value
                 elif isinstance(value, dict):
-                    # 중첩된 콘텐츠 처리
                     for nested_key, nested_value in value.items():
-                        nested_placeholder = f"{{{{{key}.{nested_key}}}}}"
                         if isinstance(nested_value, str):
-                            template_content = template_content.replace(nested_placeholder, nested_value)
+                            variables[f"{key}.{nested_key}"] = nested_value
             
-            return template_content
+            # 템플릿을 한 번만 훑으며 변수 채우기 (알 수 없는 변수는 그대로 유지)
+            return _PLACEHOLDER_RE.sub(
+                lambda match: variables.get(match.group(1), match.group(0)),
+                template_content
+            )
         
         # 템플릿이 없는 경우 데이터에서 마크다운 생성
         md_parts = []
@@ -726,8 +1251,8 @@ class ExportManager:
             md_parts.append(f"{content['overview']}\n")
         
         # 디자인 분석
-        if 'design_analysis' in content and isinstance(content['design_analysis'], dict):
-            design = content['design_analysis']
+        design = content.get('design_analysis')
+        if isinstance(design, dict):
             md_parts.append("## 디자인 분석\n")
             
             if 'color_palette' in design:
@@ -750,8 +1275,8 @@ class ExportManager:
                 md_parts.append("\n")
         
         # 기능 분석
-        if 'functional_analysis' in content and isinstance(content['functional_analysis'], dict):
-            func = content['functional_analysis']
+        func = content.get('functional_analysis')
+        if isinstance(func, dict):
             md_parts.append("## 기능 분석\n")
             
             if 'key_features' in func and isinstance(func['key_features'], list):
@@ -766,11 +1291,13 @@ class ExportManager:
                 md_parts.append("\n")
         
         # 페이지 구조
-        if 'page_structure' in content and isinstance(content['page_structure'], list):
+        page_structure = content.get('page_structure')
+        if isinstance(page_structure, list):
             md_parts.append("## 페이지 구조\n")
-            for page in content['page_structure']:
-                if isinstance(page, dict) and 'name' in page:
-                    md_parts.append(f"### {page['name']}\n")
+            for page in page_structure:
+                name = page.get('name') if isinstance(page, dict) else None
+                if name is not None:
+                    md_parts.append(f"### {name}\n")
                     if 'description' in page:
                         md_parts.append(f"{page['description']}\n")
                     if 'components' in page and isinstance(page['components'], list):
@@ -782,9 +1309,10 @@ class ExportManager:
                     md_parts.append(f"- {page}\n")
         
         # 기술 스택
-        if 'tech_stack' in content and isinstance(content['tech_stack'], list):
+        tech_stack = content.get('tech_stack')
+        if isinstance(tech_stack, list):
             md_parts.append("## 기술 스택\n")
-            for tech in content['tech_stack']:
+            for tech in tech_stack:
                 md_parts.append(f"- {tech}")
             md_parts.append("\n")
         
@@ -819,26 +1347,16 @@ class ExportManager:
         title.text = content.get('title', '클론 기획서')
         subtitle.text = f"웹사이트: {content.get('website', {}).get('name', '')}"
         
+        # 본문 슬라이드 레이아웃은 한 번만 조회
+        content_slide_layout = prs.slide_layouts[1]
+        
         # 개요 슬라이드
         if 'overview' in content:
-            content_slide_layout = prs.slide_layouts[1]
-            slide = prs.slides.add_slide(content_slide_layout)
-            title = slide.shapes.title
-            content_placeholder = slide.placeholders[1]
-            
-            title.text = "개요"
-            content_placeholder.text = content['overview']
+            self._add_body_slide(prs, content_slide_layout, "개요", content['overview'])
         
         # 디자인 분석 슬라이드
-        if 'design_analysis' in content and isinstance(content['design_analysis'], dict):
-            design = content['design_analysis']
-            
-            content_slide_layout = prs.slide_layouts[1]
-            slide = prs.slides.add_slide(content_slide_layout)
-            title = slide.shapes.title
-            content_placeholder = slide.placeholders[1]
-            
-            title.text = "디자인 분석"
+        design = content.get('design_analysis')
+        if isinstance(design, dict):
             
             text_parts = []
             if 'color_palette' in design:
@@ -857,18 +1375,11 @@ class ExportManager:
                 text_parts.append("\n레이아웃:")
                 text_parts.append(design['layout'])
             
-            content_placeholder.text = "\n".join(text_parts)
+            self._add_body_slide(prs, content_slide_layout, "디자인 분석", text_parts)
         
         # 기능 분석 슬라이드
-        if 'functional_analysis' in content and isinstance(content['functional_analysis'], dict):
-            func = content['functional_analysis']
-            
-            content_slide_layout = prs.slide_layouts[1]
-            slide = prs.slides.add_slide(content_slide_layout)
-            title = slide.shapes.title
-            content_placeholder = slide.placeholders[1]
-            
-            title.text = "기능 분석"
+        func = content.get('functional_analysis')
+        if isinstance(func, dict):
             
             text_parts = []
             if 'key_features' in func and isinstance(func['key_features'], list):
@@ -880,66 +1391,97 @@ class ExportManager:
                 text_parts.append("\n사용자 인터랙션:")
                 text_parts.append(func['user_interactions'])
             
-            content_placeholder.text = "\n".join(text_parts)
+            self._add_body_slide(prs, content_slide_layout, "기능 분석", text_parts)
         
         # 페이지 구조 슬라이드
-        if 'page_structure' in content and isinstance(content['page_structure'], list):
-            content_slide_layout = prs.slide_layouts[1]
-            slide = prs.slides.add_slide(content_slide_layout)
-            title = slide.shapes.title
-            content_placeholder = slide.placeholders[1]
-            
-            title.text = "페이지 구조"
-            
+        page_structure = content.get('page_structure')
+        if isinstance(page_structure, list):
             text_parts = []
-            for page in content['page_structure']:
-                if isinstance(page, dict) and 'name' in page:
-                    text_parts.append(f"• {page['name']}")
+            for page in page_structure:
+                name = page.get('name') if isinstance(page, dict) else None
+                if name is not None:
+                    text_parts.append(f"• {name}")
                     if 'components' in page and isinstance(page['components'], list):
                         for component in page['components']:
                             text_parts.append(f"  - {component}")
                 else:
                     text_parts.append(f"• {page}")
             
-            content_placeholder.text = "\n".join(text_parts)
+            self._add_body_slide(prs, content_slide_layout, "페이지 구조", text_parts)
         
         # 기술 스택 슬라이드
-        if 'tech_stack' in content and isinstance(content['tech_stack'], list):
-            content_slide_layout = prs.slide_layouts[1]
-            slide = prs.slides.add_slide(content_slide_layout)
-            title = slide.shapes.title
-            content_placeholder = slide.placeholders[1]
-            
-            title.text = "기술 스택"
-            
+        tech_stack = content.get('tech_stack')
+        if isinstance(tech_stack, list):
             text_parts = []
-            for tech in content['tech_stack']:
+            for tech in tech_stack:
                 text_parts.append(f"• {tech}")
             
-            content_placeholder.text = "\n".join(text_parts)
+            self._add_body_slide(prs, content_slide_layout, "기술 스택", text_parts)
         
         # 개발 제안 슬라이드
         if 'development_recommendations' in content:
-            content_slide_layout = prs.slide_layouts[1]
-            slide = prs.slides.add_slide(content_slide_layout)
-            title = slide.shapes.title
-            content_placeholder = slide.placeholders[1]
-            
-            title.text = "개발 제안"
-            content_placeholder.text = content['development_recommendations']
+            self._add_body_slide(prs, content_slide_layout, "개발 제안", content['development_recommendations'])
         
         # 결론 슬라이드
         if 'conclusion' in content:
-            content_slide_layout = prs.slide_layouts[1]
-            slide = prs.slides.add_slide(content_slide_layout)
-            title = slide.shapes.title
-            content_placeholder = slide.placeholders[1]
-            
-            title.text = "결론"
-            content_placeholder.text = content['conclusion']
+            self._add_body_slide(prs, content_slide_layout, "결론", content['conclusion'])
+    
+    def _add_body_slide(self, prs: Presentation, layout, title: str,
+                        body: Union[str, List[str]]) -> None:
+        """
+        제목과 본문으로 구성된 슬라이드 추가
+        
+        Args:
+            prs (Presentation): PowerPoint 프레젠테이션 객체
+            layout: 사용할 슬라이드 레이아웃
+            title (str): 슬라이드 제목
+            body (Union[str, List[str]]): 본문 텍스트 또는 줄 단위 목록
+        """
+        slide = prs.slides.add_slide(layout)
+        
+        # 플레이스홀더 컬렉션을 한 번만 조회 (shapes.title은 호출마다 도형을 재탐색)
+        placeholders = slide.placeholders
+        placeholders[0].text = title
+        if isinstance(body, list):
+            self._set_bullets(placeholders[1], body)
+        else:
+            placeholders[1].text = body
+    
+    def _set_bullets(self, placeholder, lines: List[str]) -> None:
+        """
+        플레이스홀더 본문을 줄 목록으로 교체 (a:p/a:r/a:t XML을 직접 구성)
+        
+        Args:
+            placeholder: 본문 플레이스홀더
+            lines (List[str]): 줄 단위 텍스트 목록 (줄 안의 개행은 별도 문단으로 분리)
+        """
+        tx_body = placeholder.text_frame._txBody
+        
+        # 기존 문단 제거
+        for paragraph in tx_body.findall(qn('a:p')):
+            tx_body.remove(paragraph)
+        
+        # 한 번의 루프로 문단 요소를 모두 추가
+        # (python-pptx의 text 설정과 같이 수직 탭은 줄바꿈으로, 제어 문자는 _xHHHH_로 변환)
+        for line in lines:
+            for text in str(line).split("\n"):
+                paragraph = etree.SubElement(tx_body, qn('a:p'))
+                for index, part in enumerate(text.split("\v")):
+                    if index > 0:
+                        etree.SubElement(paragraph, qn('a:br'))
+                    if part:
+                        run = etree.SubElement(paragraph, qn('a:r'))
+                        etree.SubElement(run, qn('a:t')).text = _PPTX_CTRL_CHARS.sub(
+                            lambda match: "_x%04X_" % ord(match.group()), part
+                        )
+        
+        # txBody에는 최소 하나의 문단이 필요
+        if tx_body.find(qn('a:p')) is None:
+            etree.SubElement(tx_body, qn('a:p'))
 
     def export_to_pdf(self, content: Dict[str, Any], filename: str = "export", 
-                      css: Optional[str] = None, **kwargs) -> str:
+                      css: Optional[str] = None, to_bytes: bool = False,
+                      **kwargs) -> Union[str, bytes]:
         """
         PDF 형식으로 내보내기 (HTML을 PDF로 변환)
         
@@ -947,23 +1489,27 @@ class ExportManager:
             content (Dict[str, Any]): 내보낼 콘텐츠
             filename (str): 출력 파일 이름 (확장자 제외)
             css (Optional[str]): CSS 스타일시트 경로
+            to_bytes (bool): True이면 파일을 쓰지 않고 PDF 바이트를 반환
             **kwargs: 추가 옵션
             
         Returns:
-            str: 생성된 PDF 파일 경로
+            Union[str, bytes]: 생성된 PDF 파일 경로 (to_bytes=True이면 PDF 바이트)
         """
         # 파일 경로 설정
         output_path = self.output_dir / f"{filename}.pdf"
         
         try:
-            # 먼저 HTML로 변환
-            html_path = self.export_to_html(content, f"{filename}_temp", css, **kwargs)
+            # 임시 파일 없이 메모리에서 HTML 렌더링
+            # 스타일시트는 같은 폰트 설정으로 파싱해 캐시한 결과를 사용
+            html_document = HTML(string=self._render_html(content, embed_css=False), base_url=str(self.output_dir))
+            render_options = self._get_pdf_render_options(css)
             
-            # HTML을 PDF로 변환
-            HTML(filename=html_path).write_pdf(output_path)
+            # 메모리에서 PDF 바이트 반환
+            if to_bytes:
+                return html_document.write_pdf(**render_options)
             
-            # 임시 HTML 파일 삭제
-            os.remove(html_path)
+            # HTML을 PDF로 변환
+            html_document.write_pdf(output_path, **render_options)
             
             logger.info(f"PDF 파일 생성: {output_path}")
             return str(output_path)
@@ -1003,14 +1549,14 @@ class ExportManager:
                 page_title = f"{website_name} 클론 기획서"
             
             # 노션 클라이언트 생성
-            notion_client = NotionClient(api_key)
+            notion_client = self._get_notion_client(api_key)
             
             # 노션 페이지로 내보내기
             logger.info(f"노션 페이지로 내보내기 시작: {page_title}")
             page_id = notion_client.export_website_analysis(content, parent_id, page_title)
             
             # 페이지 URL 생성
-            page_url = f"https://www.notion.so/{page_id.replace('-', '')}"
+            page_url = f"https://www.notion.so/{page_id.translate(_STRIP_HYPHEN)}"
             logger.info(f"노션 페이지로 내보내기 완료: {page_url}")
             
             return page_url
@@ -1024,7 +1570,9 @@ class ExportManager:
                              make_public: bool = True,
                              export_format: str = 'markdown', 
                              credentials_file: Optional[str] = None,
-                             token_file: Optional[str] = None) -> str:
+                             token_file: Optional[str] = None,
+                             chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+                             resumable: bool = True) -> str:
         """
         구글 드라이브로 내보내기
         
@@ -1036,6 +1584,8 @@ class ExportManager:
             export_format (str): 드라이브에 업로드할 파일 형식 ('markdown', 'pdf', 'pptx', 'zip')
             credentials_file (Optional[str]): 구글 OAuth 인증 정보 파일 경로
             token_file (Optional[str]): 인증 토큰 저장 파일 경로
+            chunk_size (int): 큰 파일 업로드 시 청크 크기 (바이트)
+            resumable (bool): 큰 파일에 청크 단위 재개 가능 업로드 사용 여부
             
         Returns:
             str: 구글 드라이브 파일 공유 URL
@@ -1066,14 +1616,16 @@ class ExportManager:
                 folder_name = f"{website_name} 클론 기획서"
             
             # 구글 드라이브 클라이언트 생성
-            gdrive_client = GoogleDriveClient(credentials_file, token_file)
+            gdrive_client = self._get_gdrive_client(credentials_file, token_file)
             
             # 파일을 구글 드라이브로 내보내기
             logger.info(f"파일 '{local_file_path}'을(를) 구글 드라이브로 내보내는 중...")
             success, file_id, file_url = gdrive_client.export_to_google_drive(
                 file_path=local_file_path,
                 folder_name=folder_name,
-                make_public=make_public
+                make_public=make_public,
+                chunk_size=chunk_size,
+                resumable=resumable
             )
             
             if not success or not file_url:
@@ -1086,8 +1638,133 @@ class ExportManager:
             logger.error(f"구글 드라이브 내보내기 중 오류 발생: {str(e)}")
             raise
 
+    def export_and_upload(self, content: Dict[str, Any], filename: str = "export",
+                          include_formats: Optional[List[str]] = None,
+                          gdrive_options: Optional[Dict[str, Any]] = None,
+                          notion_options: Optional[Dict[str, Any]] = None,
+                          **kwargs) -> Dict[str, Optional[str]]:
+        """
+        로컬 내보내기 후 구글 드라이브/노션 업로드를 동시에 수행
+        
+        Args:
+            content (Dict[str, Any]): 내보낼 콘텐츠
+            filename (str): 출력 파일 이름 (확장자 제외)
+            include_formats (Optional[List[str]]): ZIP 파일에 포함할 형식 목록 (None이면 로컬 내보내기 생략)
+            gdrive_options (Optional[Dict[str, Any]]): export_to_google_drive 추가 인자 (None이면 업로드 생략)
+            notion_options (Optional[Dict[str, Any]]): export_to_notion 추가 인자 (None이면 업로드 생략)
+            **kwargs: 로컬 내보내기 추가 옵션
+            
+        Returns:
+            Dict[str, Optional[str]]: 형식별 출력 파일 경로 또는 업로드 URL (실패 시 None)
+        """
+        results = {}
+        
+        # 로컬 내보내기 먼저 수행
+        if include_formats:
+            results['zip'] = self.export_to_zip(content, filename, include_formats, **kwargs)
+        
+        # 클라우드 업로드는 네트워크 대기 시간이 겹치도록 동시에 실행
+        uploads = {}
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if gdrive_options is not None:
+                uploads['gdrive'] = executor.submit(self.export_to_google_drive, content, filename, **gdrive_options)
+            if notion_options is not None:
+                uploads['notion'] = executor.submit(self.export_to_notion, content, **notion_options)
+            
+            for target, future in uploads.items():
+                try:
+                    results[target] = future.result()
+                except Exception as e:
+                    logger.error(f"{target} 업로드 실패: {str(e)}")
+                    results[target] = None
+        
+        return results
+
 
 # 유틸리티 함수
+def _export_targets(format_type: str, options: Dict[str, Any]) -> set:
+    """
+    형식별 내보내기가 출력 디렉토리에 쓰는 파일 종류 반환 (같은 파일 이름 기준)
+    
+    Args:
+        format_type (str): 내보내기 형식
+        options (Dict[str, Any]): 형식별 추가 옵션 (export_format, include_formats)
+        
+    Returns:
+        set: 쓰는 파일 종류 집합 (파일을 쓰지 않으면 빈 집합)
+    """
+    format_type = format_type.lower()
+    if format_type == 'notion':
+        return set()
+    
+    # 구글 드라이브는 지정한 형식의 로컬 파일을 만든 뒤 업로드
+    if format_type == 'gdrive':
+        export_format = options.get('export_format', 'markdown').lower()
+        return _export_targets('md' if export_format == 'markdown' else export_format, options)
+    
+    if format_type == 'zip':
+        include_formats = options.get('include_formats') or ['md', 'html', 'pptx', 'json', 'pdf']
+        targets = {'zip'}
+        # 로컬 파일 형식 하나만 요청하면 해당 파일을 그대로 씀
+        if len(include_formats) == 1 and include_formats[0] in LOCAL_FILE_FORMATS:
+            targets.add(include_formats[0])
+        # 로컬 파일 형식 외에는 파일을 먼저 만든 뒤 압축
+        for fmt in include_formats:
+            if fmt not in LOCAL_FILE_FORMATS and fmt != 'zip':
+                targets |= _export_targets(fmt, options)
+        return targets
+    
+    return {format_type}
+
+
+def _group_formats_by_target(formats: List[str], options: Dict[str, Any]) -> List[List[str]]:
+    """
+    같은 파일을 쓰는 형식끼리 묶어서 반환 (묶인 형식은 순서대로 실행해야 함)
+    
+    Args:
+        formats (List[str]): 내보내기 형식 목록
+        options (Dict[str, Any]): 형식별 추가 옵션
+        
+    Returns:
+        List[List[str]]: 요청 순서를 유지한 형식 묶음 목록
+    """
+    groups: List[Tuple[set, List[str]]] = []
+    for fmt in formats:
+        targets = _export_targets(fmt, options)
+        group_formats = [fmt]
+        for group in [group for group in groups if group[0] & targets]:
+            groups.remove(group)
+            targets = targets | group[0]
+            group_formats = group[1] + group_formats
+        groups.append((targets, sorted(group_formats, key=formats.index)))
+    return [group_formats for _, group_formats in groups]
+
+
+def _export_formats_serially(manager: 'ExportManager', content: Dict[str, Any], formats: List[str],
+                             filename: str, **kwargs) -> Dict[str, Optional[str]]:
+    """
+    형식 목록을 순서대로 내보내기 (실패한 형식은 None)
+    
+    Args:
+        manager (ExportManager): 내보내기 관리자
+        content (Dict[str, Any]): 내보낼 콘텐츠
+        formats (List[str]): 내보내기 형식 목록
+        filename (str): 기본 파일 이름
+        **kwargs: 각 형식별 추가 옵션
+        
+    Returns:
+        Dict[str, Optional[str]]: 형식별 출력 파일 경로
+    """
+    results = {}
+    for fmt in formats:
+        try:
+            results[fmt] = manager.export_to_format(content=content, format_type=fmt, filename=filename, **kwargs)
+        except Exception as e:
+            logger.error(f"{fmt} 형식으로 내보내기 실패: {str(e)}")
+            results[fmt] = None
+    return results
+
+
 def export_content(content: Dict[str, Any], formats: List[str], 
                   output_dir: Optional[Union[str, Path]] = None, 
                   filename: str = "export", **kwargs) -> Dict[str, str]:
@@ -1107,20 +1784,58 @@ def export_content(content: Dict[str, Any], formats: List[str],
     manager = ExportManager(output_dir)
     results = {}
     
-    for fmt in formats:
-        try:
-            output_path = manager.export_to_format(
-                content=content,
-                format_type=fmt,
-                filename=filename,
-                **kwargs
-            )
-            results[fmt] = output_path
-        except Exception as e:
-            logger.error(f"{fmt} 형식으로 내보내기 실패: {str(e)}")
-            results[fmt] = None
+    if not formats:
+        return results
     
-    return results
+    # 같은 파일을 쓰는 형식(예: md와 markdown 형식의 gdrive)은 한 묶음으로 순서대로 실행
+    groups = _group_formats_by_target(formats, kwargs)
+    
+    # 묶음이 하나뿐이면 스레드 풀 없이 바로 내보내기
+    if len(groups) == 1:
+        return _export_formats_serially(manager, content, groups[0], filename, **kwargs)
+    
+    # 서로 다른 파일을 쓰는 묶음끼리는 스레드로 동시에 수행
+    with ThreadPoolExecutor(max_workers=min(len(groups), 4)) as executor:
+        futures = [
+            executor.submit(_export_formats_serially, manager, content, group, filename, **kwargs)
+            for group in groups
+        ]
+        
+        for future in as_completed(futures):
+            results.update(future.result())
+    
+    # 요청한 형식 순서대로 결과 정렬
+    return {fmt: results[fmt] for fmt in formats}
+
+
+def _render_markdown_file(markdown_path: Path, css: Optional[str] = None,
+                          embed_css: bool = True) -> str:
+    """
+    마크다운 파일을 읽어 HTML 문서 문자열로 변환
+    
+    Args:
+        markdown_path (Path): 마크다운 파일 경로
+        css (Optional[str]): CSS 스타일시트 경로
+        embed_css (bool): False이면 스타일을 문서에 넣지 않음 (PDF 변환 시 별도 스타일시트 사용)
+        
+    Returns:
+        str: 완성된 HTML 문서
+    """
+    # 마크다운을 HTML로 변환
+    md_content = markdown_path.read_text(encoding="utf-8")
+    html_content = markdown.markdown(md_content, extensions=['tables', 'fenced_code'])
+    
+    # CSS 추가 (없으면 기본 스타일)
+    if not embed_css:
+        css_content = ""
+    else:
+        css_content = _read_css(css) if css and os.path.exists(css) else _DEFAULT_CSS
+    
+    return _HTML_DOCUMENT_TEMPLATE.format(
+        title=escape(markdown_path.stem),
+        style=css_content,
+        body=html_content
+    )
 
 
 def markdown_to_html(markdown_path: Union[str, Path], output_path: Optional[Union[str, Path]] = None, 
@@ -1144,76 +1859,11 @@ def markdown_to_html(markdown_path: Union[str, Path], output_path: Optional[Unio
         output_path = Path(output_path)
     
     try:
-        # 마크다운 파일 읽기
-        with open(markdown_path, "r", encoding="utf-8") as f:
-            md_content = f.read()
-        
-        # 마크다운을 HTML로 변환
-        html_content = markdown.markdown(md_content, extensions=['tables', 'fenced_code'])
-        
-        # CSS 추가
-        if css and os.path.exists(css):
-            with open(css, "r", encoding="utf-8") as f:
-                css_content = f.read()
-            html_template = f"""<!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>{markdown_path.stem}</title>
-                <style>
-                {css_content}
-                </style>
-            </head>
-            <body>
-                {html_content}
-            </body>
-            </html>
-            """
-        else:
-            # 기본 스타일
-            html_template = f"""<!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>{markdown_path.stem}</title>
-                <style>
-                body {{
-                    font-family: 'Noto Sans KR', Arial, sans-serif;
-                    line-height: 1.6;
-                    max-width: 900px;
-                    margin: 0 auto;
-                    padding: 20px;
-                    color: #333;
-                }}
-                h1, h2, h3, h4, h5, h6 {{
-                    margin-top: 1.5em;
-                    margin-bottom: 0.5em;
-                    color: #1a1a1a;
-                }}
-                h1 {{ font-size: 2.2em; border-bottom: 1px solid #eee; padding-bottom: 0.3em; }}
-                h2 {{ font-size: 1.8em; border-bottom: 1px solid #eee; padding-bottom: 0.3em; }}
-                h3 {{ font-size: 1.5em; }}
-                h4 {{ font-size: 1.3em; }}
-                table {{ border-collapse: collapse; width: 100%; margin: 1em 0; }}
-                th, td {{ border: 1px solid #ddd; padding: 8px 12px; text-align: left; }}
-                th {{ background-color: #f2f2f2; }}
-                img {{ max-width: 100%; height: auto; }}
-                code {{ background-color: #f5f5f5; padding: 2px 4px; border-radius: 3px; }}
-                pre {{ background-color: #f5f5f5; padding: 1em; overflow-x: auto; border-radius: 3px; }}
-                blockquote {{ background-color: #f9f9f9; border-left: 4px solid #ccc; margin: 1em 0; padding: 0.5em 1em; }}
-                </style>
-            </head>
-            <body>
-                {html_content}
-            </body>
-            </html>
-            """
+        # 마크다운 파일을 HTML 문서로 변환
+        html_template = _render_markdown_file(markdown_path, css)
         
         # 파일 작성
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_template)
+        output_path.write_text(html_template, encoding="utf-8")
         
         logger.info(f"HTML 파일 생성: {output_path}")
         return str(output_path)
@@ -1274,20 +1924,16 @@ def markdown_to_pdf(markdown_path: Union[str, Path], output_path: Optional[Union
         output_path = Path(output_path)
     
     try:
-        # 마크다운을 HTML로 변환 (임시 파일)
-        with tempfile.NamedTemporaryFile(suffix='.html', delete=False) as temp_html:
-            temp_html_path = temp_html.name
-        
-        html_path = markdown_to_html(markdown_path, temp_html_path, css)
-        
-        # HTML을 PDF로 변환
-        pdf_path = html_to_pdf(html_path, output_path)
-        
-        # 임시 HTML 파일 삭제
-        if os.path.exists(temp_html_path):
-            os.remove(temp_html_path)
+        # 임시 HTML 파일 없이 메모리에서 HTML 문서를 만들어 바로 PDF로 변환
+        # 사용자 CSS의 @font-face가 반영되도록 스타일시트와 같은 폰트 설정으로 렌더링
+        html_document = _render_markdown_file(markdown_path, embed_css=False)
+        font_config = FontConfiguration()
+        HTML(string=html_document, base_url=str(markdown_path.parent)).write_pdf(
+            str(output_path), stylesheets=_get_pdf_stylesheets(css, font_config), font_config=font_config
+        )
         
-        return pdf_path
+        logger.info(f"PDF 파일 생성: {output_path}")
+        return str(output_path)
         
     except Exception as e:
         logger.error(f"마크다운에서 PDF 변환 실패: {str(e)}")
@@ -1305,39 +1951,28 @@ def apply_ai_analysis_to_content(content: Dict[str, Any], ai_analysis: Dict[str,
     Returns:
         Dict[str, Any]: AI 분석이 통합된 기획서 콘텐츠
     """
-    updated_content = content.copy()
-    
-    # AI 분석 섹션 추가
-    if 'ai_analysis' not in updated_content:
-        updated_content['ai_analysis'] = {}
+    # 얕은 복사 후 변경하는 중첩 항목만 새로 만들어 원본 콘텐츠는 건드리지 않음 (copy-on-write)
+    updated_content = {**content}
     
     # 제공된 AI 분석 결과 통합
-    for key, value in ai_analysis.items():
-        updated_content['ai_analysis'][key] = value
+    updated_content['ai_analysis'] = {**content.get('ai_analysis', {}), **ai_analysis}
     
     # 개발 제안 업데이트 (AI 분석 내용이 있는 경우)
     if 'recommendations' in ai_analysis:
-        if 'development_recommendations' not in updated_content:
-            updated_content['development_recommendations'] = ''
-        
         ai_recommendations = "\n\n## AI 분석 기반 개선 제안\n\n"
         ai_recommendations += ai_analysis['recommendations']
         
-        updated_content['development_recommendations'] += ai_recommendations
+        updated_content['development_recommendations'] = content.get('development_recommendations', '') + ai_recommendations
     
-    # 디자인 분석 업데이트
-    if 'design_insights' in ai_analysis and 'design_analysis' in updated_content:
-        design = updated_content['design_analysis']
-        if isinstance(design, dict):
-            # AI 디자인 제안 추가
-            design['ai_insights'] = ai_analysis['design_insights']
+    # 디자인 분석 업데이트 (AI 디자인 제안 추가)
+    design = content.get('design_analysis')
+    if 'design_insights' in ai_analysis and isinstance(design, dict):
+        updated_content['design_analysis'] = {**design, 'ai_insights': ai_analysis['design_insights']}
     
-    # 기능 분석 업데이트
-    if 'functional_insights' in ai_analysis and 'functional_analysis' in updated_content:
-        func = updated_content['functional_analysis']
-        if isinstance(func, dict):
-            # AI 기능 제안 추가
-            func['ai_insights'] = ai_analysis['functional_insights']
+    # 기능 분석 업데이트 (AI 기능 제안 추가)
+    func = content.get('functional_analysis')
+    if 'functional_insights' in ai_analysis and isinstance(func, dict):
+        updated_content['functional_analysis'] = {**func, 'ai_insights': ai_analysis['functional_insights']}
     
     logger.info("AI 분석 결과가 기획서 콘텐츠에 통합되었습니다.")
     return updated_content
@@ -1360,95 +1995,96 @@ def generate_ai_analysis_report(content: Dict[str, Any], url: str,
     """
     manager = ExportManager(output_dir)
     
-    # AI 분석용 메타데이터 생성
-    ai_meta_path = manager.export_for_ai_analysis(content, url, filename)
+    # AI 분석용 메타데이터 생성 (파일로 저장한 메타데이터를 다시 읽지 않고 그대로 사용)
+    _, ai_metadata = manager._export_ai_metadata(content, url, filename)
     
     # 보고서 경로 설정
     output_path = manager.output_dir / f"{filename}.md"
     
     try:
-        # AI 메타데이터 로드
-        with open(ai_meta_path, "r", encoding="utf-8") as f:
-            ai_metadata = json.load(f)
         
-        # 마크다운 보고서 생성
-        md_parts = []
+        # 마크다운 보고서 생성 (줄 목록을 모았다가 합치지 않고 버퍼에 바로 기록)
+        buffer = io.StringIO()
+        write = buffer.write
+        
+        def add_line(line: str) -> None:
+            write(line)
+            write("\n")
         
-        md_parts.append(f"# AI 분석 보고서: {ai_metadata.get('title', '웹사이트 분석')}\n")
-        md_parts.append(f"URL: {ai_metadata.get('url', url)}\n")
-        md_parts.append(f"생성일: {ai_metadata.get('generation_date', '날짜 정보 없음')}\n")
+        add_line(f"# AI 분석 보고서: {ai_metadata.get('title', '웹사이트 분석')}\n")
+        add_line(f"URL: {ai_metadata.get('url', url)}\n")
+        add_line(f"생성일: {ai_metadata.get('generation_date', '날짜 정보 없음')}\n")
         
         # 웹사이트 기본 정보
-        md_parts.append("## 웹사이트 기본 정보\n")
+        add_line("## 웹사이트 기본 정보\n")
         if 'site_structure' in ai_metadata:
             site = ai_metadata['site_structure']
-            md_parts.append(f"- **제목**: {site.get('title', '제목 정보 없음')}")
-            md_parts.append(f"- **설명**: {site.get('meta_description', '설명 정보 없음')}")
+            add_line(f"- **제목**: {site.get('title', '제목 정보 없음')}")
+            add_line(f"- **설명**: {site.get('meta_description', '설명 정보 없음')}")
             
             # 이미지 통계
             if 'images' in site:
                 img_stats = site['images']
-                md_parts.append(f"- **이미지**: 총 {img_stats.get('count', 0)}개 " + 
-                              f"(대체 텍스트 있음: {img_stats.get('with_alt', 0)}개, " +
-                              f"없음: {img_stats.get('without_alt', 0)}개)")
+                add_line(f"- **이미지**: 총 {img_stats.get('count', 0)}개 " + 
+                     f"(대체 텍스트 있음: {img_stats.get('with_alt', 0)}개, " +
+                     f"없음: {img_stats.get('without_alt', 0)}개)")
             
             # 링크 통계
             if 'links' in site:
                 link_stats = site['links']
-                md_parts.append(f"- **링크**: 내부 {link_stats.get('internal_count', 0)}개, " +
-                              f"외부 {link_stats.get('external_count', 0)}개")
+                add_line(f"- **링크**: 내부 {link_stats.get('internal_count', 0)}개, " +
+                     f"외부 {link_stats.get('external_count', 0)}개")
         
         # 분석 제안 영역
-        md_parts.append("\n## AI 분석 제안 영역\n")
+        add_line("\n## AI 분석 제안 영역\n")
         if 'ai_analysis_hints' in ai_metadata and 'focus_areas' in ai_metadata['ai_analysis_hints']:
             for area in ai_metadata['ai_analysis_hints']['focus_areas']:
-                md_parts.append(f"- {area}")
+                add_line(f"- {area}")
         
         # 디자인 분석
         if 'design_analysis' in ai_metadata:
-            md_parts.append("\n## 디자인 분석\n")
+            add_line("\n## 디자인 분석\n")
             design = ai_metadata['design_analysis']
             
             if 'color_palette' in design:
-                md_parts.append("### 색상 팔레트\n")
+                add_line("### 색상 팔레트\n")
                 if isinstance(design['color_palette'], list):
                     for color in design['color_palette']:
-                        md_parts.append(f"- `{color}`")
+                        add_line(f"- `{color}`")
                 else:
-                    md_parts.append(design['color_palette'])
+                    add_line(design['color_palette'])
             
             if 'typography' in design:
-                md_parts.append("\n### 타이포그래피\n")
-                md_parts.append(design['typography'])
+                add_line("\n### 타이포그래피\n")
+                add_line(design['typography'])
             
             if 'layout' in design:
-                md_parts.append("\n### 레이아웃\n")
-                md_parts.append(design['layout'])
+                add_line("\n### 레이아웃\n")
+                add_line(design['layout'])
         
         # 페이지 구조
         if 'page_structure' in ai_metadata:
-            md_parts.append("\n## 페이지 구조\n")
+            add_line("\n## 페이지 구조\n")
             for page in ai_metadata['page_structure']:
-                if isinstance(page, dict) and 'name' in page:
-                    md_parts.append(f"### {page['name']}\n")
+                name = page.get('name') if isinstance(page, dict) else None
+                if name is not None:
+                    add_line(f"### {name}\n")
                     if 'description' in page:
-                        md_parts.append(f"{page['description']}\n")
+                        add_line(f"{page['description']}\n")
                     if 'components' in page and isinstance(page['components'], list):
-                        md_parts.append("#### 구성 요소\n")
+                        add_line("#### 구성 요소\n")
                         for component in page['components']:
-                            md_parts.append(f"- {component}")
+                            add_line(f"- {component}")
                 else:
-                    md_parts.append(f"- {page}\n")
+                    add_line(f"- {page}\n")
         
         # 개선 제안
         if 'ai_analysis_hints' in ai_metadata and 'expected_improvements' in ai_metadata['ai_analysis_hints']:
-            md_parts.append("\n## 개선 제안\n")
-            md_parts.append(ai_metadata['ai_analysis_hints']['expected_improvements'])
+            add_line("\n## 개선 제안\n")
+            add_line(ai_metadata['ai_analysis_hints']['expected_improvements'])
         
-        # 파일 작성
-        md_content = "\n".join(md_parts)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(md_content)
+        # 파일 작성 (한 번에 인코딩하여 기록)
+        output_path.write_bytes(buffer.getvalue().encode("utf-8"))
         
         logger.info(f"AI 분석 보고서 생성: {output_path}")
         return str(output_path)
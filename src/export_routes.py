@@ -5,20 +5,29 @@
 FastAPI 라우트를 제공합니다.
 """
 import os
-import json
+import asyncio
 import logging
+import orjson
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import quote
 from fastapi import Request, Form, BackgroundTasks, HTTPException
-from fastapi.responses import FileResponse, RedirectResponse, JSONResponse, HTMLResponse
+from fastapi.responses import FileResponse, ORJSONResponse, HTMLResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
 
+# 선택 의존성: 디자인 데이터 MessagePack 다운로드
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 # 내부 모듈 임포트
 from src.app_config import base_dir, outputs_dir as RESULTS_DIR, exports_dir as EXPORTS_DIR, templates
 from src.app_config import base_dir, templates_dir
 from src.app_config import DOTENV_PATH, EMAIL_TEMPLATE_PATH
 
 from src.utils.task_manager import get_task_status
-from src.export.export_manager import ExportManager
+from src.export.export_manager import ExportManager, TAR_ZST_AVAILABLE
 from src.export.email_sender import EmailSender, send_analysis_results
 
 # 안전한 템플릿 응답 헬퍼 함수 추가
@@ -86,6 +95,207 @@ def safe_template_response(request, template_name, context):
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 파싱된 JSON 캐시 최대 항목 수
+MAX_JSON_CACHE_SIZE = 256
+
+@lru_cache(maxsize=MAX_JSON_CACHE_SIZE)
+def _cached_json(path_str: str, mtime_ns: int):
+    """
+    (경로, 수정 시각) 단위로 파싱된 JSON 캐싱
+    
+    Args:
+        path_str: JSON 파일 경로
+        mtime_ns: 파일 수정 시각 (나노초, 변경 시 캐시 무효화용)
+        
+    Returns:
+        파싱된 JSON 데이터
+    """
+    return orjson.loads(Path(path_str).read_bytes())
+
+def _load_json(path: Path):
+    """
+    JSON 파일을 한 번에 읽어 파싱 (orjson 사용)
+    
+    같은 파일을 반복해서 다운로드할 때는 캐시된 결과를 반환하므로
+    호출하는 쪽에서 반환값을 수정하면 안 됩니다.
+    
+    Args:
+        path: JSON 파일 경로
+        
+    Returns:
+        파싱된 JSON 데이터
+    """
+    return _cached_json(str(path), path.stat().st_mtime_ns)
+
+def _content_disposition(filename: str) -> str:
+    """
+    첨부 파일 다운로드용 Content-Disposition 헤더 값 생성 (비ASCII 파일명은 RFC 5987 형식)
+    
+    Args:
+        filename: 다운로드 파일 이름
+        
+    Returns:
+        str: Content-Disposition 헤더 값
+    """
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+def _accepts_tar_zst(request: Request) -> bool:
+    """
+    클라이언트가 ZIP 대신 tar.zst 아카이브를 명시적으로 요청했는지 확인
+    
+    Args:
+        request: FastAPI 요청 객체
+        
+    Returns:
+        bool: Accept 헤더에 application/zstd가 있고 zstandard를 사용할 수 있으면 True
+    """
+    return TAR_ZST_AVAILABLE and "application/zstd" in request.headers.get("accept", "")
+
+def _file_download_response(file_path: str, filename: str, media_type: str,
+                            root_dir: Path = RESULTS_DIR, prefix_env: str = "XACCEL_OUTPUTS_PREFIX",
+                            default_prefix: str = "/_internal/outputs") -> Response:
+    """
+    디스크의 내보내기 파일 다운로드 응답 생성
+    
+    USE_XACCEL 환경 변수가 설정되어 있으면 파일 전송을 nginx에 맡기고(X-Accel-Redirect),
+    그렇지 않으면 FileResponse로 직접 전송합니다.
+    
+    Args:
+        file_path: 전송할 파일 경로
+        filename: 다운로드 파일 이름
+        media_type: 응답 MIME 타입
+        root_dir: nginx 내부 위치에 대응하는 디렉토리
+        prefix_env: nginx 내부 위치를 지정하는 환경 변수 이름
+        default_prefix: 환경 변수가 없을 때 사용할 nginx 내부 위치
+        
+    Returns:
+        Response: 다운로드 응답
+    """
+    if os.getenv("USE_XACCEL", "false").lower() in ("1", "true", "yes"):
+        # 기준 디렉토리 상대 경로를 nginx 내부 위치로 전달
+        internal_prefix = os.getenv(prefix_env, default_prefix).rstrip("/")
+        relative_path = Path(file_path).resolve().relative_to(root_dir.resolve()).as_posix()
+        return Response(
+            media_type=media_type,
+            headers={
+                "X-Accel-Redirect": f"{internal_prefix}/{quote(relative_path)}",
+                "Content-Disposition": _content_disposition(filename)
+            }
+        )
+    
+    return FileResponse(path=file_path, filename=filename, media_type=media_type)
+
+# 작업별 분석 결과가 저장되는 기본 디렉토리
+TASK_OUTPUTS_DIR = Path(base_dir) / "outputs"
+
+# /export 라우트에서 지원하는 내보내기 형식
+SUPPORTED_EXPORT_FORMATS = frozenset({"markdown", "md", "html", "pdf", "pptx", "json", "zip", "notion", "gdrive"})
+
+# 다운로드 유형별 미디어 타입과 파일 이름 형식 ({}는 사이트 제목)
+DOWNLOAD_MEDIA_TYPES = {
+    "zip": "application/zip",
+    "plan": "text/markdown",
+    "design": "application/json",
+    "ideas": "text/markdown",
+}
+# 내보내기 파일 확장자별 미디어 타입
+EXPORT_MEDIA_TYPES = {
+    ".md": "text/markdown",
+    ".html": "text/html",
+    ".pdf": "application/pdf",
+    ".pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+    ".json": "application/json",
+    ".zip": "application/zip",
+}
+DOWNLOAD_FILENAME_TEMPLATES = {
+    "zip": "{}_clone_plan.zip",
+    "plan": "{}_plan.md",
+    "design": "{}_design.json",
+    "ideas": "{}_ideas.md",
+}
+
+# 다운로드용 문서에 공통으로 들어가는 개발 제안 문구
+_DEFAULT_DEVELOPMENT_RECOMMENDATIONS = "웹사이트의 디자인과 구조를 분석한 결과, 모바일 최적화와 접근성을 고려한 개발이 필요합니다."
+
+def _build_website_info(ui_structure):
+    """
+    UI 구조 데이터에서 웹사이트 기본 정보 구성
+    
+    Args:
+        ui_structure: UI 구조 데이터
+        
+    Returns:
+        dict: 웹사이트 이름, URL, 설명
+    """
+    return {
+        "name": ui_structure.get("title", "웹사이트"),
+        "url": ui_structure.get("url", "https://example.com"),
+        "description": ui_structure.get("description", "")
+    }
+
+def _build_full_content(ui_structure, design_data):
+    """
+    기획서/ZIP 내보내기용 전체 콘텐츠 구성
+    
+    Args:
+        ui_structure: UI 구조 데이터
+        design_data: 디자인 요소 데이터
+        
+    Returns:
+        dict: 내보내기용 콘텐츠
+    """
+    return {
+        "title": f"{ui_structure.get('title', '웹사이트')} 클론 기획서",
+        "description": ui_structure.get("description", "웹사이트 분석 결과입니다."),
+        "website": _build_website_info(ui_structure),
+        "structure": {
+            "header": {
+                "logo": True,
+                "navigation": len(ui_structure.get("nav", [])) > 0
+            },
+            "main_sections": [page.get("title", "페이지") for page in ui_structure.get("pages", [])],
+            "footer": {
+                "copyright": True,
+                "social_links": False,
+                "contact_info": False
+            }
+        },
+        "design_analysis": {
+            "colors": design_data.get("colors", []),
+            "fonts": design_data.get("fonts", [{"name": "기본 폰트", "usage": "본문"}]),
+            "layout": design_data.get("layout_type", "표준 레이아웃")
+        },
+        "development_recommendations": _DEFAULT_DEVELOPMENT_RECOMMENDATIONS,
+        "conclusion": "이 웹사이트의 클론 개발은 약 2주 정도 소요될 것으로 예상됩니다."
+    }
+
+def _build_ideas_content(ui_structure):
+    """
+    개선 아이디어 문서용 콘텐츠 구성
+    
+    Args:
+        ui_structure: UI 구조 데이터
+        
+    Returns:
+        dict: 아이디어 문서 콘텐츠
+    """
+    return {
+        "title": f"{ui_structure.get('title', '웹사이트')} 개선 아이디어",
+        "website": _build_website_info(ui_structure),
+        "overview": "이 문서는 웹사이트 분석을 기반으로 한 개선 아이디어를 제공합니다.",
+        "development_recommendations": _DEFAULT_DEVELOPMENT_RECOMMENDATIONS
+    }
+
+# 파일로 내려받는 다운로드 유형별 (내보내기 메서드 이름, 파일 접미사, 콘텐츠 생성 함수)
+_DOWNLOAD_EXPORTERS = {
+    "plan": ("export_to_markdown", "plan", _build_full_content),
+    "design": ("export_to_json", "design", lambda ui_structure, design_data: design_data),
+    "ideas": ("export_to_markdown", "ideas", lambda ui_structure, design_data: _build_ideas_content(ui_structure)),
+}
+
 def register_export_routes(app):
     """내보내기 관련 라우트 등록"""
     
@@ -110,105 +320,70 @@ def register_export_routes(app):
         if task["status"] != "completed":
             raise HTTPException(status_code=400, detail="분석이 완료되지 않았습니다")
         
+        # 지원하지 않는 유형은 파일을 읽기 전에 거부
+        if type not in DOWNLOAD_MEDIA_TYPES:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 다운로드 유형: {type}")
+        
         # 메타데이터 파일 경로
-        meta_dir = Path(base_dir) / "outputs" / task_id / "meta"
-        output_dir = Path(base_dir) / "outputs" / task_id / "downloads"
+        meta_dir = TASK_OUTPUTS_DIR / task_id / "meta"
+        output_dir = TASK_OUTPUTS_DIR / task_id / "downloads"
         output_dir.mkdir(parents=True, exist_ok=True)
         
         # 내보내기 관리자 생성
         export_manager = ExportManager(output_dir)
         
-        try:
-            # UI 구조 데이터
-            ui_structure_path = meta_dir / "ui-structure.json"
-            if ui_structure_path.exists():
-                with open(ui_structure_path, "r", encoding="utf-8") as f:
-                    ui_structure = json.load(f)
-            else:
-                raise HTTPException(status_code=404, detail="분석 결과 데이터를 찾을 수 없습니다")
-            
-            # 디자인 요소 데이터
+        # UI 구조 데이터
+        ui_structure_path = meta_dir / "ui-structure.json"
+        if ui_structure_path.exists():
+            ui_structure = await asyncio.to_thread(_load_json, ui_structure_path)
+        else:
+            raise HTTPException(status_code=404, detail="분석 결과 데이터를 찾을 수 없습니다")
+        
+        download_name = DOWNLOAD_FILENAME_TEMPLATES[type].format(ui_structure.get('title', 'website'))
+        media_type = DOWNLOAD_MEDIA_TYPES[type]
+        
+        # 디자인 요소 데이터 (아이디어 문서에는 필요 없으므로 읽지 않음)
+        design_data = {}
+        if type != "ideas":
             design_path = meta_dir / "design-elements.json"
             if design_path.exists():
-                with open(design_path, "r", encoding="utf-8") as f:
-                    design_data = json.load(f)
-            else:
-                design_data = {}
-            
-            # 내보내기용 콘텐츠 구성
-            content = {
-                "title": f"{ui_structure.get('title', '웹사이트')} 클론 기획서",
-                "description": ui_structure.get("description", "웹사이트 분석 결과입니다."),
-                "website": {
-                    "name": ui_structure.get("title", "웹사이트"),
-                    "url": ui_structure.get("url", "https://example.com"),
-                    "description": ui_structure.get("description", "")
-                },
-                "structure": {
-                    "header": {
-                        "logo": True,
-                        "navigation": len(ui_structure.get("nav", [])) > 0
-                    },
-                    "main_sections": [page.get("title", "페이지") for page in ui_structure.get("pages", [])],
-                    "footer": {
-                        "copyright": True,
-                        "social_links": False,
-                        "contact_info": False
-                    }
-                },
-                "design_analysis": {
-                    "colors": design_data.get("colors", []),
-                    "fonts": design_data.get("fonts", [{"name": "기본 폰트", "usage": "본문"}]),
-                    "layout": design_data.get("layout_type", "표준 레이아웃")
-                },
-                "development_recommendations": "웹사이트의 디자인과 구조를 분석한 결과, 모바일 최적화와 접근성을 고려한 개발이 필요합니다.",
-                "conclusion": "이 웹사이트의 클론 개발은 약 2주 정도 소요될 것으로 예상됩니다."
-            }
+                design_data = await asyncio.to_thread(_load_json, design_path)
+        
+        # 클라이언트가 MessagePack을 요청하면 디자인 데이터를 바이너리로 바로 전송
+        if type == "design" and msgpack is not None and "application/msgpack" in request.headers.get("accept", ""):
+            return Response(
+                content=msgpack.packb(design_data, use_bin_type=True),
+                media_type="application/msgpack",
+                headers={"Content-Disposition": _content_disposition(f"{Path(download_name).stem}.msgpack")}
+            )
+        
+        if type == "zip":
+            # 모든 형식을 포함한 ZIP을 디스크에 만들지 않고 압축하는 대로 스트리밍
+            # (동기 제너레이터는 Starlette가 스레드 풀에서 순회하므로 이벤트 루프를 막지 않음)
+            content = _build_full_content(ui_structure, design_data)
             
-            # 파일 형식에 따라 내보내기
-            if type == "zip":
-                # 모든 형식을 포함한 ZIP 파일 생성
-                file_path = export_manager.export_to_zip(content, f"{task_id}_all")
-                return FileResponse(
-                    path=file_path,
-                    filename=f"{ui_structure.get('title', 'website')}_clone_plan.zip",
-                    media_type="application/zip"
-                )
-            elif type == "plan":
-                # 마크다운 형식의 기획서
-                file_path = export_manager.export_to_markdown(content, f"{task_id}_plan")
-                return FileResponse(
-                    path=file_path,
-                    filename=f"{ui_structure.get('title', 'website')}_plan.md",
-                    media_type="text/markdown"
-                )
-            elif type == "design":
-                # 디자인 요소 정보 (JSON)
-                file_path = export_manager.export_to_json(design_data, f"{task_id}_design")
-                return FileResponse(
-                    path=file_path,
-                    filename=f"{ui_structure.get('title', 'website')}_design.json",
-                    media_type="application/json"
+            # tar.zst를 요청한 클라이언트에는 더 빠른 zstd 압축 아카이브 전송
+            if _accepts_tar_zst(request):
+                return StreamingResponse(
+                    export_manager.stream_tar_zst(content, f"{task_id}_all"),
+                    media_type="application/zstd",
+                    headers={"Content-Disposition": _content_disposition(f"{Path(download_name).stem}.tar.zst")}
                 )
-            elif type == "ideas":
-                # 아이디어 정보 (마크다운)
-                ideas_content = {
-                    "title": f"{ui_structure.get('title', '웹사이트')} 개선 아이디어",
-                    "website": content["website"],
-                    "overview": "이 문서는 웹사이트 분석을 기반으로 한 개선 아이디어를 제공합니다.",
-                    "development_recommendations": content["development_recommendations"]
-                }
-                file_path = export_manager.export_to_markdown(ideas_content, f"{task_id}_ideas")
-                return FileResponse(
-                    path=file_path,
-                    filename=f"{ui_structure.get('title', 'website')}_ideas.md",
-                    media_type="text/markdown"
-                )
-            else:
-                raise HTTPException(status_code=400, detail=f"지원하지 않는 다운로드 유형: {type}")
             
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"다운로드 중 오류 발생: {str(e)}")
+            return StreamingResponse(
+                export_manager.stream_zip(content, f"{task_id}_all"),
+                media_type=media_type,
+                headers={"Content-Disposition": _content_disposition(download_name)}
+            )
+        
+        # 기획서/디자인/아이디어는 유형에 맞는 콘텐츠만 만들어 파일로 내보내기
+        method_name, suffix, build_content = _DOWNLOAD_EXPORTERS[type]
+        file_path = await asyncio.to_thread(
+            getattr(export_manager, method_name),
+            build_content(ui_structure, design_data),
+            f"{task_id}_{suffix}"
+        )
+        return _file_download_response(file_path, download_name, media_type)
 
     @app.get("/export/{result_id}/{format_type}", tags=["내보내기"])
     async def export_results(result_id: str, format_type: str, request: Request):
@@ -220,133 +395,145 @@ def register_export_routes(app):
         
         지정한 형식으로 결과를 내보내거나 외부 서비스(노션, 구글 드라이브)로 내보냅니다.
         """
-        try:
-            # 결과 파일 경로
-            result_path = RESULTS_DIR / f"{result_id}.json"
-            if not result_path.exists():
-                raise HTTPException(status_code=404, detail=f"결과 ID {result_id}를 찾을 수 없습니다.")
-            
-            # 결과 데이터 로드
-            with open(result_path, "r", encoding="utf-8") as f:
-                result_content = json.load(f)
-            
-            # 내보내기 형식 검증
-            format_type = format_type.lower()
-            supported_formats = ['markdown', 'md', 'html', 'pdf', 'pptx', 'json', 'zip', 'notion', 'gdrive']
-            if format_type not in supported_formats:
-                raise HTTPException(status_code=400, detail=f"지원하지 않는 내보내기 형식: {format_type}")
+        # 결과 파일 경로
+        result_path = RESULTS_DIR / f"{result_id}.json"
+        if not result_path.exists():
+            raise HTTPException(status_code=404, detail=f"결과 ID {result_id}를 찾을 수 없습니다.")
+        
+        # 내보내기 형식 검증 (결과 데이터를 읽기 전에 확인)
+        format_type = format_type.lower()
+        if format_type not in SUPPORTED_EXPORT_FORMATS:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 내보내기 형식: {format_type}")
+        
+        # 결과 데이터 로드
+        result_content = await asyncio.to_thread(_load_json, result_path)
+        
+        # 내보내기 관리자 설정 (애플리케이션 전역 인스턴스 재사용)
+        export_manager = request.app.state.export_manager_exports
+        
+        # 노션 내보내기는 특별 처리 (URL 반환)
+        if format_type == 'notion':
+            # 노션 내보내기 필수 설정 확인
+            parent_id = os.getenv("NOTION_PARENT_PAGE_ID")
+            api_key = os.getenv("NOTION_API_KEY")
             
-            # 내보내기 관리자 설정
-            export_manager = ExportManager(EXPORTS_DIR)
+            # 설정 누락 시 오류 응답
+            if not parent_id or not api_key:
+                return ORJSONResponse(
+                    status_code=400,
+                    content={
+                        "status": "error",
+                        "message": "노션 연동에 필요한 설정이 누락되었습니다. 환경 변수 NOTION_PARENT_PAGE_ID와 NOTION_API_KEY를 확인하세요."
+                    }
+                )
             
-            # 노션 내보내기는 특별 처리 (URL 반환)
-            if format_type == 'notion':
-                # 노션 내보내기 필수 설정 확인
-                parent_id = os.getenv("NOTION_PARENT_PAGE_ID")
-                api_key = os.getenv("NOTION_API_KEY")
-                
-                # 설정 누락 시 오류 응답
-                if not parent_id or not api_key:
-                    return JSONResponse(
-                        status_code=400,
-                        content={
-                            "status": "error",
-                            "message": "노션 연동에 필요한 설정이 누락되었습니다. 환경 변수 NOTION_PARENT_PAGE_ID와 NOTION_API_KEY를 확인하세요."
-                        }
-                    )
+            # 노션으로 내보내기
+            try:
+                page_url = await asyncio.to_thread(
+                    export_manager.export_to_notion,
+                    content=result_content,
+                    parent_id=parent_id,
+                    api_key=api_key
+                )
                 
-                # 노션으로 내보내기
-                try:
-                    page_url = export_manager.export_to_notion(
-                        content=result_content,
-                        parent_id=parent_id,
-                        api_key=api_key
-                    )
-                    
-                    # 성공 시 URL 반환
-                    return JSONResponse(
-                        content={
-                            "status": "success",
-                            "message": "노션 페이지로 내보내기가 완료되었습니다.",
-                            "url": page_url
-                        }
-                    )
-                except Exception as e:
-                    # 내보내기 실패 시 오류 반환
-                    return JSONResponse(
-                        status_code=500,
-                        content={
-                            "status": "error",
-                            "message": f"노션 페이지로 내보내기 실패: {str(e)}"
-                        }
-                    )
+                # 성공 시 URL 반환
+                return ORJSONResponse(
+                    content={
+                        "status": "success",
+                        "message": "노션 페이지로 내보내기가 완료되었습니다.",
+                        "url": page_url
+                    }
+                )
+            except Exception as e:
+                # 내보내기 실패 시 오류 반환
+                return ORJSONResponse(
+                    status_code=500,
+                    content={
+                        "status": "error",
+                        "message": f"노션 페이지로 내보내기 실패: {str(e)}"
+                    }
+                )
 
-            # 구글 드라이브 내보내기는 특별 처리 (URL 반환)
-            elif format_type == 'gdrive':
-                # 구글 드라이브 내보내기 필수 설정 확인
-                credentials_file = os.getenv("GOOGLE_CREDENTIALS_FILE")
-                
-                # 설정 누락 시 오류 응답
-                if not credentials_file or not os.path.exists(credentials_file):
-                    return JSONResponse(
-                        status_code=400,
-                        content={
-                            "status": "error",
-                            "message": "구글 드라이브 연동에 필요한 설정이 누락되었습니다. 환경 변수 GOOGLE_CREDENTIALS_FILE을 확인하세요."
-                        }
-                    )
-                
-                # 구글 드라이브로 내보내기 형식 설정
-                export_format = 'markdown'  # 기본값: 마크다운
-                
-                # 구글 드라이브로 내보내기
-                try:
-                    # 웹사이트 이름 추출
-                    website_name = result_content.get('website', {}).get('name', '웹사이트')
-                    folder_name = f"{website_name} 클론 기획서"
-                    
-                    drive_url = export_manager.export_to_google_drive(
-                        content=result_content,
-                        filename=f"{result_id}_plan",
-                        folder_name=folder_name,
-                        export_format=export_format,
-                        credentials_file=credentials_file
-                    )
-                    
-                    # 성공 시 URL 반환
-                    return JSONResponse(
-                        content={
-                            "status": "success",
-                            "message": "구글 드라이브로 내보내기가 완료되었습니다.",
-                            "url": drive_url
-                        }
-                    )
-                except Exception as e:
-                    # 내보내기 실패 시 오류 반환
-                    return JSONResponse(
-                        status_code=500,
-                        content={
-                            "status": "error",
-                            "message": f"구글 드라이브로 내보내기 실패: {str(e)}"
-                        }
-                    )
+        # 구글 드라이브 내보내기는 특별 처리 (URL 반환)
+        elif format_type == 'gdrive':
+            # 구글 드라이브 내보내기 필수 설정 확인
+            credentials_file = os.getenv("GOOGLE_CREDENTIALS_FILE")
             
-            # 다른 모든 형식은 파일 다운로드 처리
-            filename = f"{result_id}_{format_type}"
-            file_path = export_manager.export_to_format(result_content, filename, format_type)
+            # 설정 누락 시 오류 응답
+            if not credentials_file or not os.path.exists(credentials_file):
+                return ORJSONResponse(
+                    status_code=400,
+                    content={
+                        "status": "error",
+                        "message": "구글 드라이브 연동에 필요한 설정이 누락되었습니다. 환경 변수 GOOGLE_CREDENTIALS_FILE을 확인하세요."
+                    }
+                )
             
-            # 파일 다운로드 URL로 리다이렉트
-            download_url = f"/download/{os.path.basename(file_path)}"
-            return RedirectResponse(url=download_url, status_code=303)
+            # 구글 드라이브로 내보내기 형식 설정
+            export_format = 'markdown'  # 기본값: 마크다운
             
-        except HTTPException:
-            raise
-        except Exception as e:
-            # 일반 오류 처리
-            raise HTTPException(status_code=500, detail=f"내보내기 처리 중 오류 발생: {str(e)}")
+            # 구글 드라이브로 내보내기
+            try:
+                # 웹사이트 이름 추출
+                website_name = result_content.get('website', {}).get('name', '웹사이트')
+                folder_name = f"{website_name} 클론 기획서"
+                
+                drive_url = await asyncio.to_thread(
+                    export_manager.export_to_google_drive,
+                    content=result_content,
+                    filename=f"{result_id}_plan",
+                    folder_name=folder_name,
+                    export_format=export_format,
+                    credentials_file=credentials_file
+                )
+                
+                # 성공 시 URL 반환
+                return ORJSONResponse(
+                    content={
+                        "status": "success",
+                        "message": "구글 드라이브로 내보내기가 완료되었습니다.",
+                        "url": drive_url
+                    }
+                )
+            except Exception as e:
+                # 내보내기 실패 시 오류 반환
+                return ORJSONResponse(
+                    status_code=500,
+                    content={
+                        "status": "error",
+                        "message": f"구글 드라이브로 내보내기 실패: {str(e)}"
+                    }
+                )
+        
+        # ZIP 요청이고 클라이언트가 tar.zst를 받을 수 있으면 파일을 만들지 않고 스트리밍
+        if format_type == 'zip' and _accepts_tar_zst(request):
+            return StreamingResponse(
+                export_manager.stream_tar_zst(result_content, f"{result_id}_zip"),
+                media_type="application/zstd",
+                headers={"Content-Disposition": _content_disposition(f"{result_id}_zip.tar.zst")}
+            )
+        
+        # 다른 모든 형식은 파일 다운로드 처리
+        filename = f"{result_id}_{format_type}"
+        file_path = await asyncio.to_thread(
+            export_manager.export_to_format,
+            content=result_content,
+            format_type='md' if format_type == 'markdown' else format_type,
+            filename=filename
+        )
+        
+        # 리다이렉트 없이 같은 응답으로 바로 파일 전송
+        return _file_download_response(
+            file_path,
+            os.path.basename(file_path),
+            EXPORT_MEDIA_TYPES.get(Path(file_path).suffix, "application/octet-stream"),
+            root_dir=EXPORTS_DIR,
+            prefix_env="XACCEL_EXPORTS_PREFIX",
+            default_prefix="/_internal/exports"
+        )
 
     @app.post("/send-email/{result_id}", tags=["내보내기"])
-    async def send_email_results(result_id: str, email: str = Form(...), background_tasks: BackgroundTasks = None):
+    async def send_email_results(request: Request, result_id: str, email: str = Form(...), background_tasks: BackgroundTasks = None):
         """
         분석 결과를 이메일로 전송
         
@@ -355,92 +542,116 @@ def register_export_routes(app):
         
         분석 결과를 첨부 파일과 함께 지정된 이메일 주소로 전송합니다.
         """
-        try:
-            # 결과 데이터 로드
-            result_path = RESULTS_DIR / f"{result_id}.json"
-            if not result_path.exists():
-                return JSONResponse(
-                    status_code=404,
-                    content={"status": "error", "message": f"결과 ID {result_id}를 찾을 수 없습니다."}
-                )
-            
-            with open(result_path, "r", encoding="utf-8") as f:
-                result_content = json.load(f)
-            
-            # 첨부할 파일 목록 준비
-            export_manager = ExportManager(EXPORTS_DIR)
-            result_files = []
-            
-            # 마크다운 파일 생성 및 첨부
+        # 결과 데이터 로드
+        result_path = RESULTS_DIR / f"{result_id}.json"
+        if not result_path.exists():
+            return ORJSONResponse(
+                status_code=404,
+                content={"status": "error", "message": f"결과 ID {result_id}를 찾을 수 없습니다."}
+            )
+        
+        result_content = await asyncio.to_thread(_load_json, result_path)
+        
+        # 첨부할 파일 목록 준비 (애플리케이션 전역 인스턴스 재사용)
+        export_manager = request.app.state.export_manager_exports
+        result_files = []
+        
+        # 마크다운/JSON은 한 번만 만들어 개별 첨부와 ZIP에 함께 사용 (병렬 생성)
+        md_bytes, json_bytes = await asyncio.gather(
+            asyncio.to_thread(export_manager._render_markdown, result_content),
+            asyncio.to_thread(export_manager._render_json, result_content),
+            return_exceptions=True
+        )
+        
+        # 마크다운 파일 생성 및 첨부
+        if isinstance(md_bytes, Exception):
+            logger.error(f"마크다운 생성 오류: {str(md_bytes)}")
+            md_bytes = None
+        else:
             try:
-                md_file = export_manager.export_to_format(result_content, f"{result_id}_plan", format="markdown")
+                md_file = await asyncio.to_thread(
+                    export_manager.export_to_markdown, result_content, f"{result_id}_plan", rendered=md_bytes
+                )
                 result_files.append(md_file)
             except Exception as e:
                 logger.error(f"마크다운 생성 오류: {str(e)}")
-            
-            # JSON 파일 생성 및 첨부
+        
+        # JSON 파일 생성 및 첨부
+        if isinstance(json_bytes, Exception):
+            logger.error(f"JSON 생성 오류: {str(json_bytes)}")
+            json_bytes = None
+        else:
             try:
-                json_file = export_manager.export_to_format(result_content, f"{result_id}_data", format="json")
+                json_file = await asyncio.to_thread(
+                    export_manager.export_to_json, result_content, f"{result_id}_data", rendered=json_bytes
+                )
                 result_files.append(json_file)
             except Exception as e:
                 logger.error(f"JSON 생성 오류: {str(e)}")
-            
-            # 모든 파일을 ZIP으로 압축하여 첨부
+        
+        # 모든 파일을 ZIP으로 압축하여 첨부 (이미 만든 마크다운/JSON 재사용)
+        try:
+            zip_file = await asyncio.to_thread(
+                export_manager.export_to_zip, result_content, f"{result_id}_all",
+                md=md_bytes, json_bytes=json_bytes
+            )
+            result_files.append(zip_file)
+        except Exception as e:
+            logger.error(f"ZIP 생성 오류: {str(e)}")
+        
+        # 이메일 전송 함수 정의
+        async def send_email_task():
             try:
-                zip_file = export_manager.export_to_format(result_content, f"{result_id}_all", format="zip")
-                result_files.append(zip_file)
-            except Exception as e:
-                logger.error(f"ZIP 생성 오류: {str(e)}")
-            
-            # 이메일 전송 함수 정의
-            async def send_email_task():
-                try:
-                    # 백그라운드에서 이메일 전송
-                    success = await send_analysis_results(
-                        to_email=email,
-                        result_content=result_content,
-                        result_files=result_files,
-                        template_path=EMAIL_TEMPLATE_PATH
-                    )
-                    
-                    logger.info(f"이메일 전송 결과: {success}")
-                    return success
-                except Exception as e:
-                    logger.error(f"이메일 전송 오류: {str(e)}")
-                    return False
-            
-            if background_tasks:
                 # 백그라운드에서 이메일 전송
-                background_tasks.add_task(send_email_task)
-                response_message = f"{email} 주소로 결과를 전송하고 있습니다."
-            else:
-                # 동기적으로 이메일 전송
-                email_sender = EmailSender()
-                success = email_sender.send_results_email(
+                success = await send_analysis_results(
                     to_email=email,
-                    subject=f"홈페이지 클론 기획서 - {result_content.get('title', '분석 결과')}",
                     result_content=result_content,
                     result_files=result_files,
                     template_path=EMAIL_TEMPLATE_PATH
                 )
                 
-                response_message = f"{email} 주소로 결과가 전송되었습니다." if success else "이메일 전송 중 오류가 발생했습니다."
-            
-            return JSONResponse(
-                content={
-                    "status": "success",
-                    "message": response_message
-                }
-            )
+                logger.info(f"이메일 전송 결과: {success}")
+                return success
+            except Exception as e:
+                logger.error(f"이메일 전송 오류: {str(e)}")
+                return False
         
-        except Exception as e:
-            logger.error(f"이메일 전송 처리 오류: {str(e)}")
-            return JSONResponse(
-                status_code=500,
-                content={"status": "error", "message": f"이메일 전송 처리 중 오류가 발생했습니다: {str(e)}"}
+        if background_tasks:
+            # 백그라운드에서 이메일 전송
+            background_tasks.add_task(send_email_task)
+            response_message = f"{email} 주소로 결과를 전송하고 있습니다."
+        else:
+            # 동기적으로 이메일 전송
+            email_sender = request.app.state.email_sender
+            success = await asyncio.to_thread(
+                email_sender.send_results_email,
+                to_email=email,
+                subject=f"홈페이지 클론 기획서 - {result_content.get('title', '분석 결과')}",
+                result_content=result_content,
+                result_files=result_files,
+                template_path=EMAIL_TEMPLATE_PATH
             )
+            
+            response_message = f"{email} 주소로 결과가 전송되었습니다." if success else "이메일 전송 중 오류가 발생했습니다."
+        
+        return ORJSONResponse(
+            content={
+                "status": "success",
+                "message": response_message
+            }
+        )
 
 def init_export_routes(app):
     """내보내기 라우트 초기화"""
+    # 요청마다 새로 만들지 않도록 내보내기 관리자/이메일 전송기를 한 번만 생성
+    app.state.export_manager_exports = ExportManager(EXPORTS_DIR)
+    app.state.email_sender = EmailSender()
+    
+    async def close_export_resources():
+        """애플리케이션 종료 시 내보내기 관리자의 HTTP 세션 정리"""
+        app.state.export_manager_exports.close()
+        logger.info("내보내기 리소스 정리 완료")
+    
+    app.add_event_handler("shutdown", close_export_resources)
     register_export_routes(app)
     logger.info("내보내기 라우트 초기화 완료") 
\ No newline at end of file
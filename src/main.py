@@ -29,9 +29,27 @@ def create_application():
     logger.info("애플리케이션 초기화 완료")
     return app
 
-app = create_application()  # uvicorn이 인식할 수 있도록 전역 app에 할당
+# 생성된 애플리케이션 (처음 요청될 때 한 번만 생성)
+_app = None
 
-# 애플리케이션 중복 초기화 방지 (제거)
-# if __name__ != "__main__":
-#     # 애플리케이션 초기화
-#     create_application() 
\ No newline at end of file
+def get_app():
+    """
+    애플리케이션 팩토리 (uvicorn --factory 용)
+    
+    모듈을 임포트하는 것만으로는 앱을 만들지 않으므로 API 문서 생성 등에서
+    라우트 등록/템플릿 로드 등의 초기화 비용을 피할 수 있습니다.
+    실행 예: uvicorn src.main:get_app --factory
+    
+    Returns:
+        FastAPI: 초기화된 애플리케이션
+    """
+    global _app
+    if _app is None:
+        _app = create_application()
+    return _app
+
+def __getattr__(name):
+    """기존 `from src.main import app` 사용처를 위해 app 속성 접근 시에만 애플리케이션 생성"""
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
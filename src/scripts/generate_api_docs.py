@@ -4,6 +4,7 @@ API 문서 생성 스크립트
 
 이 스크립트는 FastAPI 애플리케이션의 API 문서를 자동으로 생성합니다.
 실행 방법: python -m src.scripts.generate_api_docs main:app --output-dir docs
+팩토리 함수도 지정할 수 있습니다: python -m src.scripts.generate_api_docs src.main:get_app
 """
 import argparse
 import importlib.util
@@ -16,6 +17,8 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from fastapi import FastAPI
+
 from src.utils.api_docs_generator import generate_api_docs
 
 # 로깅 설정
@@ -28,7 +31,7 @@ logger = logging.getLogger(__name__)
 def main():
     """메인 함수"""
     parser = argparse.ArgumentParser(description="FastAPI 애플리케이션의 API 문서 생성")
-    parser.add_argument("app_path", help="FastAPI 앱 모듈 경로 (예: main:app)")
+    parser.add_argument("app_path", help="FastAPI 앱 또는 앱 팩토리 경로 (예: main:app, src.main:get_app)")
     parser.add_argument("--output-dir", "-o", default="docs", help="출력 디렉토리 경로")
     parser.add_argument("--title", "-t", default="홈페이지 클론 기획서 생성기 API 문서", help="문서 제목")
     parser.add_argument("--description", "-d", 
@@ -51,17 +54,31 @@ def main():
         try:
             # 먼저 일반적인 방법으로 모듈 임포트 시도
             module = importlib.import_module(module_path)
-        except ImportError:
-            # 실패하면 파일 경로로 로드 시도
+        except ModuleNotFoundError as e:
+            # 모듈 자체를 찾지 못한 경우에만 파일 경로로 로드 시도
+            # (모듈 내부의 임포트 오류는 다시 로드해도 같은 오류가 나므로 그대로 전달)
+            if e.name != module_path:
+                raise
+            
             logger.info(f"파일 경로로 모듈 로드 시도: {module_path}.py")
             spec = importlib.util.spec_from_file_location(module_path, f"{module_path}.py")
             if not spec or not spec.loader:
                 raise ImportError(f"모듈을 찾을 수 없습니다: {module_path}")
                 
             module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            # 실행 전에 등록해 같은 프로세스의 이후 임포트가 모듈 캐시를 사용하도록 함
+            sys.modules[module_path] = module
+            try:
+                spec.loader.exec_module(module)
+            except Exception:
+                sys.modules.pop(module_path, None)
+                raise
         
         app = getattr(module, app_var)
+        
+        # 앱 팩토리 함수가 지정된 경우 호출하여 앱 생성
+        if not isinstance(app, FastAPI) and callable(app):
+            app = app()
         logger.info(f"FastAPI 앱 로드 완료: {app_var}")
         
         # 문서 형식 파싱
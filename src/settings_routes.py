@@ -4,10 +4,15 @@
 이 모듈은 API 키 설정, 서비스 모드 설정 등 설정 관련 기능을 위한 FastAPI 라우트를 제공합니다.
 """
 import os
+import re
+import time
+import hashlib
 import logging
+import httpx
+from urllib.parse import quote_plus
 from fastapi import Request, Form
-from fastapi.responses import RedirectResponse, JSONResponse, HTMLResponse
-from dotenv import load_dotenv, set_key
+from fastapi.responses import Response, ORJSONResponse, HTMLResponse
+from dotenv import dotenv_values
 
 # 내부 모듈 임포트
 from src.app_config import templates
@@ -19,6 +24,119 @@ DOTENV_PATH = base_dir / ".env"
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# API 연결 테스트 타임아웃 (초)
+API_TEST_TIMEOUT = 5.0
+
+# OpenAI 키 검증 결과 캐시 유지 시간 (초) 및 최대 항목 수
+OPENAI_PROBE_TTL = 60
+MAX_OPENAI_PROBE_CACHE_SIZE = 32
+
+# 캐시할 OpenAI 키 검증 상태 코드 (유효/무효가 확정된 경우만, 429·5xx는 매번 다시 확인)
+CACHEABLE_PROBE_STATUS = {200, 401, 403}
+
+# OpenAI 키 검증 결과 캐시 (키 해시 -> (확인 시각, 상태 코드))
+_openai_probe_cache = {}
+
+async def _probe_openai(http, api_key):
+    """
+    가벼운 모델 목록 요청으로 OpenAI API 키 유효성 확인 (짧은 시간 동안 결과 캐싱)
+    
+    Args:
+        http: 공유 httpx.AsyncClient
+        api_key: OpenAI API 키
+        
+    Returns:
+        int: 응답 상태 코드
+    """
+    # 키 원문 대신 해시를 캐시 키로 사용
+    key_hash = hashlib.blake2b(api_key.encode(), digest_size=8).hexdigest()
+    now = time.monotonic()
+    cached = _openai_probe_cache.get(key_hash)
+    if cached and now - cached[0] < OPENAI_PROBE_TTL:
+        return cached[1]
+    
+    response = await http.get(
+        "https://api.openai.com/v1/models",
+        params={"limit": 1},
+        headers={"Authorization": f"Bearer {api_key}"}
+    )
+    
+    # 키 유효성이 확정된 결과만 캐시 (가득 차면 가장 오래된 항목 제거)
+    if response.status_code in CACHEABLE_PROBE_STATUS:
+        if len(_openai_probe_cache) >= MAX_OPENAI_PROBE_CACHE_SIZE:
+            _openai_probe_cache.pop(next(iter(_openai_probe_cache)))
+        _openai_probe_cache[key_hash] = (now, response.status_code)
+    return response.status_code
+
+# 컴파일된 템플릿 캐시 (템플릿 이름 -> jinja2 Template)
+_compiled_templates = {}
+
+# .env 파일에서 키 이름을 찾는 패턴 (export 접두사 허용)
+_ENV_LINE_PATTERN = re.compile(r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_.]*)\s*=")
+
+# .env 파일 내용 캐시 (파일 수정 시각이 바뀔 때만 다시 파싱)
+_env_cache = {"mtime": 0, "values": {}}
+
+def _get_env():
+    """
+    캐시된 .env 파일 값 반환 (파일이 변경된 경우에만 다시 읽음)
+    
+    Returns:
+        dict: .env 파일의 키-값
+    """
+    try:
+        mtime = DOTENV_PATH.stat().st_mtime
+    except FileNotFoundError:
+        return {}
+    
+    if mtime != _env_cache["mtime"]:
+        _env_cache.update(mtime=mtime, values=dotenv_values(DOTENV_PATH))
+    return _env_cache["values"]
+
+def _write_env_values(updates):
+    """
+    여러 설정 값을 .env 파일에 한 번에 기록 (기존 주석/순서 유지, 임시 파일로 원자적 교체)
+    
+    Args:
+        updates: 저장할 키-값 (None 값은 건너뜀)
+    """
+    updates = {key: value for key, value in updates.items() if value is not None}
+    if not updates:
+        return
+    
+    lines = DOTENV_PATH.read_text(encoding="utf-8").splitlines() if DOTENV_PATH.exists() else []
+    
+    # 기존 키는 제자리에서 교체하고, 없는 키는 끝에 추가 (set_key와 같은 작은따옴표 형식)
+    written = set()
+    for index, line in enumerate(lines):
+        match = _ENV_LINE_PATTERN.match(line)
+        if match and match.group(1) in updates:
+            key = match.group(1)
+            lines[index] = _format_env_line(key, updates[key])
+            written.add(key)
+    lines.extend(_format_env_line(key, value) for key, value in updates.items() if key not in written)
+    
+    tmp_path = DOTENV_PATH.with_name(DOTENV_PATH.name + ".tmp")
+    tmp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    os.replace(tmp_path, DOTENV_PATH)
+    
+    # 애플리케이션 재시작 없이 적용되도록 프로세스 환경 변수에도 반영
+    os.environ.update(updates)
+
+def _format_env_line(key, value):
+    """
+    .env 파일의 한 줄 생성
+    
+    Args:
+        key: 환경 변수 이름
+        value: 값
+        
+    Returns:
+        str: KEY='value' 형식의 줄
+    """
+    escaped = value.replace("'", "\\'")
+    return f"{key}='{escaped}'"
+
 # 안전한 템플릿 응답 헬퍼 함수 추가
 def safe_template_response(request, template_name, context):
     """
@@ -82,6 +200,37 @@ def safe_template_response(request, template_name, context):
         """
         return HTMLResponse(content=error_html, status_code=500)
 
+def render_cached_template(request, template_name, context):
+    """
+    컴파일된 템플릿 객체를 캐시해 두고 바로 렌더링하는 헬퍼 함수
+    
+    Args:
+        request: FastAPI 요청 객체
+        template_name: 템플릿 파일 이름
+        context: 템플릿 렌더링 컨텍스트
+        
+    Returns:
+        HTMLResponse: 렌더링된 HTML 응답
+    """
+    template = _compiled_templates.get(template_name)
+    
+    # 캐시에 없거나 (자동 리로드 환경에서) 템플릿 파일이 바뀌었으면 다시 로드
+    if template is None or (template.environment.auto_reload and not template.is_up_to_date):
+        # 앱의 템플릿 환경이 준비되지 않았으면 기존 안전 헬퍼로 처리
+        from src.app_config import app
+        app_templates = getattr(getattr(app, 'state', None), 'templates', None)
+        if app_templates is None:
+            return safe_template_response(request, template_name, context)
+        
+        try:
+            template = app_templates.get_template(template_name)
+        except Exception as e:
+            logger.error(f"템플릿 로드 오류: {str(e)}")
+            return safe_template_response(request, template_name, context)
+        _compiled_templates[template_name] = template
+    
+    return HTMLResponse(template.render(context))
+
 def register_settings_routes(app):
     """설정 관련 라우트 등록"""
     
@@ -108,19 +257,21 @@ def register_settings_routes(app):
         }
         
         try:
-            for key, value in settings_to_save.items():
-                if value is not None:  # 값이 있는 경우에만 저장 (빈 문자열도 저장)
-                    set_key(dotenv_path=DOTENV_PATH, key_to_set=key, value_to_set=value)
+            # 값이 있는 항목만 (빈 문자열 포함) .env 파일에 한 번에 저장하고 환경 변수에 반영
+            _write_env_values(settings_to_save)
             
-            # 변경된 환경 변수를 즉시 로드 (선택 사항, 애플리케이션 재시작 없이 적용하려면)
-            load_dotenv(override=True) 
+            # 설정 페이지가 새 값을 읽도록 .env 캐시 무효화
+            _env_cache["mtime"] = 0
             
             # 성공 메시지와 함께 리다이렉트
-            return RedirectResponse(url="/settings?message=success", status_code=303)
+            return Response(status_code=303, headers={"location": "/settings?message=success"})
         except Exception as e:
             logger.error(f"설정 저장 중 오류 발생: {str(e)}")
             # 오류 발생 시 오류 메시지와 함께 리다이렉트
-            return RedirectResponse(url=f"/settings?message=error&detail={str(e)}", status_code=303)
+            return Response(
+                status_code=303,
+                headers={"location": f"/settings?message=error&detail={quote_plus(str(e))}"}
+            )
 
     @app.get("/settings", response_class=HTMLResponse, tags=["설정"])
     async def settings_page(request: Request):
@@ -129,26 +280,30 @@ def register_settings_routes(app):
         
         각종 API 설정을 관리하는 페이지를 표시합니다.
         """
-        # 매번 최신 .env 파일 내용 로드
-        load_dotenv(override=True) 
+        # 최신 .env 파일 내용 (변경된 경우에만 다시 파싱), 파일에 없는 키는 프로세스 환경 변수 사용
+        env = _get_env()
+        
+        def get_setting(key, default):
+            value = env.get(key)
+            return value if value is not None else os.getenv(key, default)
         
         api_settings = {
-            "image_gen_mode": os.getenv("IMAGE_GEN_MODE", "free"),
-            "openai_api_key": os.getenv("OPENAI_API_KEY", ""), # 키는 기본값을 빈 문자열로
-            "local_sd_url": os.getenv("LOCAL_SD_API_URL", "http://localhost:7860/sdapi/v1"),
-            "idea_gen_mode": os.getenv("IDEA_GEN_MODE", "free"),
-            "deepseek_api_key": os.getenv("DEEPSEEK_API_KEY", ""),
-            "local_ollama_url": os.getenv("LOCAL_OLLAMA_API_URL", "http://localhost:11434/api"),
-            "ollama_model": os.getenv("OLLAMA_MODEL", "mistral"),
-            "code_gen_mode": os.getenv("CODE_GEN_MODE", "free"),
-            "claude_api_key": os.getenv("CLAUDE_API_KEY", ""),
-            "local_code_url": os.getenv("LOCAL_CODE_API_URL", "http://localhost:8080/v1"),
+            "image_gen_mode": get_setting("IMAGE_GEN_MODE", "free"),
+            "openai_api_key": get_setting("OPENAI_API_KEY", ""), # 키는 기본값을 빈 문자열로
+            "local_sd_url": get_setting("LOCAL_SD_API_URL", "http://localhost:7860/sdapi/v1"),
+            "idea_gen_mode": get_setting("IDEA_GEN_MODE", "free"),
+            "deepseek_api_key": get_setting("DEEPSEEK_API_KEY", ""),
+            "local_ollama_url": get_setting("LOCAL_OLLAMA_API_URL", "http://localhost:11434/api"),
+            "ollama_model": get_setting("OLLAMA_MODEL", "mistral"),
+            "code_gen_mode": get_setting("CODE_GEN_MODE", "free"),
+            "claude_api_key": get_setting("CLAUDE_API_KEY", ""),
+            "local_code_url": get_setting("LOCAL_CODE_API_URL", "http://localhost:8080/v1"),
         }
         
         message = request.query_params.get("message")
         detail = request.query_params.get("detail")
         
-        return safe_template_response(
+        return render_cached_template(
             request,
             "settings.html", 
             {
@@ -172,103 +327,118 @@ def register_settings_routes(app):
         # API 유효성 테스트 로직 구현
         try:
             if api_type == "openai":
-                import openai
                 api_key = os.getenv("OPENAI_API_KEY", "")
                 if not api_key:
-                    return JSONResponse(
+                    return ORJSONResponse(
                         status_code=400,
                         content={"status": "error", "message": "OpenAI API 키가 설정되지 않았습니다."}
                     )
                 
-                # OpenAI API 테스트
-                openai.api_key = api_key
-                models = openai.models.list()
-                return JSONResponse(
-                    content={"status": "success", "message": "OpenAI API 연결에 성공했습니다."}
-                )
+                # OpenAI API 테스트 (SDK 없이 모델 1개만 요청)
+                status_code = await _probe_openai(request.app.state.http, api_key)
+                if status_code == 200:
+                    return ORJSONResponse(
+                        content={"status": "success", "message": "OpenAI API 연결에 성공했습니다."}
+                    )
+                else:
+                    return ORJSONResponse(
+                        status_code=400,
+                        content={"status": "error", "message": f"OpenAI API 연결에 실패했습니다: {status_code}"}
+                    )
                 
             elif api_type == "deepseek":
                 api_key = os.getenv("DEEPSEEK_API_KEY", "")
                 if not api_key:
-                    return JSONResponse(
+                    return ORJSONResponse(
                         status_code=400,
                         content={"status": "error", "message": "Deepseek API 키가 설정되지 않았습니다."}
                     )
                 
                 # Deepseek API 테스트는 실제 구현 필요 (여기서는 간단히 키 존재 여부만 확인)
-                return JSONResponse(
+                return ORJSONResponse(
                     content={"status": "success", "message": "Deepseek API 키가 설정되어 있습니다. 실제 연결 테스트가 필요합니다."}
                 )
                 
             elif api_type == "claude":
                 api_key = os.getenv("CLAUDE_API_KEY", "")
                 if not api_key:
-                    return JSONResponse(
+                    return ORJSONResponse(
                         status_code=400,
                         content={"status": "error", "message": "Claude API 키가 설정되지 않았습니다."}
                     )
                 
                 # Anthropic Claude API 테스트는 실제 구현 필요 (여기서는 간단히 키 존재 여부만 확인)
-                return JSONResponse(
+                return ORJSONResponse(
                     content={"status": "success", "message": "Claude API 키가 설정되어 있습니다. 실제 연결 테스트가 필요합니다."}
                 )
                 
             elif api_type == "local_sd":
-                import requests
                 url = os.getenv("LOCAL_SD_API_URL", "http://localhost:7860/sdapi/v1")
                 if not url:
-                    return JSONResponse(
+                    return ORJSONResponse(
                         status_code=400,
                         content={"status": "error", "message": "Stable Diffusion API URL이 설정되지 않았습니다."}
                     )
                 
                 # Stable Diffusion API 연결 테스트
-                response = requests.get(f"{url}/options", timeout=5)
+                response = await request.app.state.http.get(f"{url}/options")
                 if response.status_code == 200:
-                    return JSONResponse(
+                    return ORJSONResponse(
                         content={"status": "success", "message": "Stable Diffusion API 연결에 성공했습니다."}
                     )
                 else:
-                    return JSONResponse(
+                    return ORJSONResponse(
                         status_code=400,
                         content={"status": "error", "message": f"Stable Diffusion API 연결에 실패했습니다: {response.status_code}"}
                     )
                     
             elif api_type == "local_ollama":
-                import requests
                 url = os.getenv("LOCAL_OLLAMA_API_URL", "http://localhost:11434/api")
                 if not url:
-                    return JSONResponse(
+                    return ORJSONResponse(
                         status_code=400,
                         content={"status": "error", "message": "Ollama API URL이 설정되지 않았습니다."}
                     )
                 
                 # Ollama API 연결 테스트
-                response = requests.get(f"{url}/tags", timeout=5)
+                response = await request.app.state.http.get(f"{url}/tags")
                 if response.status_code == 200:
-                    return JSONResponse(
+                    return ORJSONResponse(
                         content={"status": "success", "message": "Ollama API 연결에 성공했습니다."}
                     )
                 else:
-                    return JSONResponse(
+                    return ORJSONResponse(
                         status_code=400,
                         content={"status": "error", "message": f"Ollama API 연결에 실패했습니다: {response.status_code}"}
                     )
                     
             else:
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=400,
                     content={"status": "error", "message": f"지원하지 않는 API 유형: {api_type}"}
                 )
                 
-        except Exception as e:
+        except httpx.HTTPError as e:
+            # 연결 실패/시간 초과는 테스트 결과로 안내 (그 외 오류는 전역 예외 핸들러가 처리)
             logger.error(f"API 테스트 중 오류 발생: {str(e)}")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content={"status": "error", "message": f"API 테스트 중 오류가 발생했습니다: {str(e)}"}
             )
 
 def init_settings_routes(app):
     """설정 라우트 초기화"""
+    # API 연결 테스트용 공유 HTTP 클라이언트 (요청마다 연결을 새로 맺지 않도록 연결 풀 재사용)
+    app.state.http = httpx.AsyncClient(
+        timeout=API_TEST_TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=32)
+    )
+    
+    async def close_http_client():
+        """애플리케이션 종료 시 공유 HTTP 클라이언트 정리"""
+        await app.state.http.aclose()
+        logger.info("설정 HTTP 클라이언트 종료 완료")
+    
+    app.add_event_handler("shutdown", close_http_client)
     register_settings_routes(app)
     logger.info("설정 라우트 초기화 완료") 
\ No newline at end of file
@@ -3,16 +3,109 @@
 
 이 모듈은 웹사이트 분석 작업 상태 확인, 작업 관리 등의 기능을 위한 FastAPI 라우트를 제공합니다.
 """
+import asyncio
+import hashlib
+import heapq
 import logging
-import json
+import orjson
+from collections import Counter
 from pathlib import Path
 from datetime import datetime, timedelta
 from fastapi import Request, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import ORJSONResponse, HTMLResponse, Response
+from fastapi.templating import Jinja2Templates
 
 # 내부 모듈 임포트
-from src.app_config import base_dir, templates
-from src.utils.task_manager import get_task_status, get_all_tasks, delete_task
+import src.app_config as app_config
+from src.app_config import base_dir, templates_dir
+from src.utils.task_manager import get_task_status, get_all_tasks, get_tasks_version, get_tasks_revision, delete_task, delete_tasks_bulk
+
+def _json_bytes_response(payload):
+    """
+    미리 인코딩한 JSON 바이트로 응답 생성 (응답 클래스의 render 단계 생략)
+    
+    Content-Length는 Starlette가 바이트 길이로 바로 설정합니다.
+    
+    Args:
+        payload: JSON으로 인코딩할 데이터
+        
+    Returns:
+        Response: JSON 응답
+    """
+    return Response(content=orjson.dumps(payload), media_type="application/json")
+
+# 작업 목록 페이지 템플릿 이름
+TASKS_TEMPLATE_NAME = "tasks.html"
+
+# 한 번 결정한 템플릿 객체 (요청마다 대체 경로를 다시 탐색하지 않도록 캐시)
+_resolved_templates = None
+
+def _resolve_templates():
+    """
+    사용할 템플릿 객체를 한 번만 결정하여 캐시
+    
+    전역 템플릿, app.state.templates, app.templates 순으로 확인하고
+    모두 없으면 템플릿 디렉토리로 새 객체를 생성합니다.
+    
+    Returns:
+        Jinja2Templates: 템플릿 객체
+    """
+    global _resolved_templates
+    if _resolved_templates is not None:
+        return _resolved_templates
+    
+    app = app_config.app
+    candidates = (
+        app_config.templates,
+        getattr(getattr(app, 'state', None), 'templates', None),
+        getattr(app, 'templates', None),
+    )
+    resolved = next((candidate for candidate in candidates if candidate is not None), None)
+    if resolved is None:
+        logger.warning("템플릿 객체가 없어 새로 생성합니다.")
+        resolved = Jinja2Templates(directory=str(templates_dir))
+    
+    _resolved_templates = resolved
+    return resolved
+
+# 작업 목록 페이지의 컴파일된 템플릿 (시작 시 한 번 로드)
+_tasks_template = None
+
+def _load_tasks_template():
+    """
+    작업 목록 템플릿을 미리 컴파일하여 캐시
+    
+    Returns:
+        Template: 컴파일된 템플릿 (로드할 수 없으면 None)
+    """
+    global _tasks_template
+    try:
+        _tasks_template = _resolve_templates().get_template(TASKS_TEMPLATE_NAME)
+    except Exception as e:
+        logger.error(f"작업 목록 템플릿 로드 오류: {str(e)}")
+        _tasks_template = None
+    return _tasks_template
+
+def render_tasks_page(request, context):
+    """
+    캐시된 작업 목록 템플릿으로 바로 렌더링
+    
+    Args:
+        request: FastAPI 요청 객체
+        context: 템플릿 렌더링 컨텍스트
+        
+    Returns:
+        HTMLResponse: 렌더링된 HTML 응답
+    """
+    template = _tasks_template
+    
+    # 아직 로드되지 않았거나 (자동 리로드 환경에서) 템플릿 파일이 바뀌었으면 다시 로드
+    if template is None or (template.environment.auto_reload and not template.is_up_to_date):
+        template = _load_tasks_template()
+        if template is None:
+            return safe_template_response(request, TASKS_TEMPLATE_NAME, context)
+    
+    return HTMLResponse(template.render(context))
 
 # 안전한 템플릿 응답 헬퍼 함수 추가
 def safe_template_response(request, template_name, context):
@@ -27,41 +120,10 @@ def safe_template_response(request, template_name, context):
     Returns:
         HTMLResponse: 렌더링된 HTML 응답
     """
-    from fastapi.templating import Jinja2Templates
-    from src.app_config import templates_dir
-    from fastapi.responses import HTMLResponse
-    
-    # 글로벌 템플릿 객체 사용 시도
-    global templates
-    
-    if templates is not None:
-        try:
-            return templates.TemplateResponse(template_name, context)
-        except Exception as e:
-            logger.error(f"글로벌 템플릿 렌더링 오류: {str(e)}")
-    
-    # app.state.templates에서 템플릿 객체 가져오기 시도
-    from src.app_config import app
-    if hasattr(app, 'state') and hasattr(app.state, 'templates') and app.state.templates is not None:
-        try:
-            return app.state.templates.TemplateResponse(template_name, context)
-        except Exception as e:
-            logger.error(f"app.state.templates 렌더링 오류: {str(e)}")
-    
-    # app.templates에서 템플릿 객체 가져오기 시도
-    if hasattr(app, 'templates') and app.templates is not None:
-        try:
-            return app.templates.TemplateResponse(template_name, context)
-        except Exception as e:
-            logger.error(f"app.templates 렌더링 오류: {str(e)}")
-    
-    # 임시 템플릿 객체 생성
     try:
-        logger.warning(f"템플릿 객체 생성 및 렌더링: {template_name}")
-        temp_templates = Jinja2Templates(directory=str(templates_dir))
-        return temp_templates.TemplateResponse(template_name, context)
+        return _resolve_templates().TemplateResponse(template_name, context)
     except Exception as e:
-        logger.error(f"임시 템플릿 객체 렌더링 오류: {str(e)}")
+        logger.error(f"템플릿 렌더링 오류: {str(e)}")
         # 단순 HTML 오류 페이지 반환
         error_html = f"""
         <!DOCTYPE html>
@@ -80,63 +142,210 @@ def safe_template_response(request, template_name, context):
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 응답 생성을 스레드로 넘기는 작업 수 기준
+LARGE_TASK_SET_THRESHOLD = 500
+
+# 요약 API에서 집계하는 작업 상태
+TASK_STATUSES = ("completed", "running", "error", "pending")
+
+# 작업 목록 페이지에 기본으로 표시하는 작업 수
+DEFAULT_TASK_PAGE_LIMIT = 100
+
+# 최신순으로 정렬한 작업 목록 캐시 (작업 목록 버전이 바뀔 때만 다시 정렬, limit이 None이면 전체 목록)
+_sorted_tasks_cache = {"version": None, "limit": None, "tasks": []}
+
+def _task_sort_key(task):
+    """
+    작업 정렬 키 (생성 시각이 없는 작업은 가장 최신으로 취급)
+    
+    Args:
+        task: 작업 정보
+        
+    Returns:
+        tuple: (생성 시각 없음 여부, 생성 시각 ISO 문자열)
+    """
+    created_at = task.get("created_at")
+    return (created_at is None, created_at or "")
+
+def _get_sorted_tasks(limit=None):
+    """
+    최신순으로 정렬된 작업 목록 반환 (작업이 추가/삭제되지 않았으면 캐시 사용)
+    
+    limit이 전체 작업 수보다 작으면 전체 정렬 대신 heapq.nlargest로 상위 작업만 선택합니다.
+    
+    Args:
+        limit: 반환할 최대 작업 수 (None이면 전체)
+        
+    Returns:
+        list: 생성 시각 역순으로 정렬된 작업 목록 (생성 시각이 없는 작업이 가장 앞)
+    """
+    version = get_tasks_version()
+    cached_limit = _sorted_tasks_cache["limit"]
+    if _sorted_tasks_cache["version"] == version and (
+        cached_limit is None or (limit is not None and limit <= cached_limit)
+    ):
+        return _sorted_tasks_cache["tasks"][:limit]
+    
+    tasks = get_all_tasks().values()
+    if limit is not None and limit < len(tasks):
+        sorted_tasks = heapq.nlargest(limit, tasks, key=_task_sort_key)
+    else:
+        limit = None
+        sorted_tasks = sorted(tasks, key=_task_sort_key, reverse=True)
+    
+    _sorted_tasks_cache.update(version=version, limit=limit, tasks=sorted_tasks)
+    return sorted_tasks
+
+# 작업 목록 응답 캐시 (작업 저장소 리비전이 바뀔 때만 다시 인코딩)
+_tasks_api_cache = {"revision": None, "etag": None, "body": b""}
+
+# 작업 목록 페이지 ETag 캐시 (리비전과 limit이 같으면 렌더링 없이 304 응답)
+_tasks_page_etag = {"key": None, "etag": None}
+
+def _make_etag(body):
+    """
+    응답 본문으로 강한 ETag 생성
+    
+    Args:
+        body: 응답 본문 바이트
+        
+    Returns:
+        str: 따옴표로 감싼 ETag 값
+    """
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+def _etag_matches(request, etag):
+    """
+    요청의 If-None-Match 헤더가 ETag와 일치하는지 확인
+    
+    Args:
+        request: FastAPI 요청 객체
+        etag: 현재 ETag 값
+        
+    Returns:
+        bool: 클라이언트 캐시가 유효하면 True
+    """
+    if etag is None:
+        return False
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return etag in candidates or "*" in candidates
+
+def _not_modified_response(etag):
+    """
+    본문 없는 304 응답 생성
+    
+    Args:
+        etag: 현재 ETag 값
+        
+    Returns:
+        Response: 304 응답
+    """
+    return Response(status_code=304, headers={"ETag": etag})
+
+async def tasks_summary_endpoint(request):
+    """
+    작업 상태 요약 API
+    
+    모든 작업의 상태 통계를 반환합니다.
+    FastAPI 의존성 해석과 응답 검증을 거치지 않는 Starlette 엔드포인트입니다.
+    
+    Args:
+        request: Starlette 요청 객체
+        
+    Returns:
+        Response: 상태별 작업 수 JSON 응답
+    """
+    # 모든 작업 가져오기
+    tasks = get_all_tasks()
+    
+    # 상태별 작업 수는 Counter로 집계 (C 구현 루프에서 상태마다 한 번만 해시)
+    statuses = Counter(task.get("status") for task in tasks.values())
+    status_counts = {"total": len(tasks)}
+    status_counts.update((status, statuses.get(status, 0)) for status in TASK_STATUSES)
+    
+    # created_at은 ISO 8601 문자열로 저장되므로 문자열 비교로 판단
+    cutoff = (datetime.now() - timedelta(days=1)).isoformat(timespec="microseconds")
+    status_counts["recent"] = sum(
+        1 for task in tasks.values()
+        if (created_at := task.get("created_at")) is not None and created_at > cutoff
+    )
+    
+    return _json_bytes_response(status_counts)
+
 def register_task_routes(app):
     """작업 관리 관련 라우트 등록"""
     
     @app.get("/tasks", response_class=HTMLResponse, tags=["작업"])
-    async def list_tasks(request: Request):
+    async def list_tasks(request: Request, limit: int = DEFAULT_TASK_PAGE_LIMIT):
         """
         작업 목록 조회
         
-        모든 작업 목록을 표시하는 관리 페이지입니다.
+        - **limit**: 표시할 최대 작업 수 (0 이하이면 전체)
+        
+        작업 목록을 최신순으로 표시하는 관리 페이지입니다.
         """
-        # 모든 작업 가져오기
-        tasks = get_all_tasks()
+        page_limit = limit if limit > 0 else None
+        
+        # 작업 내용이 그대로이고 클라이언트가 같은 페이지를 가지고 있으면 렌더링 생략
+        page_key = (get_tasks_revision(), page_limit)
+        if _tasks_page_etag["key"] == page_key and _etag_matches(request, _tasks_page_etag["etag"]):
+            return _not_modified_response(_tasks_page_etag["etag"])
         
-        # 작업을 최신순으로 정렬
-        sorted_tasks = sorted(
-            tasks.values(),
-            key=lambda t: t.get("created_at", datetime.now()), 
-            reverse=True
-        )
+        # 최신순으로 정렬된 작업 목록 (작업 추가/삭제가 없으면 캐시 사용)
+        sorted_tasks = _get_sorted_tasks(page_limit)
+        context = {
+            "request": request,
+            "title": "작업 관리",
+            "tasks": sorted_tasks,
+            "limit": page_limit,
+            "total_tasks": len(get_all_tasks())
+        }
+        
+        # 작업이 많으면 렌더링이 이벤트 루프를 막지 않도록 스레드에서 처리
+        if len(sorted_tasks) > LARGE_TASK_SET_THRESHOLD:
+            response = await asyncio.to_thread(render_tasks_page, request, context)
+        else:
+            response = render_tasks_page(request, context)
         
-        # 템플릿 반환
-        return safe_template_response(
-            request,
-            "tasks.html",
-            {
-                "request": request,
-                "title": "작업 관리",
-                "tasks": sorted_tasks
-            }
-        )
+        # 정상 렌더링된 페이지만 ETag 부여 (오류 페이지는 캐시하지 않음)
+        if response.status_code == 200:
+            etag = _make_etag(response.body)
+            _tasks_page_etag.update(key=page_key, etag=etag)
+            response.headers["ETag"] = etag
+        
+        return response
     
-    @app.get("/api/tasks", response_class=JSONResponse, tags=["작업"])
-    async def get_tasks_api():
+    @app.get("/api/tasks", response_class=ORJSONResponse, tags=["작업"])
+    async def get_tasks_api(request: Request):
         """
         작업 목록 API
         
         모든 작업 목록을 JSON 형식으로 반환합니다.
+        If-None-Match 헤더가 현재 ETag와 같으면 본문 없이 304를 반환합니다.
         """
-        # 모든 작업 가져오기
-        tasks = get_all_tasks()
-        
-        # JSON 직렬화를 위해 datetime 객체를 문자열로 변환
-        serializable_tasks = {}
-        for task_id, task in tasks.items():
-            serializable_task = task.copy()
-            
-            # datetime 객체 ISO 형식으로 변환
-            if isinstance(task.get("created_at"), datetime):
-                serializable_task["created_at"] = task["created_at"].isoformat()
-            if isinstance(task.get("updated_at"), datetime):
-                serializable_task["updated_at"] = task["updated_at"].isoformat()
-                
-            serializable_tasks[task_id] = serializable_task
+        # 작업 내용이 바뀌었을 때만 다시 인코딩하고 ETag 갱신
+        revision = get_tasks_revision()
+        if _tasks_api_cache["revision"] != revision:
+            # 작업 시각은 저장 시 ISO 문자열로 기록되므로 변환/복사 없이 인코딩
+            tasks = get_all_tasks()
             
-        return {"tasks": serializable_tasks}
+            # 작업이 많으면 JSON 인코딩이 이벤트 루프를 막지 않도록 스레드에서 처리
+            if len(tasks) > LARGE_TASK_SET_THRESHOLD:
+                body = await asyncio.to_thread(orjson.dumps, {"tasks": tasks})
+            else:
+                body = orjson.dumps({"tasks": tasks})
+            _tasks_api_cache.update(revision=revision, etag=_make_etag(body), body=body)
+        
+        etag = _tasks_api_cache["etag"]
+        if _etag_matches(request, etag):
+            return _not_modified_response(etag)
+        
+        return Response(content=_tasks_api_cache["body"], media_type="application/json", headers={"ETag": etag})
     
-    @app.delete("/api/tasks/{task_id}", response_class=JSONResponse, tags=["작업"])
+    @app.delete("/api/tasks/{task_id}", response_class=ORJSONResponse, tags=["작업"])
     async def delete_task_api(task_id: str):
         """
         작업 삭제 API
@@ -149,7 +358,7 @@ def register_task_routes(app):
             # 작업 존재 여부 확인
             task = get_task_status(task_id)
             if not task:
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=404,
                     content={"status": "error", "message": f"작업 {task_id}를 찾을 수 없습니다."}
                 )
@@ -157,17 +366,17 @@ def register_task_routes(app):
             # 작업 삭제
             delete_task(task_id)
             
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"status": "success", "message": f"작업 {task_id}가 삭제되었습니다."}
             )
         except Exception as e:
             logger.error(f"작업 삭제 중 오류 발생: {str(e)}")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content={"status": "error", "message": f"작업 삭제 중 오류가 발생했습니다: {str(e)}"}
             )
     
-    @app.get("/api/tasks/{task_id}", response_class=JSONResponse, tags=["작업"])
+    @app.get("/api/tasks/{task_id}", response_class=ORJSONResponse, tags=["작업"])
     async def get_task_api(task_id: str):
         """
         단일 작업 상태 API
@@ -179,45 +388,18 @@ def register_task_routes(app):
         task = get_task_status(task_id)
         
         if not task:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=404,
                 content={"status": "error", "message": f"작업 {task_id}를 찾을 수 없습니다."}
             )
         
-        # datetime 객체 ISO 형식으로 변환
-        serializable_task = task.copy()
-        if isinstance(task.get("created_at"), datetime):
-            serializable_task["created_at"] = task["created_at"].isoformat()
-        if isinstance(task.get("updated_at"), datetime):
-            serializable_task["updated_at"] = task["updated_at"].isoformat()
-            
-        return serializable_task
+        # 작업 시각은 저장 시 ISO 문자열로 기록되므로 그대로 인코딩해 반환
+        return _json_bytes_response(task)
     
-    @app.get("/api/tasks/status/summary", response_class=JSONResponse, tags=["작업"])
-    async def get_tasks_summary_api():
-        """
-        작업 상태 요약 API
-        
-        모든 작업의 상태 통계를 반환합니다.
-        """
-        # 모든 작업 가져오기
-        tasks = get_all_tasks()
-        
-        # 상태별 작업 수 계산
-        status_counts = {
-            "total": len(tasks),
-            "completed": sum(1 for t in tasks.values() if t.get("status") == "completed"),
-            "running": sum(1 for t in tasks.values() if t.get("status") == "running"),
-            "error": sum(1 for t in tasks.values() if t.get("status") == "error"),
-            "pending": sum(1 for t in tasks.values() if t.get("status") == "pending"),
-            "recent": sum(1 for t in tasks.values() if t.get("created_at") and 
-                          isinstance(t["created_at"], datetime) and 
-                          t["created_at"] > datetime.now() - timedelta(days=1))
-        }
-        
-        return status_counts
+    # 대시보드가 자주 폴링하는 요약 API는 의존성 주입/응답 검증 없이 Starlette 라우트로 직접 등록
+    app.router.add_route("/api/tasks/status/summary", tasks_summary_endpoint, methods=["GET"])
     
-    @app.post("/api/tasks/clean", response_class=JSONResponse, tags=["작업"])
+    @app.post("/api/tasks/clean", response_class=ORJSONResponse, tags=["작업"])
     async def clean_old_tasks_api(days: int = 7):
         """
         오래된 작업 정리 API
@@ -230,19 +412,17 @@ def register_task_routes(app):
             # 모든 작업 가져오기
             tasks = get_all_tasks()
             
-            now = datetime.now()
-            cutoff_date = now - timedelta(days=days)
+            # 기준 시각은 루프 전에 한 번만 계산 (created_at은 ISO 8601 문자열)
+            cutoff_iso = (datetime.now() - timedelta(days=days)).isoformat(timespec="microseconds")
             
-            deleted_count = 0
-            for task_id, task in list(tasks.items()):
-                created_at = task.get("created_at")
-                
-                # datetime 객체인 경우에만 비교
-                if isinstance(created_at, datetime) and created_at < cutoff_date:
-                    delete_task(task_id)
-                    deleted_count += 1
+            # 기준일보다 오래된 작업 ID를 모아 한 번에 삭제
+            expired_ids = [
+                task_id for task_id, task in tasks.items()
+                if (created_at := task.get("created_at")) is not None and created_at < cutoff_iso
+            ]
+            deleted_count = delete_tasks_bulk(expired_ids)
             
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
                     "status": "success", 
                     "message": f"{deleted_count}개의 오래된 작업이 삭제되었습니다.",
@@ -252,12 +432,14 @@ def register_task_routes(app):
             
         except Exception as e:
             logger.error(f"작업 정리 중 오류 발생: {str(e)}")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content={"status": "error", "message": f"작업 정리 중 오류가 발생했습니다: {str(e)}"}
             )
 
 def init_task_routes(app):
     """작업 관리 라우트 초기화"""
+    # 첫 요청 전에 템플릿 객체를 결정하고 작업 목록 템플릿을 미리 컴파일
+    app.add_event_handler("startup", _load_tasks_template)
     register_task_routes(app)
     logger.info("작업 관리 라우트 초기화 완료") 
\ No newline at end of file
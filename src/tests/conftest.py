@@ -0,0 +1,30 @@
+"""
+테스트 공용 fixture
+
+여러 테스트 모듈에서 함께 사용하는 fixture를 정의합니다.
+"""
+import asyncio
+import pytest
+import pytest_asyncio
+from src.api.api_client import BaseAPIClient
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """세션 전체에서 공유하는 이벤트 루프 (세션 범위 비동기 fixture용)"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def base_api_client():
+    """
+    세션 동안 재사용하는 BaseAPIClient 인스턴스
+
+    httpx.AsyncClient와 캐시 생성을 테스트마다 반복하지 않도록 한 번만 생성합니다.
+    테스트 간 변경되는 상태는 각 테스트 모듈에서 초기화합니다.
+    """
+    client = BaseAPIClient(api_key="test_key", base_url="https://api.example.com")
+    yield client
+    await client.close()
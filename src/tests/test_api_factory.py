@@ -4,192 +4,97 @@ API 클라이언트 팩토리 테스트
 이 모듈은 API 클라이언트 팩토리 함수(create_api_client_by_mode)를 테스트합니다.
 """
 import pytest
-import os
-import asyncio
-from unittest.mock import patch, AsyncMock, MagicMock
-from src.api.api_client import create_api_client_by_mode
-
-
-@pytest.mark.asyncio
-async def test_create_api_client_by_mode_image_gen_paid():
-    """유료 이미지 생성 API 클라이언트 생성 테스트"""
-    # 모듈 및 클래스 모킹
-    with patch('src.api.api_client.create_api_client') as mock_create_client:
-        # 모킹된 API 클라이언트 설정
-        mock_client = AsyncMock()
-        mock_client.validate_api_key = AsyncMock(return_value=True)
-        mock_create_client.return_value = mock_client
-        
-        # 테스트 설정
-        config = {
-            "api_keys": {"dalle": "test_key"},
-            "api": {"image_gen_mode": "free"}  # 모드 설정과 관계없이 paid가 우선
-        }
-        
-        # 함수 호출
-        client = await create_api_client_by_mode("paid", "image_gen", config)
-        
-        # 검증
-        mock_create_client.assert_called_once_with("openai", config)
-        assert client == mock_client
-
-
-@pytest.mark.asyncio
-async def test_create_api_client_by_mode_image_gen_free():
-    """무료 이미지 생성 API 클라이언트 생성 테스트"""
-    # 모듈 및 클래스 모킹
-    with patch('src.api.api_client.create_api_client') as mock_create_client:
-        # 모킹된 API 클라이언트 설정
-        mock_client = AsyncMock()
-        mock_client.validate_api_connection = AsyncMock(return_value=True)
-        mock_create_client.return_value = mock_client
-        
-        # 테스트 설정
-        config = {
-            "api": {"local_sd_url": "http://localhost:7860"}
-        }
-        
-        # 함수 호출
-        client = await create_api_client_by_mode("free", "image_gen", config)
-        
-        # 검증
-        mock_create_client.assert_called_once_with("stable_diffusion", config)
-        assert client == mock_client
-
-
-@pytest.mark.asyncio
-async def test_create_api_client_by_mode_idea_gen_paid():
-    """유료 아이디어 생성 API 클라이언트 생성 테스트"""
-    # 모듈 및 클래스 모킹
-    with patch('src.api.api_client.create_api_client') as mock_create_client:
-        # 모킹된 API 클라이언트 설정
-        mock_client = AsyncMock()
-        mock_client.validate_api_key = AsyncMock(return_value=True)
-        mock_create_client.return_value = mock_client
-        
-        # 테스트 설정
-        config = {
-            "api_keys": {"claude": "test_key"},
-            "api": {"idea_gen_mode": "free"}  # 모드 설정과 관계없이 paid가 우선
-        }
-        
-        # 함수 호출
-        client = await create_api_client_by_mode("paid", "idea_gen", config)
-        
-        # 검증
-        mock_create_client.assert_called_once_with("anthropic", config)
-        assert client == mock_client
-
-
-@pytest.mark.asyncio
-async def test_create_api_client_by_mode_idea_gen_free():
-    """무료 아이디어 생성 API 클라이언트 생성 테스트"""
-    # 모듈 및 클래스 모킹
-    with patch('src.api.api_client.create_api_client') as mock_create_client:
-        # 모킹된 API 클라이언트 설정
-        mock_client = AsyncMock()
-        mock_client.validate_api_connection = AsyncMock(return_value=True)
-        mock_create_client.return_value = mock_client
-        
-        # 테스트 설정
-        config = {
-            "api": {"local_ollama_url": "http://localhost:11434"}
-        }
-        
-        # 함수 호출
-        client = await create_api_client_by_mode("free", "idea_gen", config)
-        
-        # 검증
-        mock_create_client.assert_called_once_with("ollama", config)
-        assert client == mock_client
-
-
-@pytest.mark.asyncio
-async def test_create_api_client_by_mode_code_gen_paid():
-    """유료 코드 생성 API 클라이언트 생성 테스트"""
-    # 모듈 및 클래스 모킹
-    with patch('src.api.api_client.create_api_client') as mock_create_client:
-        # 모킹된 API 클라이언트 설정
-        mock_client = AsyncMock()
-        mock_client.validate_api_key = AsyncMock(return_value=True)
-        mock_create_client.return_value = mock_client
-        
-        # 테스트 설정
-        config = {
-            "api_keys": {"dalle": "test_key"},  # OpenAI API 키 사용
-            "api": {"code_gen_mode": "free"}  # 모드 설정과 관계없이 paid가 우선
-        }
-        
-        # 함수 호출
-        client = await create_api_client_by_mode("paid", "code_gen", config)
-        
-        # 검증
-        mock_create_client.assert_called_once_with("openai", config)
-        assert client == mock_client
-
-
-@pytest.mark.asyncio
-async def test_create_api_client_by_mode_code_gen_free():
-    """무료 코드 생성 API 클라이언트 생성 테스트"""
+from unittest.mock import patch, AsyncMock
+from src.api.api_client import BaseAPIClient, create_api_client_by_mode
+
+# 모듈의 모든 테스트를 asyncio 테스트로 실행
+pytestmark = pytest.mark.asyncio
+
+
+# 테스트에서 공유하는 읽기 전용 설정
+_CFG_DALLE = {
+    "api_keys": {"dalle": "test_key"},  # OpenAI API 키 사용
+    "api": {"image_gen_mode": "free", "code_gen_mode": "free"}  # 모드 설정과 관계없이 paid가 우선
+}
+_CFG_SD = {
+    "api": {"local_sd_url": "http://localhost:7860"}
+}
+_CFG_CLAUDE = {
+    "api_keys": {"claude": "test_key"},
+    "api": {"idea_gen_mode": "free"}  # 모드 설정과 관계없이 paid가 우선
+}
+_CFG_OLLAMA = {
+    "api": {"local_ollama_url": "http://localhost:11434"}
+}
+_CFG_OVERRIDE_PAID = {
+    "api_keys": {"dalle": "test_key"},
+    "api": {"image_gen_mode": "paid"}  # 설정에서 paid 모드 지정
+}
+_CFG_EMPTY = {}
+
+
+async def _validation_ok():
+    """항상 성공하는 유효성 검증 (호출 기록이 필요 없으므로 AsyncMock 대신 사용)"""
+    return True
+
+
+async def _validation_error():
+    """항상 실패하는 유효성 검증"""
+    raise Exception("유효성 검증 오류")
+
+
+@pytest.fixture
+def paid_client():
+    """API 키 검증이 성공하는 유료 API 클라이언트 모킹 (테스트마다 새로 생성)"""
+    client = AsyncMock()
+    client.validate_api_key = _validation_ok
+    return client
+
+
+@pytest.fixture
+def free_client():
+    """연결 검증이 성공하는 무료 API 클라이언트 모킹 (테스트마다 새로 생성)"""
+    client = AsyncMock()
+    client.validate_api_connection = _validation_ok
+    return client
+
+
+@pytest.mark.parametrize("mode,api_type,config,expected_impl,client_fixture", [
+    pytest.param("paid", "image_gen", _CFG_DALLE, "openai", "paid_client", id="image_gen_paid"),
+    pytest.param("free", "image_gen", _CFG_SD, "stable_diffusion", "free_client", id="image_gen_free"),
+    pytest.param("paid", "idea_gen", _CFG_CLAUDE, "anthropic", "paid_client", id="idea_gen_paid"),
+    pytest.param("free", "idea_gen", _CFG_OLLAMA, "ollama", "free_client", id="idea_gen_free"),
+    pytest.param("paid", "code_gen", _CFG_DALLE, "openai", "paid_client", id="code_gen_paid"),
+    pytest.param("free", "code_gen", _CFG_OLLAMA, "ollama", "free_client", id="code_gen_free"),
+    # free 모드로 호출해도 설정의 paid가 우선
+    pytest.param("free", "image_gen", _CFG_OVERRIDE_PAID, "openai", "paid_client", id="config_override"),
+])
+async def test_create_api_client_by_mode(request, mode, api_type, config, expected_impl, client_fixture):
+    """모드와 API 종류에 따라 올바른 API 클라이언트를 생성하는지 테스트"""
+    mock_client = request.getfixturevalue(client_fixture)
+    
     # 모듈 및 클래스 모킹
-    with patch('src.api.api_client.create_api_client') as mock_create_client:
-        # 모킹된 API 클라이언트 설정
-        mock_client = AsyncMock()
-        mock_client.validate_api_connection = AsyncMock(return_value=True)
-        mock_create_client.return_value = mock_client
-        
-        # 테스트 설정
-        config = {
-            "api": {"local_ollama_url": "http://localhost:11434"}
-        }
-        
+    with patch('src.api.api_client.create_api_client', return_value=mock_client) as mock_create_client:
         # 함수 호출
-        client = await create_api_client_by_mode("free", "code_gen", config)
+        client = await create_api_client_by_mode(mode, api_type, config)
         
         # 검증
-        mock_create_client.assert_called_once_with("ollama", config)
-        assert client == mock_client
+        mock_create_client.assert_called_once_with(expected_impl, config)
+        assert client is mock_client
 
 
-@pytest.mark.asyncio
 async def test_create_api_client_by_mode_unknown_type():
     """알 수 없는 API 타입에 대한 처리 테스트"""
     # 테스트 설정
-    config = {}
+    config = _CFG_EMPTY
     
     # 함수 호출
     client = await create_api_client_by_mode("free", "unknown_type", config)
     
     # 검증: 기본 BaseAPIClient 반환 확인
-    from src.api.api_client import BaseAPIClient
     assert isinstance(client, BaseAPIClient)
 
 
-@pytest.mark.asyncio
-async def test_create_api_client_by_mode_config_override():
-    """설정에서 모드 오버라이드 테스트"""
-    # 모듈 및 클래스 모킹
-    with patch('src.api.api_client.create_api_client') as mock_create_client:
-        # 모킹된 API 클라이언트 설정
-        mock_client = AsyncMock()
-        mock_client.validate_api_key = AsyncMock(return_value=True)
-        mock_create_client.return_value = mock_client
-        
-        # 테스트 설정 - 설정에서 paid 모드 지정
-        config = {
-            "api_keys": {"dalle": "test_key"},
-            "api": {"image_gen_mode": "paid"}
-        }
-        
-        # free 모드로 함수 호출해도 설정의 paid가 우선
-        client = await create_api_client_by_mode("free", "image_gen", config)
-        
-        # 검증 - paid API 클라이언트가 생성되어야 함
-        mock_create_client.assert_called_once_with("openai", config)
-        assert client == mock_client
-
-
-@pytest.mark.asyncio
 async def test_create_api_client_by_mode_validation_error():
     """API 유효성 검증 오류 처리 테스트"""
     # 모듈 및 클래스 모킹
@@ -197,13 +102,11 @@ async def test_create_api_client_by_mode_validation_error():
         # 모킹된 API 클라이언트 설정
         mock_client = AsyncMock()
         # 유효성 검증 실패 설정
-        mock_client.validate_api_key = AsyncMock(side_effect=Exception("유효성 검증 오류"))
+        mock_client.validate_api_key = _validation_error
         mock_create_client.return_value = mock_client
         
         # 테스트 설정
-        config = {
-            "api_keys": {"dalle": "test_key"}
-        }
+        config = _CFG_DALLE
         
         # 함수 호출
         client = await create_api_client_by_mode("paid", "image_gen", config)
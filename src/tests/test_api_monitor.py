@@ -180,6 +180,15 @@ async def test_set_and_check_limits(api_monitor):
     assert limit_type == "daily"
 
 
+# 비용 테스트에서 반복 기록하는 호출 정보
+_CHAT_CALL = {
+    "api_name": "openai",
+    "endpoint": "/v1/chat/completions",
+    "success": True,
+    "cost": 0.02
+}
+
+
 @pytest.mark.asyncio
 async def test_set_cost_info(api_monitor):
     """비용 정보 설정 테스트"""
@@ -208,26 +217,22 @@ async def test_set_cost_info(api_monitor):
     
     # 월별 예산 제한 설정 및 확인
     # 예산의 절반 사용
-    for i in range(249):  # 이미 0.02 소비, 추가로 4.98 소비하면 총 5.0
-        await api_monitor.record_api_call(
-            api_name="openai",
-            endpoint="/v1/chat/completions",
-            success=True,
-            cost=0.02
-        )
+    # 이미 0.02 소비, 추가로 4.98 소비하면 총 5.0 (249건을 한 번에 기록)
+    await api_monitor.record_api_calls([_CHAT_CALL] * 249)
     
     # 제한 확인 (예산의 50%는 아직 초과하지 않음)
     exceeded, limit_type = await api_monitor.check_limits("openai")
     assert not exceeded
     
     # 예산 모두 사용
-    for i in range(250):  # 추가로 5.0 소비하면 총 10.0
-        await api_monitor.record_api_call(
-            api_name="openai",
-            endpoint="/v1/chat/completions",
-            success=True,
-            cost=0.02
-        )
+    # 추가로 5.0 소비하면 총 10.0
+    await api_monitor.record_api_calls([_CHAT_CALL] * 250)
+    
+    # 일괄 기록도 호출마다 기록한 것과 같은 통계
+    stats = await api_monitor.get_usage_stats("openai")
+    assert stats["total_calls"] == 500
+    assert stats["success_count"] == 500
+    assert stats["total_cost"] == pytest.approx(10.0)
     
     # 제한 확인 (이제 예산 초과)
     exceeded, limit_type = await api_monitor.check_limits("openai")
@@ -235,6 +240,78 @@ async def test_set_cost_info(api_monitor):
     assert limit_type == "budget"
 
 
+# 단건 기록과 일괄 기록을 비교할 여러 종류의 호출 정보
+_MIXED_CALLS = (
+    [{
+        "api_name": "openai",
+        "endpoint": "/v1/chat/completions",
+        "success": True,
+        "tokens": {"prompt": 10, "completion": 20},
+        "cost": 0.1
+    }] * 20
+    + [{
+        "api_name": "openai",
+        "endpoint": "/v1/embeddings",
+        "success": False,
+        "tokens": {"prompt": 5, "total": 5},
+        "duration": 1.5,
+        "metadata": {"model": "text-embedding-3-small"}
+    }] * 3
+    + [{
+        "api_name": "claude",
+        "endpoint": "/v1/messages",
+        "success": True,
+        "tokens": {"prompt": 7, "completion": 3, "total": 10},
+        "cost": 0.3,
+        "duration": 0.2,
+        "metadata": {"model": "claude-3-haiku"}
+    }, {
+        "api_name": "claude",
+        "endpoint": "/v1/messages",
+        "success": False
+    }]
+)
+
+
+def _approx_floats(value):
+    """중첩된 dict/list 안의 실수 값을 pytest.approx로 감싸서 반환"""
+    if isinstance(value, dict):
+        return {key: _approx_floats(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_approx_floats(item) for item in value]
+    if isinstance(value, float):
+        return pytest.approx(value)
+    return value
+
+
+@pytest.mark.asyncio
+async def test_record_api_calls_matches_record_api_call(temp_monitor_dir):
+    """일괄 기록 결과가 호출마다 기록한 결과와 같은지 테스트"""
+    single_monitor = ApiMonitor(data_dir=temp_monitor_dir, auto_save=False)
+    batch_monitor = ApiMonitor(data_dir=temp_monitor_dir, auto_save=False)
+    
+    # 기록 시각을 고정해서 시간 구간과 last_updated를 맞춤
+    fixed_now = datetime(2024, 5, 1, 12, 30)
+    with patch("src.api.api_monitor.datetime") as mock_datetime:
+        mock_datetime.now.return_value = fixed_now
+        
+        for call in _MIXED_CALLS:
+            await single_monitor.record_api_call(**call)
+        await batch_monitor.record_api_calls(_MIXED_CALLS)
+    
+    # 검증 (비용은 fsum 합산과 반복 덧셈의 오차가 다르므로 근사 비교)
+    assert single_monitor.usage_data.keys() == batch_monitor.usage_data.keys()
+    for api_name, single_data in single_monitor.usage_data.items():
+        assert vars(batch_monitor.usage_data[api_name]) == _approx_floats(vars(single_data))
+    
+    openai_data = batch_monitor.usage_data["openai"]
+    assert openai_data.total_calls == 23
+    assert openai_data.error_count == 3
+    assert openai_data.total_tokens == {"prompt": 215, "completion": 400, "total": 615}
+    assert openai_data.costs["total_cost"] == pytest.approx(2.0)
+    assert openai_data.metadata["last_call"]["model"] == "text-embedding-3-small"
+
+
 @pytest.mark.asyncio
 async def test_clear_usage_data(api_monitor):
     """사용량 데이터 초기화 테스트"""
@@ -0,0 +1,148 @@
+"""
+ExportManager 테스트
+
+이 모듈은 src/export/export_manager.py의 웹사이트 구조 분석, PPTX/PDF 변환 및 여러 형식 내보내기 기능을 테스트합니다.
+"""
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from lxml import etree
+from pptx import Presentation
+
+from src.export.export_manager import ExportManager, export_content, _group_formats_by_target
+
+
+# 테스트 URL별 응답 HTML
+_PAGES = {
+    "https://example.com": b"<html><head><title>Home</title></head><body><h1>Welcome</h1></body></html>",
+    "https://example.com/about": b"<html><head><title>About</title></head><body><h2>About us</h2></body></html>",
+}
+
+
+def _stub_response(url, **kwargs):
+    """_http.get 대신 사용할 스트리밍 응답 (with 문 지원)"""
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.raw.read.return_value = _PAGES[url]
+    return response
+
+
+@pytest.fixture
+def export_manager(tmp_path):
+    """HTTP 요청을 가짜 응답으로 대체한 ExportManager 인스턴스"""
+    manager = ExportManager(output_dir=tmp_path)
+    manager._http.close()
+    manager._http = MagicMock()
+    manager._http.get.side_effect = _stub_response
+    yield manager
+    manager.close()
+
+
+def test_analyze_website_structures(export_manager):
+    """여러 URL 구조 분석 시 중복 URL 제거 및 URL별 결과 테스트"""
+    # 스레드 풀에서 호출되므로 요청 URL을 락으로 보호해서 기록
+    requested = []
+    lock = threading.Lock()
+
+    def record_get(url, **kwargs):
+        with lock:
+            requested.append(url)
+        return _stub_response(url, **kwargs)
+
+    export_manager._http.get.side_effect = record_get
+
+    structures = export_manager._analyze_website_structures([
+        "https://example.com",
+        "https://example.com/about",
+        "https://example.com",
+    ])
+
+    # 검증 (중복 URL은 한 번만 요청하고 입력 순서대로 URL별 결과 반환)
+    assert sorted(requested) == ["https://example.com", "https://example.com/about"]
+    assert list(structures) == ["https://example.com", "https://example.com/about"]
+    assert structures["https://example.com"]["url"] == "https://example.com"
+    assert structures["https://example.com"]["title"] == "Home"
+    assert structures["https://example.com/about"]["title"] == "About"
+    assert structures["https://example.com/about"]["headers"] == [{"level": 2, "text": "About us"}]
+
+
+def test_analyze_website_structures_empty(export_manager):
+    """빈 URL 목록 구조 분석 테스트"""
+    assert export_manager._analyze_website_structures([]) == {}
+    export_manager._http.get.assert_not_called()
+
+
+def test_export_to_pdf_stylesheet_uses_render_font_config(export_manager, tmp_path):
+    """사용자 CSS를 write_pdf에 전달하는 폰트 설정으로 파싱하는지 테스트 (@font-face 등록)"""
+    css_path = tmp_path / "custom.css"
+    css_path.write_text("@font-face { font-family: Custom; src: url(custom.woff2); }", encoding="utf-8")
+
+    with patch("src.export.export_manager.HTML") as mock_html, \
+            patch("src.export.export_manager.CSS") as mock_css:
+        write_pdf = mock_html.return_value.write_pdf
+        write_pdf.return_value = b"%PDF"
+
+        export_manager.export_to_pdf({"title": "t"}, "first", str(css_path), to_bytes=True)
+        export_manager.export_to_pdf({"title": "t"}, "second", str(css_path), to_bytes=True)
+
+    # 검증 (같은 CSS는 한 번만 파싱하고, 파싱한 폰트 설정과 렌더링 폰트 설정이 같음)
+    mock_css.assert_called_once_with(filename=str(css_path), font_config=write_pdf.call_args.kwargs["font_config"])
+    for call in write_pdf.call_args_list:
+        assert call.kwargs["stylesheets"] == [mock_css.return_value]
+        assert call.kwargs["font_config"] is mock_css.call_args.kwargs["font_config"]
+
+
+@pytest.mark.parametrize("formats, options, expected", [
+    (["md", "gdrive", "pdf", "notion"], {}, [["md", "gdrive"], ["pdf"], ["notion"]]),
+    (["md", "pdf", "gdrive"], {"export_format": "pdf"}, [["md"], ["pdf", "gdrive"]]),
+    (["zip", "md", "html"], {"include_formats": ["md"]}, [["zip", "md"], ["html"]]),
+    (["zip", "md", "ai_meta"], {"include_formats": ["md", "ai_meta"]}, [["md"], ["zip", "ai_meta"]]),
+])
+def test_group_formats_by_target(formats, options, expected):
+    """같은 파일을 쓰는 형식끼리 묶는지 테스트"""
+    assert _group_formats_by_target(formats, options) == expected
+
+
+def test_export_content_runs_colliding_formats_serially(tmp_path):
+    """같은 파일을 쓰는 형식은 순서대로, 나머지는 결과를 모두 반환하는지 테스트"""
+    running = set()
+    overlaps = []
+    lock = threading.Lock()
+
+    def fake_export(self, content, format_type, filename="export", **kwargs):
+        target = "pdf" if format_type == "pdf" else "md"
+        with lock:
+            if target in running:
+                overlaps.append(format_type)
+            running.add(target)
+        threading.Event().wait(0.05)
+        with lock:
+            running.discard(target)
+        if format_type == "gdrive":
+            raise RuntimeError("upload failed")
+        return f"{filename}.{format_type}"
+
+    with patch.object(ExportManager, "export_to_format", fake_export):
+        results = export_content({"title": "t"}, ["md", "pdf", "gdrive"], output_dir=tmp_path)
+
+    # 검증 (md와 gdrive는 겹쳐 실행되지 않고, 실패한 형식은 None)
+    assert overlaps == []
+    assert results == {"md": "export.md", "pdf": "export.pdf", "gdrive": None}
+
+
+def test_set_bullets_control_characters(export_manager):
+    """제어 문자가 포함된 텍스트를 python-pptx의 text 설정과 같게 기록하는지 테스트"""
+    lines = ["첫 줄\x0b이어지는 줄", "제어\x01문자", "둘째\n문단"]
+    slide_layout = Presentation().slide_layouts[1]
+
+    # python-pptx text 설정으로 만든 기준 본문
+    expected_placeholder = Presentation().slides.add_slide(slide_layout).placeholders[1]
+    expected_placeholder.text = "\n".join(lines)
+
+    placeholder = Presentation().slides.add_slide(slide_layout).placeholders[1]
+    export_manager._set_bullets(placeholder, lines)
+
+    # 검증 (수직 탭은 줄바꿈, \x01은 _x0001_로 변환되고 XML 구조가 같음)
+    assert placeholder.text_frame.text == "첫 줄\x0b이어지는 줄\n제어_x0001_문자\n둘째\n문단"
+    assert etree.tostring(placeholder.text_frame._txBody) == etree.tostring(expected_placeholder.text_frame._txBody)
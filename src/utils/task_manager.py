@@ -8,11 +8,48 @@ import uuid
 import time
 import os
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, TypedDict
 from pathlib import Path
 
+class TaskStep(TypedDict):
+    """작업 단계 레코드"""
+    name: str
+    status: str
+    message: str
+
+class TaskRecord(TypedDict):
+    """작업 레코드 (라우트/템플릿에서 키로 접근하므로 일반 딕셔너리 사용)"""
+    id: str
+    url: str
+    status: str
+    progress: int
+    message: str
+    result_id: Optional[str]
+    created_at: str
+    updated_at: str
+    steps: List[TaskStep]
+    logs: List[Dict[str, str]]
+    errors: List[Dict[str, str]]
+
+# 분석 단계 이름 (모든 작업이 같은 문자열 객체를 공유)
+TASK_STEP_NAMES = (
+    "페이지 구조 분석",
+    "콘텐츠 추출 및 분류",
+    "메뉴 및 내비게이션 분석",
+    "디자인 요소 추출",
+    "기획서 생성",
+    "목업 이미지 생성",
+    "아이디어 제안 생성",
+)
+
 # 작업 상태 저장소
-tasks: Dict[str, Dict[str, Any]] = {}
+tasks: Dict[str, TaskRecord] = {}
+
+# 작업 추가/삭제 시마다 증가하는 버전 (목록 캐시 무효화용)
+_tasks_version = 0
+
+# 작업 내용이 바뀔 때마다 (상태 변경 포함) 증가하는 리비전 (응답 캐시/ETag 무효화용)
+_tasks_revision = 0
 
 # 작업 만료 시간 (2시간)
 TASK_EXPIRY_SECONDS = 7200
@@ -20,6 +57,30 @@ TASK_EXPIRY_SECONDS = 7200
 # 출력 디렉토리
 output_dir: Path = None
 
+def _mark_changed(membership: bool = False) -> None:
+    """
+    작업 저장소 변경을 기록합니다.
+    
+    Args:
+        membership: 작업이 추가/삭제된 경우 True (목록 버전도 함께 증가)
+    """
+    global _tasks_version, _tasks_revision
+    _tasks_revision += 1
+    if membership:
+        _tasks_version += 1
+
+def _now_iso() -> str:
+    """
+    현재 시각을 ISO 8601 문자열로 반환합니다.
+    
+    작업의 created_at/updated_at은 저장할 때 문자열로 만들어 두어 조회 시 변환이 필요 없게 합니다.
+    마이크로초까지 고정 길이로 기록하므로 문자열 비교가 시각 비교와 같습니다.
+    
+    Returns:
+        str: ISO 8601 형식의 현재 시각
+    """
+    return datetime.now().isoformat(timespec="microseconds")
+
 def init_manager(output_directory: str = None) -> None:
     """
     작업 관리자를 초기화합니다.
@@ -49,6 +110,9 @@ def create_task(url: str) -> str:
     """
     task_id = str(uuid.uuid4())
     
+    now = _now_iso()
+    
+    _mark_changed(membership=True)
     tasks[task_id] = {
         "id": task_id,
         "url": url,
@@ -56,17 +120,9 @@ def create_task(url: str) -> str:
         "progress": 0,
         "message": "분석 요청 처리 중...",
         "result_id": None,
-        "created_at": datetime.now(),
-        "updated_at": datetime.now(),
-        "steps": [
-            {"name": "페이지 구조 분석", "status": "pending", "message": ""},
-            {"name": "콘텐츠 추출 및 분류", "status": "pending", "message": ""},
-            {"name": "메뉴 및 내비게이션 분석", "status": "pending", "message": ""},
-            {"name": "디자인 요소 추출", "status": "pending", "message": ""},
-            {"name": "기획서 생성", "status": "pending", "message": ""},
-            {"name": "목업 이미지 생성", "status": "pending", "message": ""},
-            {"name": "아이디어 제안 생성", "status": "pending", "message": ""}
-        ],
+        "created_at": now,
+        "updated_at": now,
+        "steps": [{"name": name, "status": "pending", "message": ""} for name in TASK_STEP_NAMES],
         "logs": [],
         "errors": []
     }
@@ -102,7 +158,11 @@ def update_task_status(
         return None
     
     task = tasks[task_id]
-    task["updated_at"] = datetime.now()
+    
+    # 수정 시각과 로그/오류 기록 시각에 같은 현재 시각을 한 번만 계산해 사용
+    now = _now_iso()
+    task["updated_at"] = now
+    _mark_changed()
     
     if status:
         task["status"] = status
@@ -113,7 +173,7 @@ def update_task_status(
     if message:
         task["message"] = message
         task["logs"].append({
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now,
             "message": message
         })
     
@@ -122,7 +182,7 @@ def update_task_status(
     
     if error:
         task["errors"].append({
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now,
             "message": error
         })
     
@@ -184,7 +244,8 @@ def update_step_status(
                 task["result_id"] = f"result_{task_id}"
                 
         # 작업 상태 업데이트
-        task["updated_at"] = datetime.now()
+        task["updated_at"] = _now_iso()
+        _mark_changed()
     
     return task
 
@@ -203,7 +264,7 @@ def get_task_status(task_id: str) -> Dict[str, Any]:
     
     return tasks[task_id]
 
-def get_all_tasks() -> Dict[str, Dict[str, Any]]:
+def get_all_tasks() -> Dict[str, TaskRecord]:
     """
     모든 작업 정보를 가져옵니다.
     
@@ -212,6 +273,29 @@ def get_all_tasks() -> Dict[str, Dict[str, Any]]:
     """
     return tasks
 
+def get_tasks_version() -> int:
+    """
+    작업 목록 버전을 가져옵니다.
+    
+    작업이 추가되거나 삭제될 때마다 증가하므로, 버전이 같으면 작업 목록 구성이 바뀌지 않은 것입니다.
+    (개별 작업의 상태 변경은 같은 딕셔너리를 수정하므로 버전에 영향을 주지 않습니다.)
+    
+    Returns:
+        int: 현재 작업 목록 버전
+    """
+    return _tasks_version
+
+def get_tasks_revision() -> int:
+    """
+    작업 저장소 리비전을 가져옵니다.
+    
+    작업 추가/삭제뿐 아니라 상태/진행률 변경 시에도 증가하므로, 리비전이 같으면 모든 작업 내용이 같습니다.
+    
+    Returns:
+        int: 현재 작업 저장소 리비전
+    """
+    return _tasks_revision
+
 def delete_task(task_id: str) -> bool:
     """
     작업을 삭제합니다.
@@ -226,13 +310,34 @@ def delete_task(task_id: str) -> bool:
         return False
     
     del tasks[task_id]
+    _mark_changed(membership=True)
     return True
 
+def delete_tasks_bulk(task_ids: List[str]) -> int:
+    """
+    여러 작업을 한 번에 삭제합니다.
+    
+    Args:
+        task_ids: 삭제할 작업 ID 목록
+        
+    Returns:
+        int: 실제로 삭제된 작업 수
+    """
+    deleted_count = 0
+    for task_id in task_ids:
+        if tasks.pop(task_id, None) is not None:
+            deleted_count += 1
+    
+    # 목록 버전은 삭제 건수와 관계없이 한 번만 증가
+    if deleted_count:
+        _mark_changed(membership=True)
+    return deleted_count
+
 def cleanup_expired_tasks() -> None:
     """
     만료된 작업을 정리합니다.
     """
-    expiry_time = datetime.now() - timedelta(seconds=TASK_EXPIRY_SECONDS)
+    expiry_time = (datetime.now() - timedelta(seconds=TASK_EXPIRY_SECONDS)).isoformat(timespec="microseconds")
     
     expired_task_ids = [
         task_id for task_id, task in tasks.items()
@@ -241,6 +346,8 @@ def cleanup_expired_tasks() -> None:
     
     for task_id in expired_task_ids:
         del tasks[task_id]
+    if expired_task_ids:
+        _mark_changed(membership=True)
 
 def get_active_tasks() -> List[Dict[str, Any]]:
     """